@@ -34,6 +34,7 @@ class InfographicRequest:
         output_format: Output format (pdf, docx, html, md)
         import_file_path: Optional path to CSV/Excel file for statistics
         include_cover_page: Whether to include a cover page
+        preview: Render charts at the low preview resolution
         user_id: ID of requesting user
     """
     title: str
@@ -46,6 +47,7 @@ class InfographicRequest:
     output_format: str = "pdf"
     import_file_path: Optional[str] = None
     include_cover_page: bool = True
+    preview: bool = False
     user_id: Optional[str] = None
 
     def __post_init__(self):
@@ -120,5 +122,6 @@ class InfographicRequest:
             "output_format": self.output_format,
             "import_file_path": self.import_file_path,
             "include_cover_page": self.include_cover_page,
+            "preview": self.preview,
             "user_id": self.user_id
         }
\ No newline at end of file
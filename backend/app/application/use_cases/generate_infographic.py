@@ -5,6 +5,7 @@ Orchestrates the entire infographic document generation workflow.
 
 import uuid
 import asyncio
+from dataclasses import replace
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 from datetime import datetime
@@ -14,9 +15,14 @@ from ...domain.interfaces.text_generator import ITextGenerator
 from ...domain.interfaces.image_generator import IImageGenerator
 from ...domain.interfaces.visualization_engine import IVisualizationEngine
 from ...domain.interfaces.data_importer import IDataImporter
+from ...domain.value_objects.image_asset import ImageAsset, ChartAsset
+from ...domain.value_objects.document_format import DocumentFormat
 from ...infrastructure.ai_providers.prompt_analyzer import PromptAnalyzer, InfographicExtractionResult
 from ...infrastructure.document_renderers.infographic_pdf_renderer import InfographicPDFRenderer
+from ...infrastructure.visualization.chart_planner import ChartPlanner
 from ...shared.logger import get_logger
+from ...shared.concurrency import bounded_gather, provider_semaphore
+from ...shared.stage_graph import Stage, StageGraph
 from ...config import settings
 
 logger = get_logger("generate_infographic")
@@ -75,6 +81,76 @@ Generate professional, well-structured content that:
 Begin generating the content now:
 """
 
+    # System prompt for the compact outline used by sectional generation
+    OUTLINE_GENERATION_PROMPT = """
+You are planning the structure of an infographic document before it is written.
+
+Title: {title}
+Topic: {topic}
+Tone: {tone}
+Number of Sections: {num_sections}
+
+Suggested Sections:
+{section_outlines}
+
+Statistics Available:
+{statistics}
+
+Produce a compact outline with exactly {num_sections} sections, in reading order.
+For each section give a short heading, two to four key points it must cover,
+and the names of the statistics (from the list above) that belong in it.
+The first section introduces the topic and the last section concludes it.
+"""
+
+    # System prompt for generating one section of a sectional document
+    SECTION_GENERATION_PROMPT = """
+You are a professional document writer creating one section of an infographic document.
+
+CRITICAL FORMATTING RULES:
+1. NEVER use bullet points (•, -, *, etc.) for any enumeration
+2. Use ONLY these enumeration styles:
+   - Numbers (1, 2, 3) for main points
+   - Letters (a, b, c) for sub-points
+   - Roman numerals (i, ii, iii) for sub-sub-points
+3. Write in a {tone}, informative tone
+4. Do NOT repeat the section heading and do NOT write other sections
+
+DOCUMENT: {title}
+TOPIC: {topic}
+
+Full Outline (for context):
+{outline}
+
+WRITE SECTION {index} OF {total}: {heading}
+Key points to cover:
+{key_points}
+
+Statistics to incorporate:
+{statistics}
+
+{position_note}
+Target length: approximately {word_budget} words.
+
+Begin the section content now:
+"""
+
+    OUTLINE_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "sections": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "heading": {"type": "string"},
+                        "key_points": {"type": "array", "items": {"type": "string"}},
+                        "statistics": {"type": "array", "items": {"type": "string"}}
+                    }
+                }
+            }
+        }
+    }
+
     def __init__(
         self,
         text_generator: ITextGenerator,
@@ -82,7 +158,8 @@ Begin generating the content now:
         visualization_engine: IVisualizationEngine,
         document_renderer: InfographicPDFRenderer,
         prompt_analyzer: PromptAnalyzer,
-        data_importer: Optional[IDataImporter] = None
+        data_importer: Optional[IDataImporter] = None,
+        chart_planner: Optional[ChartPlanner] = None
     ):
         """
         Initialize the use case with required dependencies.
@@ -94,6 +171,7 @@ Begin generating the content now:
             document_renderer: For rendering the final PDF
             prompt_analyzer: For extracting data from user prompts
             data_importer: Optional importer for CSV/Excel data
+            chart_planner: Groups statistics into charts (default planner if not provided)
         """
         self._text_generator = text_generator
         self._image_generator = image_generator
@@ -101,6 +179,7 @@ Begin generating the content now:
         self._document_renderer = document_renderer
         self._prompt_analyzer = prompt_analyzer
         self._data_importer = data_importer
+        self._chart_planner = chart_planner or ChartPlanner()
 
         self._output_dir = Path(settings.PDF_OUTPUT_DIR)
         self._output_dir.mkdir(parents=True, exist_ok=True)
@@ -136,12 +215,20 @@ Begin generating the content now:
         logger.info(f"  Output Directory: {self._output_dir}")
         logger.info("=" * 70)
 
-    async def execute(self, request: InfographicRequest) -> Path:
+    async def execute(
+        self,
+        request: InfographicRequest,
+        job: Optional[Dict[str, Any]] = None
+    ) -> Path:
         """
         Execute the infographic generation workflow.
 
+        Prompt analysis runs first; text, charts and illustrations then run
+        concurrently, and rendering starts once all three are done.
+
         Args:
             request: InfographicRequest with generation parameters
+            job: Optional job record; receives progress and per-stage timings
 
         Returns:
             Path to the generated PDF file
@@ -153,28 +240,54 @@ Begin generating the content now:
         logger.info(f"Title: {request.title}")
         logger.info(f"Topic: {request.topic[:100]}...")
 
-        try:
-            # Step 1: Analyze prompt and extract structured data
-            logger.info("\n[STEP 1/5] Analyzing prompt and extracting data...")
-            extraction = await self._analyze_prompt(request)
-
-            # Step 2: Generate text content
-            logger.info("\n[STEP 2/5] Generating document text content...")
-            sections = await self._generate_text_content(extraction, request)
-
-            # Step 3: Generate visualizations for statistics
-            logger.info("\n[STEP 3/5] Generating charts and visualizations...")
-            charts = await self._generate_visualizations(extraction, request, job_id)
-
-            # Step 4: Generate illustrations
-            logger.info("\n[STEP 4/5] Generating illustrations...")
-            illustrations = await self._generate_illustrations(extraction, request, job_id)
-
-            # Step 5: Render final PDF
-            logger.info("\n[STEP 5/5] Rendering final PDF document...")
-            output_path = await self._render_document(
-                extraction, sections, charts, illustrations, request, job_id
+        stages = [
+            Stage(
+                name="analyze",
+                run=lambda deps: self._analyze_prompt(request),
+                timeout=settings.STAGE_TIMEOUT_ANALYZE_SECONDS
+            ),
+            Stage(
+                name="text",
+                run=lambda deps: self._generate_text_content(deps["analyze"], request),
+                depends_on=("analyze",),
+                timeout=settings.STAGE_TIMEOUT_TEXT_SECONDS
+            ),
+            Stage(
+                name="charts",
+                run=lambda deps: self._generate_visualizations(deps["analyze"], request),
+                depends_on=("analyze",),
+                timeout=settings.STAGE_TIMEOUT_CHARTS_SECONDS,
+                fallback=list
+            ),
+            Stage(
+                name="illustrations",
+                run=lambda deps: self._generate_illustrations(deps["analyze"], request),
+                depends_on=("analyze",),
+                timeout=settings.STAGE_TIMEOUT_ILLUSTRATIONS_SECONDS,
+                fallback=list
+            ),
+            Stage(
+                name="render",
+                run=lambda deps: self._render_document(
+                    deps["analyze"], deps["text"], deps["charts"], deps["illustrations"],
+                    request, job_id
+                ),
+                depends_on=("analyze", "text", "charts", "illustrations"),
+                timeout=settings.STAGE_TIMEOUT_RENDER_SECONDS
             )
+        ]
+        graph = StageGraph(stages)
+
+        def on_stage_done(name: str, timing: Dict[str, Any]) -> None:
+            logger.info(f"[STAGE {name}] {timing['status']} in {timing['duration']:.2f}s")
+            if job is not None:
+                job.setdefault("stage_timings", {})[name] = timing
+                job["progress"] = int(95 * len(job["stage_timings"]) / len(stages))
+                job["message"] = f"Finished {name}"
+
+        try:
+            results = await graph.run(on_stage_done)
+            output_path = results["render"]
 
             logger.info("=" * 70)
             logger.info(f"INFOGRAPHIC GENERATION COMPLETE - Job ID: {job_id}")
@@ -263,6 +376,9 @@ Begin generating the content now:
         """
         Generate text content for each section using AI.
 
+        Long documents are generated section by section (see
+        _generate_sections_concurrently); short ones use a single call.
+
         Args:
             extraction: Extracted data from prompt analysis
             request: Original request
@@ -270,6 +386,12 @@ Begin generating the content now:
         Returns:
             List of section dictionaries with heading and content
         """
+        if self._use_sectional_generation(extraction):
+            sections = await self._generate_sections_concurrently(extraction)
+            if sections is not None:
+                return sections
+            logger.warning("Most sections failed, retrying as a single generation call")
+
         # Format section outlines
         section_outlines_text = "\n".join([
             f"{i+1}. {outline}"
@@ -314,6 +436,209 @@ Begin generating the content now:
 
         return sections
 
+    def _use_sectional_generation(self, extraction: InfographicExtractionResult) -> bool:
+        """Check whether the document is long enough for sectional generation."""
+        # Template fallbacks are whole documents, so only split for a live model
+        return (
+            settings.SECTIONAL_GENERATION_ENABLED
+            and getattr(self._text_generator, 'is_active', True)
+            and extraction.num_sections > 1
+            and extraction.word_count >= settings.SECTIONAL_GENERATION_MIN_WORDS
+        )
+
+    async def _generate_sections_concurrently(
+        self,
+        extraction: InfographicExtractionResult
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Generate a compact outline, then each section concurrently.
+
+        Every section gets its own word budget and token cap, so long documents
+        are no longer truncated by a single max_tokens limit and total latency
+        is close to that of the slowest section. Failed sections are left out;
+        when half or more fail (e.g. a provider outage) nothing is returned.
+
+        Args:
+            extraction: Extracted data from prompt analysis
+
+        Returns:
+            List of section dictionaries with heading and content, in outline
+            order, or None when most sections failed
+        """
+        outline = await self._generate_outline(extraction)
+        budgets = self._allocate_word_budgets(extraction.word_count, len(outline))
+
+        logger.info(f"Sectional generation: {len(outline)} sections, "
+                    f"concurrency {settings.SECTION_GENERATION_CONCURRENCY}")
+
+        results = await bounded_gather(
+            [
+                lambda i=i: self._generate_section(extraction, outline, i, budgets[i])
+                for i in range(len(outline))
+            ],
+            limit=settings.SECTION_GENERATION_CONCURRENCY,
+            return_exceptions=True
+        )
+
+        sections = []
+        for i, result in enumerate(results):
+            if isinstance(result, Exception) or not result:
+                logger.error(f"Section {i+1} generation failed: {result or 'empty response'}")
+                continue
+            sections.append({
+                'heading': outline[i]['heading'],
+                'content': result
+            })
+
+        if len(sections) * 2 <= len(outline):
+            return None
+
+        total_words = sum(len(s['content'].split()) for s in sections)
+        logger.info(f"Generated {total_words} words across {len(sections)} sections")
+
+        return sections
+
+    async def _generate_outline(
+        self,
+        extraction: InfographicExtractionResult
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate a compact section outline for sectional generation.
+
+        Falls back to the extracted section outlines when the model returns
+        an unusable structure.
+
+        Args:
+            extraction: Extracted data from prompt analysis
+
+        Returns:
+            List of outline entries with heading, key_points and statistics
+        """
+        num_sections = extraction.num_sections
+        section_outlines = list(extraction.section_outlines[:num_sections])
+        while len(section_outlines) < num_sections:
+            section_outlines.append(f"Section {len(section_outlines) + 1}")
+
+        stats_text = "None specified"
+        if extraction.statistics:
+            stats_text = "\n".join([
+                f"- {stat.name}: {stat.value} {stat.unit}"
+                for stat in extraction.statistics
+            ])
+
+        prompt = self.OUTLINE_GENERATION_PROMPT.format(
+            title=extraction.title,
+            topic=extraction.topic,
+            tone=extraction.tone,
+            num_sections=num_sections,
+            section_outlines="\n".join(f"{i+1}. {o}" for i, o in enumerate(section_outlines)),
+            statistics=stats_text
+        )
+
+        try:
+            data = await self._text_generator.generate_structured(
+                prompt=prompt,
+                output_schema=self.OUTLINE_SCHEMA,
+                max_tokens=1000
+            )
+            generated = data.get('sections') or []
+        except Exception as e:
+            logger.warning(f"Outline generation failed, using extracted outline: {e}")
+            generated = []
+
+        outline = []
+        for i in range(num_sections):
+            entry = generated[i] if i < len(generated) and isinstance(generated[i], dict) else {}
+            outline.append({
+                'heading': entry.get('heading') or section_outlines[i],
+                'key_points': [str(p) for p in entry.get('key_points') or []],
+                'statistics': [str(n) for n in entry.get('statistics') or []]
+            })
+
+        return outline
+
+    def _allocate_word_budgets(self, word_count: int, num_sections: int) -> List[int]:
+        """
+        Split the target word count across sections.
+
+        The opening and closing sections get half the weight of body sections.
+
+        Args:
+            word_count: Target word count for the whole document
+            num_sections: Number of sections
+
+        Returns:
+            Word budget per section
+        """
+        weights = [1.0] * num_sections
+        if num_sections >= 3:
+            weights[0] = weights[-1] = 0.5
+
+        total_weight = sum(weights)
+        return [max(80, int(word_count * w / total_weight)) for w in weights]
+
+    async def _generate_section(
+        self,
+        extraction: InfographicExtractionResult,
+        outline: List[Dict[str, Any]],
+        index: int,
+        word_budget: int
+    ) -> str:
+        """
+        Generate the content of a single section.
+
+        Args:
+            extraction: Extracted data from prompt analysis
+            outline: Full document outline
+            index: Index of the section to generate
+            word_budget: Target word count for this section
+
+        Returns:
+            Section body text (without heading)
+        """
+        entry = outline[index]
+        total = len(outline)
+
+        if index == 0:
+            position_note = "This is the opening section: introduce the topic clearly."
+        elif index == total - 1:
+            position_note = "This is the closing section: conclude with a summary of key points."
+        else:
+            position_note = "This is a body section: go into detail and use examples."
+
+        # Statistics assigned to this section by the outline
+        stat_names = {name.lower() for name in entry['statistics']}
+        section_stats = [s for s in extraction.statistics if s.name.lower() in stat_names]
+        stats_text = "\n".join(
+            f"- {stat.name}: {stat.value} {stat.unit}" for stat in section_stats
+        ) or "None for this section"
+
+        prompt = self.SECTION_GENERATION_PROMPT.format(
+            tone=extraction.tone,
+            title=extraction.title,
+            topic=extraction.topic,
+            outline="\n".join(f"{i+1}. {o['heading']}" for i, o in enumerate(outline)),
+            index=index + 1,
+            total=total,
+            heading=entry['heading'],
+            key_points="\n".join(f"{i+1}. {p}" for i, p in enumerate(entry['key_points']))
+                       or "Use your judgement based on the heading",
+            statistics=stats_text,
+            position_note=position_note,
+            word_budget=word_budget
+        )
+
+        logger.info(f"  Generating section {index + 1}/{total}: {entry['heading']} "
+                    f"(~{word_budget} words)")
+
+        content = await self._text_generator.generate(
+            prompt=prompt,
+            max_tokens=min(word_budget * 2, 4000),
+            temperature=0.7
+        )
+
+        return content.strip()
+
     def _parse_content_into_sections(
         self,
         content: str,
@@ -377,141 +702,76 @@ Begin generating the content now:
     async def _generate_visualizations(
         self,
         extraction: InfographicExtractionResult,
-        request: InfographicRequest,
-        job_id: str
-    ) -> List[Path]:
+        request: InfographicRequest
+    ) -> List[ChartAsset]:
         """
         Generate charts and visualizations for statistics.
 
+        The chart planner groups statistics by category and unit into a
+        capped number of charts. Charts are rendered concurrently in memory
+        and handed to the document renderer as assets, nothing is written
+        to disk. Raster charts are sized for the box the renderer places
+        them in at the document's DPI (low DPI for previews).
+
         Args:
             extraction: Extracted data with statistics
-            request: Original request with color scheme
-            job_id: Job identifier for file naming
+            request: Original request with color scheme and preview flag
 
         Returns:
-            List of paths to generated chart images
+            List of rendered charts (images or vector drawings, by engine)
         """
+        # Colors are passed with every call; the engine holds no per-request state
+        colors = tuple(request.color_scheme or ['#1e40af', '#3730a3', '#7c3aed'])
+        document_format = self._document_format(request)
+        placement = self._document_renderer.chart_placement
+        specs = [
+            replace(spec, dpi=document_format.dpi, placement=placement)
+            for spec in self._chart_planner.plan(extraction.statistics, colors)
+        ]
+
+        for spec in specs:
+            logger.info(f"Creating {spec.chart_type} chart: {spec.title}")
+
+        results = await asyncio.gather(
+            *(self._visualization_engine.render_asset(spec) for spec in specs),
+            return_exceptions=True
+        )
+
         charts = []
-        colors = request.color_scheme or ['#1e40af', '#3730a3', '#7c3aed']
-
-        # Set colors on visualization engine if supported
-        if hasattr(self._visualization_engine, 'set_colors'):
-            self._visualization_engine.set_colors(colors)
-
-        chart_dir = self._output_dir / f"charts_{job_id}"
-        chart_dir.mkdir(parents=True, exist_ok=True)
-
-        for i, stat in enumerate(extraction.statistics):
-            try:
-                chart_path = chart_dir / f"chart_{i+1}_{stat.visualization_type}.png"
-
-                logger.info(f"Creating {stat.visualization_type} for: {stat.name}")
-
-                if stat.visualization_type == 'bar_chart':
-                    # Create bar chart with the statistic
-                    data = {stat.name: stat.value}
-                    await self._visualization_engine.create_bar_chart(
-                        data=data,
-                        title=stat.name,
-                        colors=colors,
-                        output_path=chart_path
-                    )
-
-                elif stat.visualization_type == 'pie_chart':
-                    # For pie chart, we need multiple values
-                    # Create a simple split if only one value
-                    remaining = 100 - stat.value if stat.unit == '%' and stat.value <= 100 else stat.value
-                    data = {stat.name: stat.value, 'Other': max(0, remaining)}
-                    await self._visualization_engine.create_pie_chart(
-                        data=data,
-                        title=stat.name,
-                        colors=colors,
-                        output_path=chart_path
-                    )
-
-                elif stat.visualization_type == 'gauge_chart':
-                    max_value = 100 if stat.unit == '%' else stat.value * 1.5
-                    await self._visualization_engine.create_gauge_chart(
-                        value=stat.value,
-                        max_value=max_value,
-                        title=stat.name,
-                        colors=colors,
-                        output_path=chart_path
-                    )
-
-                elif stat.visualization_type == 'line_chart':
-                    # Create simple trend line
-                    import random
-                    base = stat.value
-                    data = {stat.name: [
-                        base * (0.8 + random.random() * 0.2),
-                        base * (0.85 + random.random() * 0.15),
-                        base * (0.9 + random.random() * 0.1),
-                        base * (0.95 + random.random() * 0.1),
-                        base
-                    ]}
-                    await self._visualization_engine.create_line_chart(
-                        data=data,
-                        title=stat.name,
-                        colors=colors,
-                        output_path=chart_path
-                    )
-
-                elif stat.visualization_type == 'number':
-                    # Create number display
-                    if hasattr(self._visualization_engine, 'create_number_display'):
-                        await self._visualization_engine.create_number_display(
-                            value=stat.value,
-                            label=stat.name,
-                            unit=stat.unit,
-                            colors=colors,
-                            output_path=chart_path
-                        )
-                    else:
-                        # Fallback to gauge
-                        await self._visualization_engine.create_gauge_chart(
-                            value=stat.value,
-                            max_value=stat.value * 1.5,
-                            title=stat.name,
-                            colors=colors,
-                            output_path=chart_path
-                        )
-
-                if chart_path.exists():
-                    charts.append(chart_path)
-                    logger.info(f"  Chart saved: {chart_path.name}")
-
-            except Exception as e:
-                logger.error(f"Failed to create chart for {stat.name}: {e}")
+        for spec, result in zip(specs, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to create chart {spec.title}: {result}")
                 continue
+            charts.append(result)
+            logger.info(f"  Chart rendered: {result.width:.0f}x{result.height:.0f}")
 
-        logger.info(f"Generated {len(charts)} charts")
+        logger.info(f"Generated {len(charts)} charts for {len(extraction.statistics)} statistics")
         return charts
 
+    @staticmethod
+    def _document_format(request: InfographicRequest) -> DocumentFormat:
+        """Output format for the request; previews use the low preview DPI."""
+        dpi = settings.PDF_PREVIEW_DPI if request.preview else settings.PDF_DPI
+        return DocumentFormat.pdf(dpi=dpi)
+
     async def _generate_illustrations(
         self,
         extraction: InfographicExtractionResult,
-        request: InfographicRequest,
-        job_id: str
-    ) -> List[Path]:
+        request: InfographicRequest
+    ) -> List[ImageAsset]:
         """
         Generate illustrations for document sections.
 
         Args:
             extraction: Extracted data with image prompts
             request: Original request
-            job_id: Job identifier for file naming
 
         Returns:
-            List of paths to generated illustration images
+            List of generated illustration images
         """
-        illustrations = []
         num_images = request.num_images or len(extraction.image_prompts)
         num_images = min(num_images, 4)  # Max 4 images
 
-        image_dir = self._output_dir / f"illustrations_{job_id}"
-        image_dir.mkdir(parents=True, exist_ok=True)
-
         # Get image prompts
         prompts = extraction.image_prompts[:num_images]
 
@@ -522,39 +782,79 @@ Begin generating the content now:
                 f"clean modern design, suitable for business document"
             )
 
-        # Generate images
+        # Generate images concurrently; each slot resolves to an image or a placeholder
         logger.info(f"Generating {len(prompts)} illustrations...")
 
-        for i, prompt in enumerate(prompts):
-            try:
-                image_path = image_dir / f"illustration_{i+1}.png"
+        results = await asyncio.gather(*(
+            self._generate_illustration(prompt, i + 1)
+            for i, prompt in enumerate(prompts)
+        ))
+        illustrations = [image for image in results if image is not None]
+
+        logger.info(f"Generated {len(illustrations)} illustrations")
+        return illustrations
+
+    async def _generate_illustration(self, prompt: str, number: int) -> Optional[ImageAsset]:
+        """
+        Generate one illustration under the provider semaphore and deadline.
 
-                logger.info(f"  Generating illustration {i+1}: {prompt[:50]}...")
+        The deadline covers both waiting for a provider slot and the
+        generation itself; the image generator is given the same budget,
+        so it normally gives up (and records the failure) before the
+        deadline cancels it. Failed or late images are replaced by the
+        generator's placeholder.
 
-                await self._image_generator.generate_to_file(
+        Args:
+            prompt: Image prompt
+            number: Illustration number (for logging)
+
+        Returns:
+            The generated image, or None if no image could be produced
+        """
+        provider = getattr(self._image_generator, 'provider_name', self._image_generator.model_name)
+        semaphore = provider_semaphore(f"image:{provider}", settings.IMAGE_GENERATION_CONCURRENCY)
+
+        async def generate() -> ImageAsset:
+            async with semaphore:
+                logger.info(f"  Generating illustration {number}: {prompt[:50]}...")
+                return await self._image_generator.generate_asset(
                     prompt=prompt,
-                    output_path=image_path,
                     width=768,
                     height=512
                 )
 
-                if image_path.exists():
-                    illustrations.append(image_path)
-                    logger.info(f"  Saved: {image_path.name}")
+        try:
+            image = await asyncio.wait_for(generate(), timeout=settings.ILLUSTRATION_DEADLINE_SECONDS)
+            logger.info(f"  Illustration {number}: {image.width}x{image.height}, {image.size_bytes} bytes")
+            return image
+        except asyncio.TimeoutError:
+            logger.warning(f"Illustration {number} missed its "
+                           f"{settings.ILLUSTRATION_DEADLINE_SECONDS}s deadline, using placeholder")
+        except Exception as e:
+            logger.error(f"Failed to generate illustration {number}: {e}")
 
-            except Exception as e:
-                logger.error(f"Failed to generate illustration {i+1}: {e}")
-                continue
+        return self._placeholder(prompt)
 
-        logger.info(f"Generated {len(illustrations)} illustrations")
-        return illustrations
+    def _placeholder(self, prompt: str) -> Optional[ImageAsset]:
+        """Create the image generator's placeholder in place of a missing illustration."""
+        create_placeholder = getattr(self._image_generator, 'generate_placeholder', None)
+        if not create_placeholder:
+            return None
+        try:
+            image_bytes = create_placeholder(prompt, 768, 512)
+            if not image_bytes:
+                return None
+            return ImageAsset.from_bytes(image_bytes, name=prompt[:50])
+        except Exception as e:
+            logger.error(f"Failed to create placeholder illustration: {e}")
+            return None
 
     async def _render_document(
         self,
         extraction: InfographicExtractionResult,
         sections: List[Dict[str, Any]],
-        charts: List[Path],
-        illustrations: List[Path],
+        charts: List[ChartAsset],
+        illustrations: List[ImageAsset],
         request: InfographicRequest,
         job_id: str
     ) -> Path:
@@ -564,8 +864,8 @@ Begin generating the content now:
         Args:
             extraction: Extracted data
             sections: Generated text sections
-            charts: Paths to chart images
-            illustrations: Paths to illustration images
+            charts: Rendered charts
+            illustrations: Illustration images
             request: Original request
             job_id: Job identifier
 
@@ -578,9 +878,10 @@ Begin generating the content now:
         output_filename = f"infographic_{job_id}_{safe_title}.pdf"
         output_path = self._output_dir / output_filename
 
-        # Set colors on renderer
+        # Per-request colors on a copy; the shared renderer stays unchanged
+        renderer = self._document_renderer
         if request.color_scheme:
-            self._document_renderer.set_colors(request.color_scheme)
+            renderer = renderer.with_colors(request.color_scheme)
 
         # Prepare metadata
         metadata = {
@@ -599,7 +900,7 @@ Begin generating the content now:
         # Render PDF
         logger.info(f"Rendering PDF: {output_filename}")
 
-        await self._document_renderer.render(
+        await renderer.render(
             title=extraction.title,
             sections=sections,
             charts=charts,
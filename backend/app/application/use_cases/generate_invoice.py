@@ -3,9 +3,10 @@ Invoice Generation Use Case.
 Orchestrates the generation of invoice documents.
 """
 
-from typing import Optional
+from typing import Awaitable, Optional
 from pathlib import Path
 from decimal import Decimal
+import asyncio
 import logging
 
 from ..dto.invoice_request import InvoiceRequest
@@ -20,6 +21,7 @@ from ...domain.entities.document import Document, DocumentType
 from ...domain.entities.invoice import Invoice, LineItem
 from ...domain.entities.generation_job import GenerationJob
 from ...domain.exceptions import GenerationException, ValidationException
+from ...config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -115,15 +117,25 @@ class GenerateInvoiceUseCase:
                     tax_rate=Decimal(str(item.tax_rate))
                 )
 
-            # Generate AI content if requested
-            payment_terms = request.custom_terms
-            notes = request.custom_notes
-
+            # Failed AI terms fall back to custom terms, then the invoice default
             if request.ai_generate_terms:
-                payment_terms = await self._generate_payment_terms(invoice)
-
-            if request.ai_generate_notes:
-                notes = await self._generate_invoice_notes(invoice)
+                terms_fallback = request.custom_terms or invoice.payment_terms
+            else:
+                terms_fallback = request.custom_terms
+
+            # Generate AI content if requested (both calls run concurrently)
+            payment_terms, notes = await asyncio.gather(
+                self._enrich(
+                    "payment terms",
+                    self._generate_payment_terms(invoice) if request.ai_generate_terms else None,
+                    fallback=terms_fallback
+                ),
+                self._enrich(
+                    "invoice notes",
+                    self._generate_invoice_notes(invoice) if request.ai_generate_notes else None,
+                    fallback=request.custom_notes
+                )
+            )
 
             # Set terms and notes
             invoice.payment_terms = payment_terms
@@ -194,6 +206,38 @@ class GenerateInvoiceUseCase:
 
             raise GenerationException(f"Invoice generation failed: {str(e)}")
 
+    async def _enrich(
+        self,
+        label: str,
+        generation: Optional[Awaitable[str]],
+        fallback: Optional[str]
+    ) -> Optional[str]:
+        """
+        Await an AI text generation with a timeout.
+
+        Args:
+            label: Field name used in log messages
+            generation: Pending generation (None when AI is not requested)
+            fallback: User-supplied or default text used on timeout or error
+
+        Returns:
+            Generated text, or the fallback
+        """
+        if generation is None:
+            return fallback
+        try:
+            text = await asyncio.wait_for(
+                generation, timeout=settings.INVOICE_ENRICHMENT_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"AI {label} timed out after "
+                           f"{settings.INVOICE_ENRICHMENT_TIMEOUT_SECONDS}s, using fallback")
+            return fallback
+        except Exception as e:
+            logger.warning(f"AI {label} generation failed, using fallback: {e}")
+            return fallback
+        return text.strip() if text and text.strip() else fallback
+
     async def _generate_payment_terms(self, invoice: Invoice) -> str:
         """Generate payment terms using AI."""
         prompt = f"""
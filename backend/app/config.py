@@ -13,6 +13,41 @@ class Settings(BaseSettings):
     MONGODB_URL: str = ""
     MONGODB_DB_NAME: str = "docgen"
     DISABLE_MONGODB: bool = False
+    GRIDFS_CHUNK_BYTES: int = 261120  # Upload chunk size (255KB, the GridFS default)
+    GRIDFS_WRITE_TIMEOUT_SECONDS: float = 60.0  # Max wait for one streamed chunk write
+    MONGODB_ENSURE_INDEXES: bool = True  # Create registered indexes at startup
+
+    # Shared MongoDB client pool (one per worker process)
+    MONGODB_MAX_POOL_SIZE: int = 20
+    MONGODB_MIN_POOL_SIZE: int = 2
+    MONGODB_MAX_IDLE_TIME_MS: int = 60000
+    MONGODB_MAX_CONNECTING: int = 2  # Connections established concurrently per pool
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = 30000
+    MONGODB_COMPRESSORS: str = "zstd,snappy,zlib"  # Uninstalled compressors are skipped
+    MONGODB_ANALYTICS_READ_PREFERENCE: str = "secondaryPreferred"  # Dashboards and reports
+
+    # Completed generation jobs cached per worker for status polls and downloads
+    JOB_CACHE_TTL_SECONDS: int = 300
+    JOB_CACHE_MAX_ENTRIES: int = 10000
+
+    # Write-behind of new generation jobs (batched insert_many off the request path)
+    JOB_WRITE_BEHIND_ENABLED: bool = True
+    JOB_WRITE_QUEUE_MAX: int = 1000  # Requests wait for room beyond this many queued jobs
+    JOB_WRITE_BATCH: int = 100
+    JOB_WRITE_FLUSH_INTERVAL_SECONDS: float = 0.2  # Longest a queued job waits for its batch to fill
+    JOB_WRITE_RETRY_MAX_DELAY_SECONDS: float = 30.0
+    JOB_WRITE_REJECT_ATTEMPTS: int = 3  # Jobs the server rejects are dropped after this many tries
+    JOB_WRITE_SHUTDOWN_TIMEOUT_SECONDS: float = 10.0
+
+    # Uploaded logos: normalized once per distinct file (SHA-256) and shared
+    LOGO_MAX_WIDTH_PX: int = 600  # 2 x 1 inch invoice header box at 300 DPI
+    LOGO_MAX_HEIGHT_PX: int = 300
+    LOGO_CACHE_MAX_ENTRIES: int = 128
+
+    # Recently generated PDFs on local disk (shared by workers), ahead of GridFS
+    PDF_CACHE_ENABLED: bool = True
+    PDF_CACHE_DIR: str = "./cache/pdfs"
+    PDF_CACHE_MAX_BYTES: int = 1073741824  # 1GB
 
     # Hugging Face
     HUGGINGFACE_API_KEY: str = ""
@@ -23,6 +58,66 @@ class Settings(BaseSettings):
     GEMINI_API_KEY: str = ""
     GEMINI_MODEL: str = "models/gemini-2.0-flash"
 
+    # Sectional text generation (outline first, then sections in parallel)
+    SECTIONAL_GENERATION_ENABLED: bool = True
+    SECTIONAL_GENERATION_MIN_WORDS: int = 800  # Shorter documents use a single call
+    SECTION_GENERATION_CONCURRENCY: int = 4
+
+    # Text provider routing (hedged requests between Gemini and HuggingFace)
+    TEXT_HEDGE_DELAY_SECONDS: float = 8.0  # Used until a provider has enough samples for a p95
+    TEXT_HEDGE_MIN_SAMPLES: int = 20
+    TEXT_PROVIDER_STATS_WINDOW: int = 200
+
+    # Image model circuit breakers (state shared across workers via a file)
+    PROVIDER_STATE_DIR: str = "./provider_state"
+    IMAGE_BREAKER_FAILURE_THRESHOLD: int = 2  # Consecutive failures before a model is skipped
+    IMAGE_BREAKER_COOLDOWN_SECONDS: int = 300  # Doubles after each failed probe
+    IMAGE_BREAKER_MAX_COOLDOWN_SECONDS: int = 3600
+    IMAGE_PROBE_TIMEOUT_SECONDS: int = 30  # Timeout for half-open probe requests
+
+    # Illustration generation
+    IMAGE_GENERATION_CONCURRENCY: int = 2  # Concurrent calls per image provider (process-wide)
+    ILLUSTRATION_DEADLINE_SECONDS: int = 90  # Late illustrations are replaced by placeholders
+
+    # Content-addressed illustration cache (shared by workers on the same disk)
+    ILLUSTRATION_CACHE_ENABLED: bool = True
+    ILLUSTRATION_CACHE_DIR: str = "./cache/illustrations"
+    ILLUSTRATION_CACHE_MAX_BYTES: int = 536870912  # 512MB
+
+    # Infographic pipeline stage timeouts (charts and illustrations fall back to none)
+    STAGE_TIMEOUT_ANALYZE_SECONDS: int = 90
+    STAGE_TIMEOUT_TEXT_SECONDS: int = 300
+    STAGE_TIMEOUT_CHARTS_SECONDS: int = 120
+    STAGE_TIMEOUT_ILLUSTRATIONS_SECONDS: int = 120
+    STAGE_TIMEOUT_RENDER_SECONDS: int = 120
+
+    # Invoice AI enrichment (terms and notes fall back to user/default text)
+    INVOICE_ENRICHMENT_TIMEOUT_SECONDS: int = 15
+
+    # Pooled HTTP sessions for AI provider APIs
+    HTTP_POOL_LIMIT: int = 100
+    HTTP_POOL_LIMIT_PER_HOST: int = 16
+    HTTP_KEEPALIVE_SECONDS: int = 60
+    HTTP_DNS_CACHE_SECONDS: int = 300
+
+    # Chart planning: statistics are grouped by category and unit into few charts
+    MAX_CHARTS_PER_DOCUMENT: int = 8
+    MAX_CHART_CATEGORIES: int = 12  # Bars, slices or line points per chart
+    MAX_CHART_SERIES: int = 8  # Lines per line chart
+
+    # Chart engine for infographics: "matplotlib" (raster) or "reportlab" (vector)
+    CHART_ENGINE: str = "matplotlib"
+
+    # Chart rendering (process pool running the matplotlib Figure API)
+    CHART_RENDER_POOL_ENABLED: bool = True
+    CHART_RENDER_PROCESSES: int = 2  # Per web worker process; 0 = one per CPU core
+
+    # Rendered chart cache keyed by chart spec (memory per worker, disk shared)
+    CHART_CACHE_MEMORY_BYTES: int = 67108864  # 64MB
+    CHART_CACHE_DISK_ENABLED: bool = True
+    CHART_CACHE_DIR: str = "./cache/charts"
+    CHART_CACHE_DISK_MAX_BYTES: int = 268435456  # 256MB
+
     # File Storage
     UPLOAD_DIR: str = "./uploads"
     MAX_UPLOAD_SIZE: int = 5242880  # 5MB
@@ -31,6 +126,22 @@ class Settings(BaseSettings):
     # PDF Generation
     PDF_OUTPUT_DIR: str = "./generated_pdfs"
     PDF_DPI: int = 300
+    PDF_PREVIEW_DPI: int = 72  # Chart resolution for preview documents
+    STYLE_REGISTRY_MAX_ENTRIES: int = 64  # Compiled stylesheets (document type and colors)
+
+    # Retention of generated artifacts (0 days = keep forever). Documents are kept
+    # by default; set days only after checking a dry run at GET /admin/retention
+    RETENTION_ENABLED: bool = True
+    RETENTION_DRY_RUN: bool = False  # Report what the sweeper would delete without deleting
+    RETENTION_SWEEP_INTERVAL_SECONDS: int = 3600
+    RETENTION_SWEEP_BATCH: int = 500  # Expired jobs and files removed per collection per sweep
+    RETENTION_INVOICE_DAYS: int = 0
+    RETENTION_FORMAL_DAYS: int = 0
+    RETENTION_INFOGRAPHIC_DAYS: int = 0
+    RETENTION_TEMP_HOURS: int = 24  # Chart/illustration directories and /tmp invoice renders
+    RETENTION_TTL_GRACE_SECONDS: int = 86400  # Job TTL index backstop after expire_at
+    # Also expire jobs and logo copies stored before expiry tracking existed (by age)
+    RETENTION_LEGACY_CLEANUP: bool = False
 
     # API Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 10
@@ -7,6 +7,8 @@ from abc import ABC, abstractmethod
 from typing import Optional, List
 from pathlib import Path
 
+from ..value_objects.image_asset import ImageAsset
+
 
 class IImageGenerator(ABC):
     """
@@ -78,6 +80,28 @@ class IImageGenerator(ABC):
         """
         pass
 
+    async def generate_asset(
+        self,
+        prompt: str,
+        width: int = 512,
+        height: int = 512
+    ) -> ImageAsset:
+        """
+        Generate image in memory.
+
+        Args:
+            prompt: Text description of the image
+            width: Image width in pixels
+            height: Image height in pixels
+
+        Returns:
+            Generated image with its actual pixel dimensions
+
+        Raises:
+            ValueError: If the provider returned no readable image
+        """
+        return ImageAsset.from_bytes(await self.generate(prompt, width, height), name=prompt[:50])
+
     @property
     @abstractmethod
     def model_name(self) -> str:
@@ -7,11 +7,14 @@ from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+from ..value_objects.chart_spec import ChartSpec
+from ..value_objects.image_asset import ChartAsset
+
 
 class IVisualizationEngine(ABC):
     """
     Interface for chart/graph generation.
-    Implementations: Matplotlib, Plotly, Chart.js backend
+    Implementations: Matplotlib, ReportLab graphics, Plotly, Chart.js backend
     """
 
     @abstractmethod
@@ -102,4 +105,18 @@ class IVisualizationEngine(ABC):
         Returns:
             Path to the saved chart
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def render_asset(self, spec: ChartSpec) -> ChartAsset:
+        """
+        Render a chart in memory.
+
+        Args:
+            spec: Chart specification
+
+        Returns:
+            Rendered chart: an ImageAsset with its pixel dimensions, or a
+            VectorAsset for engines producing vector drawings
+        """
+        pass
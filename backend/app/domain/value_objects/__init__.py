@@ -7,6 +7,8 @@ from .document_format import DocumentFormat, OutputFormat
 from .watermark_config import WatermarkConfig, WatermarkPosition, WatermarkType
 from .design_spec import DesignSpec
 from .statistic import Statistic
+from .chart_spec import ChartSpec
+from .image_asset import ImageAsset, VectorAsset, ChartAsset
 
 __all__ = [
     "DocumentFormat",
@@ -15,5 +17,9 @@ __all__ = [
     "WatermarkPosition",
     "WatermarkType",
     "DesignSpec",
-    "Statistic"
+    "Statistic",
+    "ChartSpec",
+    "ImageAsset",
+    "VectorAsset",
+    "ChartAsset"
 ]
\ No newline at end of file
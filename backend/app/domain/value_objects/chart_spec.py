@@ -0,0 +1,102 @@
+"""
+Chart Specification Value Object.
+Describes a chart completely, independent of the rendering engine.
+"""
+
+import json
+import math
+import hashlib
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, Optional, Tuple
+
+
+CHART_TYPES = ("bar", "line", "pie", "gauge", "number")
+IMAGE_FORMATS = ("png", "svg")
+
+# Raster resolution bounds
+MIN_DPI = 10
+MAX_DPI = 600
+
+# Largest placement side in inches (a tabloid page)
+MAX_PLACEMENT_INCHES = 17.0
+
+
+def valid_placement(placement: Any) -> bool:
+    """Whether a placement is a (width, height) pair of finite sizes within a page."""
+    return len(placement) == 2 and all(
+        isinstance(side, (int, float)) and not isinstance(side, bool)
+        and math.isfinite(side) and 0 < side <= MAX_PLACEMENT_INCHES
+        for side in placement
+    )
+
+
+@dataclass(frozen=True)
+class ChartSpec:
+    """
+    Immutable value object representing one chart.
+
+    Two specs with equal fields always render to the same image, so
+    content_hash() can key caches and HTTP ETags.
+
+    Attributes:
+        chart_type: One of bar, line, pie, gauge, number
+        data: Chart inputs for the type:
+            bar/pie: {"values": {label: value}}
+            line: {"series": {name: [values]}, "labels": [x labels] (optional)}
+            gauge: {"value": v, "max_value": m}
+            number: {"value": v, "unit": u}
+        title: Chart title (the label for number displays)
+        colors: Hex color codes (empty for the engine's defaults)
+        style: Overrides of the engine's chart style fields
+        dpi: Raster resolution (None for the style's default)
+        image_format: Output format (png or svg)
+        placement: Box the chart is fitted into on the page, as (width,
+            height) in inches; the raster then has dpi pixels per inch at
+            its placed size (None renders at the figure's own size)
+    """
+    chart_type: str
+    data: Dict[str, Any]
+    title: str = ""
+    colors: Tuple[str, ...] = ()
+    style: Dict[str, Any] = field(default_factory=dict)
+    dpi: Optional[int] = None
+    image_format: str = "png"
+    placement: Optional[Tuple[float, float]] = None
+
+    def __post_init__(self):
+        """Validate chart specification."""
+        if self.chart_type not in CHART_TYPES:
+            raise ValueError(f"Invalid chart type: {self.chart_type}")
+
+        if self.image_format not in IMAGE_FORMATS:
+            raise ValueError(f"Invalid image format: {self.image_format}")
+
+        for color in self.colors:
+            if not color.startswith("#") or len(color) != 7:
+                raise ValueError(f"Invalid hex color code: {color}")
+
+        if self.dpi is not None and not MIN_DPI <= self.dpi <= MAX_DPI:
+            raise ValueError(f"DPI must be between {MIN_DPI} and {MAX_DPI}")
+
+        if self.placement is not None and not valid_placement(self.placement):
+            raise ValueError(
+                f"Invalid placement: {self.placement} "
+                f"(width and height must be between 0 and {MAX_PLACEMENT_INCHES:g} inches)"
+            )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation."""
+        result = asdict(self)
+        result["colors"] = list(self.colors)
+        result["placement"] = list(self.placement) if self.placement else None
+        return result
+
+    def content_hash(self) -> str:
+        """
+        Stable hash of the specification.
+
+        Returns:
+            SHA-256 hex digest of the canonical JSON encoding
+        """
+        canonical = json.dumps(self.to_dict(), sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
@@ -0,0 +1,166 @@
+"""
+Image Asset Value Objects.
+In-memory images handed from generators to document renderers.
+"""
+
+import struct
+from dataclasses import dataclass, field
+from typing import Any, Tuple, Union
+
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+JPEG_SIGNATURE = b"\xff\xd8"
+GIF_SIGNATURES = (b"GIF87a", b"GIF89a")
+
+# JPEG start-of-frame markers carrying the image size
+_JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+@dataclass(frozen=True)
+class ImageAsset:
+    """
+    Immutable value object representing an encoded image in memory.
+
+    Carries the pixel dimensions with the bytes, so renderers can lay the
+    image out without decoding it or reading it from disk.
+
+    Attributes:
+        data: Encoded image bytes
+        width: Width in pixels
+        height: Height in pixels
+        media_type: MIME type of the encoding
+        name: Descriptive name (for logs and captions)
+    """
+    data: bytes = field(repr=False)
+    width: int
+    height: int
+    media_type: str = "image/png"
+    name: str = ""
+
+    def __post_init__(self):
+        """Validate image asset."""
+        if not self.data:
+            raise ValueError("Image data cannot be empty")
+
+        if self.width <= 0 or self.height <= 0:
+            raise ValueError(f"Invalid image size: {self.width}x{self.height}")
+
+    @classmethod
+    def from_bytes(cls, data: bytes, name: str = "") -> "ImageAsset":
+        """
+        Create an asset from PNG, JPEG, WebP or GIF bytes.
+
+        The size is read from the image header, the pixels are not decoded.
+
+        Args:
+            data: Encoded image bytes
+            name: Descriptive name
+
+        Returns:
+            ImageAsset with dimensions and media type filled in
+
+        Raises:
+            ValueError: If the data is not a readable image in a supported format
+        """
+        if data.startswith(PNG_SIGNATURE) and len(data) >= 24:
+            width, height = struct.unpack(">II", data[16:24])
+            return cls(data, width, height, "image/png", name)
+
+        if data.startswith(JPEG_SIGNATURE):
+            width, height = _jpeg_size(data)
+            return cls(data, width, height, "image/jpeg", name)
+
+        if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+            width, height = _webp_size(data)
+            return cls(data, width, height, "image/webp", name)
+
+        if data[:6] in GIF_SIGNATURES and len(data) >= 10:
+            width, height = struct.unpack("<HH", data[6:10])
+            return cls(data, width, height, "image/gif", name)
+
+        raise ValueError("Unsupported image data (expected PNG, JPEG, WebP or GIF)")
+
+    @property
+    def aspect_ratio(self) -> float:
+        """Width divided by height."""
+        return self.width / self.height
+
+    @property
+    def size_bytes(self) -> int:
+        """Size of the encoded image."""
+        return len(self.data)
+
+
+
+@dataclass(frozen=True)
+class VectorAsset:
+    """
+    Immutable value object representing a vector drawing in memory.
+
+    The drawing is an object native to one document toolkit (named by
+    kind), embedded by renderers that understand it without rasterizing.
+
+    Attributes:
+        drawing: Toolkit-specific drawing object
+        width: Natural width in points
+        height: Natural height in points
+        kind: Toolkit producing the drawing (e.g. "reportlab")
+        name: Descriptive name (for logs and captions)
+    """
+    drawing: Any = field(repr=False, compare=False)
+    width: float
+    height: float
+    kind: str = "reportlab"
+    name: str = ""
+
+    def __post_init__(self):
+        """Validate vector asset."""
+        if self.drawing is None:
+            raise ValueError("Drawing cannot be empty")
+
+        if self.width <= 0 or self.height <= 0:
+            raise ValueError(f"Invalid drawing size: {self.width}x{self.height}")
+
+    @property
+    def aspect_ratio(self) -> float:
+        """Width divided by height."""
+        return self.width / self.height
+
+
+# A rendered chart: raster image bytes or a vector drawing
+ChartAsset = Union[ImageAsset, VectorAsset]
+
+
+def _jpeg_size(data: bytes) -> Tuple[int, int]:
+    """Read the size from a JPEG's start-of-frame segment."""
+    offset = 2
+    while offset + 4 <= len(data):
+        if data[offset] != 0xFF:
+            raise ValueError("Corrupt JPEG data")
+        marker = data[offset + 1]
+        # Fill bytes and standalone markers carry no length
+        if marker == 0xFF or 0xD0 <= marker <= 0xD9 or marker == 0x01:
+            offset += 1 if marker == 0xFF else 2
+            continue
+        (length,) = struct.unpack(">H", data[offset + 2:offset + 4])
+        if marker in _JPEG_SOF_MARKERS and offset + 9 <= len(data):
+            height, width = struct.unpack(">HH", data[offset + 5:offset + 9])
+            return width, height
+        offset += 2 + length
+    raise ValueError("JPEG size not found")
+
+
+def _webp_size(data: bytes) -> Tuple[int, int]:
+    """Read the size from a WebP's first chunk."""
+    chunk = data[12:16]
+    if chunk == b"VP8X" and len(data) >= 30:
+        width = int.from_bytes(data[24:27], "little") + 1
+        height = int.from_bytes(data[27:30], "little") + 1
+        return width, height
+    if chunk == b"VP8 " and len(data) >= 30:
+        width, height = struct.unpack("<HH", data[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L" and len(data) >= 25:
+        (bits,) = struct.unpack("<I", data[21:25])
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    raise ValueError("WebP size not found")
@@ -4,12 +4,19 @@ Contains implementations of text and image generation interfaces.
 """
 
 from .gemini_text_generator import GeminiTextGenerator
+from .routing_text_generator import RoutingTextGenerator, get_routing_text_generator
+from .coalescing import CoalescingTextGenerator, CoalescingImageGenerator, get_shared_text_generator
 from .banana_image_generator import BananaImageGenerator
 from .prompt_analyzer import PromptAnalyzer, InfographicExtractionResult, StatisticExtraction
 from .base_image_generator import BaseImageGenerator
 
 __all__ = [
     "GeminiTextGenerator",
+    "RoutingTextGenerator",
+    "get_routing_text_generator",
+    "CoalescingTextGenerator",
+    "CoalescingImageGenerator",
+    "get_shared_text_generator",
     "BananaImageGenerator",
     "BaseImageGenerator",
     "PromptAnalyzer",
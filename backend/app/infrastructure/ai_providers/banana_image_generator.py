@@ -5,6 +5,7 @@ Implements IImageGenerator interface using HuggingFace Inference API.
 
 import os
 import io
+import time
 import asyncio
 from typing import Optional, List
 from pathlib import Path
@@ -19,6 +20,9 @@ except ImportError:
 from PIL import Image
 
 from .base_image_generator import BaseImageGenerator
+from .model_health import ModelHealthRegistry, CircuitState, get_model_health_registry
+from .http_sessions import get_http_session
+from ..storage.disk_cache import DiskLRUCache, content_key, get_illustration_cache
 from ...shared.logger import get_logger
 
 logger = get_logger("banana_image_generator")
@@ -33,6 +37,8 @@ class BananaImageGenerator(BaseImageGenerator):
     - Async image generation
     - Batch processing support
     - Automatic retry logic
+    - Per-model circuit breakers shared across workers
+    - Content-addressed disk cache of generated images
     - Fallback placeholder generation
     - Comprehensive logging
     """
@@ -47,11 +53,21 @@ class BananaImageGenerator(BaseImageGenerator):
         "CompVis/stable-diffusion-v1-4"
     ]
 
+    # Inference parameters sent with every request (part of the cache key)
+    INFERENCE_PARAMETERS = {
+        "num_inference_steps": 25,  # Balance between quality and speed
+        "guidance_scale": 7.5
+    }
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         model: Optional[str] = None,
-        timeout: int = 120
+        timeout: int = 120,
+        probe_timeout: int = 30,
+        deadline: Optional[float] = None,
+        health_registry: Optional[ModelHealthRegistry] = None,
+        cache: Optional[DiskLRUCache] = None
     ):
         """
         Initialize the Banana/HuggingFace image generator.
@@ -60,10 +76,19 @@ class BananaImageGenerator(BaseImageGenerator):
             api_key: HuggingFace API key (falls back to environment variable)
             model: Model identifier (defaults to FLUX.1-schnell)
             timeout: Request timeout in seconds
+            probe_timeout: Timeout for half-open probes of a recovering model
+            deadline: Time budget in seconds for one generate() call across
+                all models, loading waits included (None for no limit)
+            health_registry: Circuit breaker registry (defaults to the shared one)
+            cache: Image cache (defaults to the shared illustration cache)
         """
         self._api_key = api_key or os.getenv("HUGGINGFACE_API_KEY")
         self._model = model or os.getenv("IMAGE_GENERATION_MODEL", self.DEFAULT_MODEL)
         self._timeout = timeout
+        self._probe_timeout = probe_timeout
+        self._deadline = deadline
+        self._health = health_registry or get_model_health_registry("image_models")
+        self._cache = cache or get_illustration_cache()
         self._is_active = False
         self._current_model = self._model
 
@@ -147,22 +172,63 @@ class BananaImageGenerator(BaseImageGenerator):
         enhanced_prompt = self._enhance_prompt(prompt, style_hints)
         width, height = self._validate_dimensions(width, height)
 
-        # Try primary model first, then fallbacks
-        models_to_try = [self._model] + self.FALLBACK_MODELS
+        # Healthy models in remembered order; open circuits are skipped outright
+        configured = [self._model] + [m for m in self.FALLBACK_MODELS if m != self._model]
+        models_to_try = self._health.plan(configured)
         last_error = None
 
+        # Any configured model's cached image is reused, primary model first
+        cached = await self._get_cached(configured, enhanced_prompt, width, height)
+        if cached:
+            return cached
+
+        if not models_to_try:
+            logger.warning("All image model circuits are open, using placeholder")
+            return self._generate_placeholder(prompt, width, height)
+
+        budget_end = time.monotonic() + self._deadline if self._deadline else None
         for model in models_to_try:
+            timeout = self._timeout
+            if budget_end is not None:
+                timeout = min(timeout, budget_end - time.monotonic())
+                if timeout < 1:
+                    logger.warning("Image generation deadline spent, skipping remaining models")
+                    break
+
+            is_probe = self._health.state(model) == CircuitState.HALF_OPEN
+            if is_probe and not self._health.begin_probe(model):
+                continue
+
+            started = time.perf_counter()
             try:
-                logger.info(f"Attempting generation with model: {model}")
-                image_bytes = await self._generate_with_model(model, enhanced_prompt, width, height)
+                logger.info(f"Attempting generation with model: {model}"
+                            f"{' (half-open probe)' if is_probe else ''}")
+                image_bytes = await self._generate_with_model(
+                    model, enhanced_prompt, width, height,
+                    timeout=min(timeout, self._probe_timeout) if is_probe else timeout,
+                    wait_for_loading=not is_probe
+                )
 
                 if image_bytes:
+                    self._health.record_success(model, time.perf_counter() - started)
                     self._current_model = model
                     logger.info(f"Generation successful with {model}")
+                    if self._cache:
+                        await self._cache.put(
+                            self._cache_key(model, enhanced_prompt, width, height), image_bytes
+                        )
                     return image_bytes
 
+                self._health.record_failure(model, "Empty or unexpected response")
+
+            except asyncio.CancelledError:
+                # Cut off by the caller (deadline): a hang still counts against
+                # the model, and a cancelled probe must not stay claimed
+                self._health.record_failure(model, "Cancelled before completing")
+                raise
             except Exception as e:
                 logger.warning(f"Model {model} failed: {e}")
+                self._health.record_failure(model, str(e) or type(e).__name__)
                 last_error = e
                 continue
 
@@ -175,7 +241,9 @@ class BananaImageGenerator(BaseImageGenerator):
         model: str,
         prompt: str,
         width: int,
-        height: int
+        height: int,
+        timeout: Optional[float] = None,
+        wait_for_loading: bool = True
     ) -> Optional[bytes]:
         """
         Attempt generation with a specific model.
@@ -185,10 +253,15 @@ class BananaImageGenerator(BaseImageGenerator):
             prompt: Enhanced prompt
             width: Image width
             height: Image height
+            timeout: Time budget in seconds for this model, including a
+                loading wait and its retry (defaults to the generator timeout)
+            wait_for_loading: Wait and retry once when the model is still loading
 
         Returns:
             Image bytes or None if failed
         """
+        timeout = timeout or self._timeout
+        model_end = time.monotonic() + timeout
         if not AIOHTTP_AVAILABLE or aiohttp is None:
             logger.warning("aiohttp not available, cannot generate image")
             return None
@@ -201,8 +274,7 @@ class BananaImageGenerator(BaseImageGenerator):
             "parameters": {
                 "width": width,
                 "height": height,
-                "num_inference_steps": 25,  # Balance between quality and speed
-                "guidance_scale": 7.5
+                **self.INFERENCE_PARAMETERS
             },
             "options": {
                 "wait_for_model": True,
@@ -210,54 +282,87 @@ class BananaImageGenerator(BaseImageGenerator):
             }
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                api_url,
-                headers=headers,
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=self._timeout)
-            ) as response:
-                if response.status == 200:
-                    content_type = response.headers.get('content-type', '')
-
-                    if 'image' in content_type:
-                        # Direct image response
-                        return await response.read()
-                    elif 'application/json' in content_type:
-                        # JSON response (possibly with base64 image)
-                        data = await response.json()
-                        if isinstance(data, list) and len(data) > 0:
-                            # Handle array response format
-                            import base64
-                            if 'image' in data[0]:
-                                return base64.b64decode(data[0]['image'])
-
-                    logger.warning(f"Unexpected response type: {content_type}")
-                    return None
-
-                elif response.status == 503:
-                    # Model loading, wait and retry
-                    logger.info(f"Model {model} is loading, waiting...")
+        session = get_http_session("huggingface_image")
+        async with session.post(
+            api_url,
+            headers=headers,
+            json=payload,
+            timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            if response.status == 200:
+                content_type = response.headers.get('content-type', '')
+
+                if 'image' in content_type:
+                    # Direct image response
+                    return await response.read()
+                elif 'application/json' in content_type:
+                    # JSON response (possibly with base64 image)
                     data = await response.json()
-                    wait_time = data.get('estimated_time', 30)
-                    await asyncio.sleep(min(wait_time, 60))
-
-                    # Retry once after waiting
-                    async with session.post(
-                        api_url,
-                        headers=headers,
-                        json=payload,
-                        timeout=aiohttp.ClientTimeout(total=self._timeout)
-                    ) as retry_response:
-                        if retry_response.status == 200:
-                            return await retry_response.read()
-
-                    return None
-
-                else:
-                    error_text = await response.text()
-                    logger.error(f"API error {response.status}: {error_text[:200]}")
-                    raise Exception(f"API error: {response.status}")
+                    if isinstance(data, list) and len(data) > 0:
+                        # Handle array response format
+                        import base64
+                        if 'image' in data[0]:
+                            return base64.b64decode(data[0]['image'])
+
+                logger.warning(f"Unexpected response type: {content_type}")
+                return None
+
+            elif response.status == 503:
+                if not wait_for_loading:
+                    raise Exception("API error: 503 (model loading)")
+
+                # Model loading, wait and retry
+                logger.info(f"Model {model} is loading, waiting...")
+                data = await response.json()
+                wait_time = data.get('estimated_time', 30)
+                retry_timeout = model_end - time.monotonic() - min(wait_time, 60)
+                if retry_timeout < 1:
+                    raise Exception("API error: 503 (model loading longer than the time budget)")
+                await asyncio.sleep(min(wait_time, 60))
+
+                # Retry once after waiting
+                async with session.post(
+                    api_url,
+                    headers=headers,
+                    json=payload,
+                    timeout=aiohttp.ClientTimeout(total=retry_timeout)
+                ) as retry_response:
+                    if retry_response.status == 200:
+                        return await retry_response.read()
+
+                return None
+
+            else:
+                error_text = await response.text()
+                logger.error(f"API error {response.status}: {error_text[:200]}")
+                raise Exception(f"API error: {response.status}")
+
+    def _cache_key(self, model: str, prompt: str, width: int, height: int) -> str:
+        """Cache key for an image: enhanced prompt, model, size and inference parameters."""
+        return content_key(
+            prompt=prompt,
+            model=model,
+            width=width,
+            height=height,
+            parameters=self.INFERENCE_PARAMETERS
+        )
+
+    async def _get_cached(
+        self,
+        models: List[str],
+        prompt: str,
+        width: int,
+        height: int
+    ) -> Optional[bytes]:
+        """Return the first cached image for the given models, if any."""
+        if not self._cache:
+            return None
+        for model in models:
+            image_bytes = await self._cache.get(self._cache_key(model, prompt, width, height))
+            if image_bytes:
+                logger.info(f"Illustration cache hit ({model})")
+                return image_bytes
+        return None
 
     def _enhance_prompt(self, prompt: str, style_hints: Optional[str] = None) -> str:
         """
@@ -293,6 +398,10 @@ class BananaImageGenerator(BaseImageGenerator):
 
         return enhanced
 
+    def generate_placeholder(self, prompt: str, width: int = 512, height: int = 512) -> bytes:
+        """Create the placeholder image used when generation fails."""
+        return self._generate_placeholder(prompt, width, height)
+
     def _generate_placeholder(self, prompt: str, width: int, height: int) -> bytes:
         """
         Generate a placeholder image when API is unavailable.
@@ -465,5 +574,7 @@ class BananaImageGenerator(BaseImageGenerator):
             "is_active": self._is_active,
             "has_api_key": bool(self._api_key),
             "timeout": self._timeout,
+            "model_health": self._health.snapshot(),
+            "cache": self._cache.get_metrics() if self._cache else None,
             "status": "ACTIVE" if self._is_active else "INACTIVE"
         }
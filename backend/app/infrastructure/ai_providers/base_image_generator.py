@@ -92,6 +92,21 @@ class BaseImageGenerator(IImageGenerator, ABC):
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    def generate_placeholder(self, prompt: str, width: int = 512, height: int = 512) -> bytes:
+        """
+        Create a stand-in image for a failed or late generation.
+        Default implementation returns empty bytes (no placeholder).
+
+        Args:
+            prompt: Text description of the image
+            width: Image width in pixels
+            height: Image height in pixels
+
+        Returns:
+            Placeholder image as bytes
+        """
+        return b''
+
     async def generate_batch(
         self,
         prompts: List[str],
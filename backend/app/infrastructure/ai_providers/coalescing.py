@@ -0,0 +1,218 @@
+"""
+Coalescing Generators.
+ITextGenerator and IImageGenerator decorators that share one upstream
+call between concurrent identical requests.
+"""
+
+import copy
+import asyncio
+from pathlib import Path
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from ...domain.interfaces.text_generator import ITextGenerator
+from ...domain.interfaces.image_generator import IImageGenerator
+from ...shared.singleflight import SingleFlight, get_singleflight
+from ...shared.logger import get_logger
+from ..storage.disk_cache import content_key
+from .routing_text_generator import get_routing_text_generator
+
+logger = get_logger("coalescing")
+
+
+class CoalescingTextGenerator(ITextGenerator):
+    """
+    Text generator that coalesces identical concurrent calls.
+
+    Calls with the same prompt, parameters and provider made while one is
+    already in flight wait for that call instead of issuing their own.
+    """
+
+    def __init__(self, generator: ITextGenerator, group: Optional[SingleFlight] = None):
+        """
+        Initialize the coalescing text generator.
+
+        Args:
+            generator: Generator performing the upstream calls
+            group: Coalescing group (defaults to the shared "text" group)
+        """
+        self._generator = generator
+        self._group = group or get_singleflight("text")
+
+    @property
+    def is_active(self) -> bool:
+        """Check if the wrapped generator is active."""
+        return getattr(self._generator, 'is_active', True)
+
+    @property
+    def model_name(self) -> str:
+        """Return the wrapped generator's model."""
+        return self._generator.model_name
+
+    @property
+    def provider_name(self) -> str:
+        """Return the wrapped generator's provider name."""
+        return self._generator.provider_name
+
+    async def generate(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        temperature: float = 0.7,
+        context: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Generate text, sharing the call with identical in-flight requests."""
+        key = content_key(
+            call="generate",
+            provider=self._generator.provider_name,
+            prompt=prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            context=context
+        )
+        return await self._group.do(key, lambda: self._generator.generate(
+            prompt=prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            context=context
+        ))
+
+    async def generate_structured(
+        self,
+        prompt: str,
+        output_schema: Dict[str, Any],
+        max_tokens: int = 2000
+    ) -> Dict[str, Any]:
+        """Generate structured output, sharing the call with identical in-flight requests."""
+        key = content_key(
+            call="generate_structured",
+            provider=self._generator.provider_name,
+            prompt=prompt,
+            output_schema=output_schema,
+            max_tokens=max_tokens
+        )
+        result = await self._group.do(key, lambda: self._generator.generate_structured(
+            prompt=prompt,
+            output_schema=output_schema,
+            max_tokens=max_tokens
+        ))
+        # Every waiter gets its own copy, callers may mutate the result
+        return copy.deepcopy(result)
+
+    def get_status_info(self) -> Dict[str, Any]:
+        """Get the wrapped generator's status with coalescing metrics."""
+        if hasattr(self._generator, 'get_status_info'):
+            status = dict(self._generator.get_status_info())
+        else:
+            status = {
+                "provider": self.provider_name,
+                "model": self.model_name,
+                "is_active": self.is_active
+            }
+        status["coalescing"] = self._group.get_metrics()
+        return status
+
+
+class CoalescingImageGenerator(IImageGenerator):
+    """
+    Image generator that coalesces identical concurrent calls.
+
+    Calls with the same prompt, size, style and provider made while one is
+    already in flight wait for that call instead of issuing their own.
+    """
+
+    def __init__(self, generator: IImageGenerator, group: Optional[SingleFlight] = None):
+        """
+        Initialize the coalescing image generator.
+
+        Args:
+            generator: Generator performing the upstream calls
+            group: Coalescing group (defaults to the shared "image" group)
+        """
+        self._generator = generator
+        self._group = group or get_singleflight("image")
+
+    @property
+    def is_active(self) -> bool:
+        """Check if the wrapped generator is active."""
+        return getattr(self._generator, 'is_active', True)
+
+    @property
+    def model_name(self) -> str:
+        """Return the wrapped generator's model."""
+        return self._generator.model_name
+
+    @property
+    def provider_name(self) -> str:
+        """Return the wrapped generator's provider name."""
+        return getattr(self._generator, 'provider_name', self._generator.model_name)
+
+    async def generate(
+        self,
+        prompt: str,
+        width: int = 512,
+        height: int = 512,
+        style_hints: Optional[str] = None
+    ) -> bytes:
+        """Generate an image, sharing the call with identical in-flight requests."""
+        key = content_key(
+            provider=self.provider_name,
+            prompt=prompt,
+            width=width,
+            height=height,
+            style_hints=style_hints
+        )
+        return await self._group.do(
+            key, lambda: self._generator.generate(prompt, width, height, style_hints)
+        )
+
+    async def generate_batch(
+        self,
+        prompts: List[str],
+        width: int = 512,
+        height: int = 512
+    ) -> List[bytes]:
+        """Generate images concurrently; duplicate prompts share one call."""
+        return list(await asyncio.gather(*(
+            self.generate(prompt, width, height) for prompt in prompts
+        )))
+
+    async def generate_to_file(
+        self,
+        prompt: str,
+        output_path: Path,
+        width: int = 512,
+        height: int = 512
+    ) -> Path:
+        """Generate an image through the coalesced path and save it."""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        image_bytes = await self.generate(prompt, width, height)
+        if image_bytes:
+            output_path.write_bytes(image_bytes)
+            logger.info(f"Image saved: {output_path} ({len(image_bytes)} bytes)")
+        return output_path
+
+    def generate_placeholder(self, prompt: str, width: int = 512, height: int = 512) -> bytes:
+        """Create the wrapped generator's placeholder (empty if it has none)."""
+        create_placeholder = getattr(self._generator, 'generate_placeholder', None)
+        return create_placeholder(prompt, width, height) if create_placeholder else b''
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get the wrapped generator's status with coalescing metrics."""
+        if hasattr(self._generator, 'get_status'):
+            status = dict(self._generator.get_status())
+        else:
+            status = {"model": self.model_name, "is_active": self.is_active}
+        status["coalescing"] = self._group.get_metrics()
+        return status
+
+
+@lru_cache(maxsize=1)
+def get_shared_text_generator() -> CoalescingTextGenerator:
+    """
+    Get the process-wide text generator used by request handlers.
+
+    Routes through the shared routing generator and coalesces identical
+    concurrent calls.
+    """
+    return CoalescingTextGenerator(get_routing_text_generator())
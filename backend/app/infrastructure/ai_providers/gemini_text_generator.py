@@ -36,7 +36,9 @@ class GeminiTextGenerator(ITextGenerator):
     def __init__(
         self,
         api_key: Optional[str] = None,
-        model: str = "models/gemini-2.0-flash"
+        model: str = "models/gemini-2.0-flash",
+        raise_on_error: bool = False,
+        templates_only: bool = False
     ):
         """
         Initialize Gemini text generator.
@@ -44,12 +46,20 @@ class GeminiTextGenerator(ITextGenerator):
         Args:
             api_key: Google AI API key (falls back to environment variable)
             model: Model identifier (default: gemini-2.0-flash)
+            raise_on_error: Raise API failures instead of returning template text
+                (used when a RoutingTextGenerator handles failover)
+            templates_only: Never call the API; always return template text
+                (used as the RoutingTextGenerator last resort)
         """
         self._api_key = api_key or os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
         self._model_name = model
+        self._raise_on_error = raise_on_error
         self._model = None
         self._is_active = False
 
+        if templates_only:
+            logger.info("Gemini text generator created in template-only mode")
+            return
         self._initialize_model()
 
     def _initialize_model(self) -> None:
@@ -167,7 +177,7 @@ class GeminiTextGenerator(ITextGenerator):
                 )
 
             logger.info("Sending request to Gemini API...")
-            response = self._model.generate_content(
+            response = await self._model.generate_content_async(
                 full_prompt,
                 generation_config=generation_config
             )
@@ -178,6 +188,8 @@ class GeminiTextGenerator(ITextGenerator):
 
         except Exception as e:
             logger.error(f"Text generation failed: {e}")
+            if self._raise_on_error:
+                raise
             logger.warning("Falling back to template generation")
             return self._fallback_generation(prompt, context)
 
@@ -228,7 +240,7 @@ Response (JSON only):
                     max_output_tokens=max_tokens,
                     temperature=0.3  # Lower for structured output
                 )
-            response = self._model.generate_content(
+            response = await self._model.generate_content_async(
                 schema_prompt,
                 generation_config=generation_config
             )
@@ -252,9 +264,13 @@ Response (JSON only):
 
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse JSON response: {e}")
+            if self._raise_on_error:
+                raise
             return self._create_default_from_schema(output_schema)
         except Exception as e:
             logger.error(f"Structured generation failed: {e}")
+            if self._raise_on_error:
+                raise
             return self._create_default_from_schema(output_schema)
 
     @property
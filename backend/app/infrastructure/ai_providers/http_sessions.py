@@ -0,0 +1,104 @@
+"""
+Shared HTTP Sessions.
+Process-lifetime aiohttp sessions for AI provider APIs.
+"""
+
+import asyncio
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    AIOHTTP_AVAILABLE = False
+
+from ...shared.logger import get_logger
+from ...config import settings
+
+logger = get_logger("http_sessions")
+
+# Provider name -> (session, event loop it was created on)
+_sessions: Dict[str, Tuple["aiohttp.ClientSession", asyncio.AbstractEventLoop]] = {}
+
+
+def _create_session(name: str) -> "aiohttp.ClientSession":
+    """Create a session with a pooled, keep-alive, DNS-caching connector."""
+    connector = aiohttp.TCPConnector(
+        limit=settings.HTTP_POOL_LIMIT,
+        limit_per_host=settings.HTTP_POOL_LIMIT_PER_HOST,
+        keepalive_timeout=settings.HTTP_KEEPALIVE_SECONDS,
+        ttl_dns_cache=settings.HTTP_DNS_CACHE_SECONDS,
+        use_dns_cache=True
+    )
+    logger.info(f"Created pooled HTTP session for {name} "
+                f"(limit_per_host={settings.HTTP_POOL_LIMIT_PER_HOST}, "
+                f"keepalive={settings.HTTP_KEEPALIVE_SECONDS}s)")
+    return aiohttp.ClientSession(connector=connector)
+
+
+def get_http_session(name: str) -> "aiohttp.ClientSession":
+    """
+    Get the shared session for a provider, creating it on first use.
+
+    Sessions are bound to the running event loop; a new one is created if
+    the previous session was closed or belongs to another loop.
+
+    Args:
+        name: Provider name (one session per provider)
+
+    Returns:
+        Pooled aiohttp ClientSession
+    """
+    if not AIOHTTP_AVAILABLE:
+        raise RuntimeError("aiohttp package not installed")
+
+    loop = asyncio.get_running_loop()
+    entry = _sessions.get(name)
+    if entry:
+        session, session_loop = entry
+        if not session.closed and session_loop is loop:
+            return session
+
+    session = _create_session(name)
+    _sessions[name] = (session, loop)
+    return session
+
+
+async def close_http_sessions() -> None:
+    """Close every shared session (call on application shutdown)."""
+    for name, (session, _) in list(_sessions.items()):
+        if not session.closed:
+            await session.close()
+            logger.info(f"Closed pooled HTTP session for {name}")
+    _sessions.clear()
+
+
+def get_session_stats(name: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Get connection pool usage for shared sessions.
+
+    Args:
+        name: Provider name (None for all providers)
+
+    Returns:
+        Dictionary of provider name to pool statistics
+    """
+    stats = {}
+    for session_name, (session, _) in _sessions.items():
+        if name and session_name != name:
+            continue
+        connector = session.connector
+        if connector is None:
+            stats[session_name] = {"closed": True}
+            continue
+        # aiohttp exposes no public pool counters; read them defensively
+        idle = getattr(connector, "_conns", {})
+        stats[session_name] = {
+            "closed": session.closed,
+            "limit": connector.limit,
+            "limit_per_host": connector.limit_per_host,
+            "idle_connections": sum(len(conns) for conns in idle.values()),
+            "acquired_connections": len(getattr(connector, "_acquired", ()))
+        }
+    return stats
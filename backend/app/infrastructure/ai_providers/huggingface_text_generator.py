@@ -8,6 +8,7 @@ import logging
 import json
 import aiohttp
 from ...domain.interfaces.text_generator import ITextGenerator
+from .http_sessions import get_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -18,18 +19,31 @@ class HuggingFaceTextGenerator(ITextGenerator):
     Uses HuggingFace Inference API for various models.
     """
 
-    def __init__(self, api_key: str, model: str = "mistralai/Mixtral-8x7B-Instruct-v0.1"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "mistralai/Mixtral-8x7B-Instruct-v0.1",
+        raise_on_error: bool = False
+    ):
         """
         Initialize HuggingFace text generator.
 
         Args:
             api_key: HuggingFace API key
             model: Model identifier on HuggingFace
+            raise_on_error: Raise API failures instead of returning template text
+                (used when a RoutingTextGenerator handles failover)
         """
         self._api_key = api_key
         self._model = model
         self._api_url = f"https://api-inference.huggingface.co/models/{model}"
         self._headers = {"Authorization": f"Bearer {api_key}"}
+        self._raise_on_error = raise_on_error
+
+    @property
+    def is_active(self) -> bool:
+        """Check if the generator has credentials to call the API."""
+        return bool(self._api_key)
 
     async def generate(
         self,
@@ -69,28 +83,34 @@ class HuggingFaceTextGenerator(ITextGenerator):
                 payload["inputs"] = f"{context_str}\n\n{prompt}"
 
             # Make API request
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self._api_url,
-                    headers=self._headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        # Extract generated text
-                        if isinstance(result, list) and len(result) > 0:
-                            return result[0].get("generated_text", "")
-                        return ""
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"HuggingFace API error: {response.status} - {error_text}")
-
-                        # Fallback to simple template-based generation
-                        return self._fallback_generation(prompt, context)
+            session = get_http_session("huggingface_text")
+            async with session.post(
+                self._api_url,
+                headers=self._headers,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    # Extract generated text
+                    if isinstance(result, list) and len(result) > 0:
+                        return result[0].get("generated_text", "")
+                    if self._raise_on_error:
+                        raise ValueError("HuggingFace API returned no generated text")
+                    return ""
+                else:
+                    error_text = await response.text()
+                    logger.error(f"HuggingFace API error: {response.status} - {error_text}")
+                    if self._raise_on_error:
+                        raise RuntimeError(f"HuggingFace API error: {response.status}")
+
+                    # Fallback to simple template-based generation
+                    return self._fallback_generation(prompt, context)
 
         except Exception as e:
             logger.error(f"Text generation failed: {e}")
+            if self._raise_on_error:
+                raise
             # Use fallback generation
             return self._fallback_generation(prompt, context)
 
@@ -139,6 +159,9 @@ class HuggingFaceTextGenerator(ITextGenerator):
         except Exception as e:
             logger.warning(f"Failed to parse structured output: {e}")
 
+        if self._raise_on_error:
+            raise ValueError("HuggingFace response did not contain valid JSON")
+
         # Return default structure based on schema
         return self._create_default_from_schema(output_schema)
 
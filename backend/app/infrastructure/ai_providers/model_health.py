@@ -0,0 +1,318 @@
+"""
+Model Health Registry.
+Per-model circuit breakers for AI providers, shared across workers.
+"""
+
+import os
+import json
+import time
+from enum import Enum
+from pathlib import Path
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    fcntl = None
+    FCNTL_AVAILABLE = False
+
+from ...shared.logger import get_logger
+from ...config import settings
+
+logger = get_logger("model_health")
+
+
+class CircuitState(Enum):
+    """State of a model's circuit breaker."""
+    CLOSED = "closed"        # Healthy, requests flow normally
+    OPEN = "open"            # Failing, requests are skipped until the cooldown ends
+    HALF_OPEN = "half_open"  # Cooldown over, a single probe request is allowed
+
+
+class ModelHealthRegistry:
+    """
+    Circuit breakers and health memory for a set of models.
+
+    State is kept in a small JSON file so that every worker process sees
+    the same breakers and the same preferred model order. The file is
+    reloaded when another process changes it and rewritten atomically
+    under an exclusive lock.
+
+    Features:
+    - Consecutive-failure threshold per model
+    - Exponential cooldown after failed half-open probes
+    - One probe at a time per model across all workers
+    - Healthy models ordered by most recent success
+    """
+
+    def __init__(
+        self,
+        state_file: Optional[Path] = None,
+        failure_threshold: int = 2,
+        cooldown_seconds: float = 300,
+        max_cooldown_seconds: float = 3600,
+        probe_timeout_seconds: float = 30
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            state_file: JSON file shared between workers (None keeps state in memory)
+            failure_threshold: Consecutive failures that open a breaker
+            cooldown_seconds: Initial time a breaker stays open
+            max_cooldown_seconds: Upper bound for the exponential cooldown
+            probe_timeout_seconds: Time after which an unfinished probe is abandoned
+        """
+        self._state_file = state_file
+        self._failure_threshold = max(1, failure_threshold)
+        self._cooldown = cooldown_seconds
+        self._max_cooldown = max_cooldown_seconds
+        self._probe_timeout = probe_timeout_seconds
+        self._models: Dict[str, Dict[str, Any]] = {}
+        self._loaded_mtime: Optional[float] = None
+
+        if self._state_file:
+            self._state_file.parent.mkdir(parents=True, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def plan(self, models: List[str]) -> List[str]:
+        """
+        Order models for the next request and drop those that must be skipped.
+
+        Closed models come first, most recently successful first, then in
+        the given order. Open models whose cooldown has elapsed are appended
+        as half-open probes; other open models are skipped.
+
+        Args:
+            models: Candidate models in configured preference order
+
+        Returns:
+            Models to try, in order (empty when everything is open)
+        """
+        self._refresh()
+        now = time.time()
+
+        closed = []
+        probes = []
+        for position, model in enumerate(models):
+            record = self._record(model)
+            state = self._state_of(record, now)
+            if state == CircuitState.CLOSED:
+                closed.append((-record.get("last_success", 0), position, model))
+            elif state == CircuitState.HALF_OPEN:
+                probes.append(model)
+
+        return [model for _, _, model in sorted(closed)] + probes
+
+    def state(self, model: str) -> CircuitState:
+        """Get the current breaker state of a model."""
+        self._refresh()
+        return self._state_of(self._record(model), time.time())
+
+    def begin_probe(self, model: str) -> bool:
+        """
+        Claim the half-open probe for a model.
+
+        Returns:
+            True if this caller may send the probe request
+        """
+        with self._locked():
+            record = self._record(model)
+            if self._state_of(record, time.time()) != CircuitState.HALF_OPEN:
+                return False
+            record["probe_started_at"] = time.time()
+        return True
+
+    def record_success(self, model: str, latency: float) -> None:
+        """Record a successful request, closing the model's breaker."""
+        with self._locked():
+            record = self._record(model)
+            was_open = record.get("opened_at") is not None
+            record.update({
+                "consecutive_failures": 0,
+                "opened_at": None,
+                "probe_started_at": None,
+                "trips": 0,
+                "last_success": time.time(),
+                "last_latency": round(latency, 3)
+            })
+            record["successes"] = record.get("successes", 0) + 1
+        if was_open:
+            logger.info(f"Circuit CLOSED for {model} (probe succeeded)")
+
+    def record_failure(self, model: str, error: Optional[str] = None) -> None:
+        """Record a failed request, opening the breaker past the threshold."""
+        with self._locked():
+            record = self._record(model)
+            now = time.time()
+            record["failures"] = record.get("failures", 0) + 1
+            record["consecutive_failures"] = record.get("consecutive_failures", 0) + 1
+            record["last_error"] = (error or "")[:200]
+
+            # In-flight requests failing after the breaker opened do not extend it
+            probing = record.get("probe_started_at") is not None
+            already_open = record.get("opened_at") is not None and not probing
+            if probing or (not already_open and record["consecutive_failures"] >= self._failure_threshold):
+                record["trips"] = record.get("trips", 0) + 1
+                record["opened_at"] = now
+                record["probe_started_at"] = None
+                cooldown = self._cooldown_for(record)
+                logger.warning(f"Circuit OPEN for {model} for {cooldown:.0f}s "
+                               f"({record['consecutive_failures']} consecutive failures)")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the state of every known model.
+
+        Returns:
+            Dictionary of model name to breaker details
+        """
+        self._refresh()
+        now = time.time()
+        return {
+            model: {
+                "state": self._state_of(record, now).value,
+                "consecutive_failures": record.get("consecutive_failures", 0),
+                "successes": record.get("successes", 0),
+                "failures": record.get("failures", 0),
+                "trips": record.get("trips", 0),
+                "last_latency": record.get("last_latency"),
+                "last_error": record.get("last_error"),
+                "retry_in_seconds": self._retry_in(record, now)
+            }
+            for model, record in self._models.items()
+        }
+
+    # ------------------------------------------------------------------
+    # State helpers
+    # ------------------------------------------------------------------
+
+    def _record(self, model: str) -> Dict[str, Any]:
+        """Get (or create) the mutable record for a model."""
+        return self._models.setdefault(model, {
+            "consecutive_failures": 0,
+            "opened_at": None,
+            "probe_started_at": None,
+            "trips": 0
+        })
+
+    def _cooldown_for(self, record: Dict[str, Any]) -> float:
+        """Cooldown for the current trip, doubling with each failed probe."""
+        trips = max(1, record.get("trips", 1))
+        return min(self._cooldown * (2 ** (trips - 1)), self._max_cooldown)
+
+    def _retry_in(self, record: Dict[str, Any], now: float) -> Optional[float]:
+        """Seconds until an open breaker becomes half-open (None if closed)."""
+        opened_at = record.get("opened_at")
+        if opened_at is None:
+            return None
+        return max(0.0, round(opened_at + self._cooldown_for(record) - now, 1))
+
+    def _state_of(self, record: Dict[str, Any], now: float) -> CircuitState:
+        """Derive the breaker state from a record."""
+        opened_at = record.get("opened_at")
+        if opened_at is None:
+            return CircuitState.CLOSED
+        if now - opened_at < self._cooldown_for(record):
+            return CircuitState.OPEN
+
+        # Cooldown over: one probe at a time, abandoned probes are reclaimed
+        probe_started = record.get("probe_started_at")
+        if probe_started is not None and now - probe_started < self._probe_timeout:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    # ------------------------------------------------------------------
+    # Cross-worker persistence
+    # ------------------------------------------------------------------
+
+    def _refresh(self) -> None:
+        """Reload state if another worker has changed the file."""
+        if not self._state_file:
+            return
+        try:
+            mtime = self._state_file.stat().st_mtime
+        except FileNotFoundError:
+            return
+        if mtime != self._loaded_mtime:
+            self._load()
+
+    def _load(self) -> None:
+        """Read state from the shared file."""
+        try:
+            with open(self._state_file, "r", encoding="utf-8") as f:
+                self._models = json.load(f).get("models", {})
+            self._loaded_mtime = self._state_file.stat().st_mtime
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read model health state: {e}")
+
+    def _locked(self) -> "_StateLock":
+        """Context manager that reloads, then persists state under a file lock."""
+        return _StateLock(self)
+
+    def _save(self) -> None:
+        """Atomically write state to the shared file."""
+        tmp_path = self._state_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"models": self._models}, f)
+        os.replace(tmp_path, self._state_file)
+        self._loaded_mtime = self._state_file.stat().st_mtime
+
+
+class _StateLock:
+    """Exclusive read-modify-write section over the registry's state file."""
+
+    def __init__(self, registry: ModelHealthRegistry):
+        self._registry = registry
+        self._lock_file = None
+
+    def __enter__(self) -> None:
+        registry = self._registry
+        if not registry._state_file:
+            return
+        try:
+            if FCNTL_AVAILABLE:
+                self._lock_file = open(registry._state_file.with_suffix(".lock"), "a")
+                fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+            if registry._state_file.exists():
+                registry._load()
+        except OSError as e:
+            logger.warning(f"Model health state lock unavailable: {e}")
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        registry = self._registry
+        try:
+            if registry._state_file and exc_type is None:
+                registry._save()
+        except OSError as e:
+            logger.warning(f"Could not persist model health state: {e}")
+        finally:
+            if self._lock_file:
+                fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+                self._lock_file.close()
+        return False
+
+
+@lru_cache(maxsize=None)
+def get_model_health_registry(name: str) -> ModelHealthRegistry:
+    """
+    Get the process-wide health registry for a provider.
+
+    Args:
+        name: Registry name, used for the shared state file
+
+    Returns:
+        ModelHealthRegistry backed by PROVIDER_STATE_DIR/<name>.json
+    """
+    return ModelHealthRegistry(
+        state_file=Path(settings.PROVIDER_STATE_DIR) / f"{name}.json",
+        failure_threshold=settings.IMAGE_BREAKER_FAILURE_THRESHOLD,
+        cooldown_seconds=settings.IMAGE_BREAKER_COOLDOWN_SECONDS,
+        max_cooldown_seconds=settings.IMAGE_BREAKER_MAX_COOLDOWN_SECONDS,
+        probe_timeout_seconds=settings.IMAGE_PROBE_TIMEOUT_SECONDS * 2
+    )
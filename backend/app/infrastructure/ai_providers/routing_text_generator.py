@@ -0,0 +1,404 @@
+"""
+Routing Text Generator Implementation.
+Composes several ITextGenerator providers with latency-aware ordering,
+hedged requests and failover.
+"""
+
+import time
+import asyncio
+from collections import deque
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from ...domain.interfaces.text_generator import ITextGenerator
+from ...domain.exceptions import ExternalServiceException
+from ...shared.logger import get_logger
+from ...config import settings
+
+logger = get_logger("routing_text_generator")
+
+
+class ProviderStats:
+    """
+    Rolling latency and outcome statistics for one provider.
+
+    Only completed calls contribute latency samples; calls cancelled because
+    a hedged sibling won are counted separately.
+    """
+
+    def __init__(self, window: int):
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self.requests = 0
+        self.successes = 0
+        self.failures = 0
+        self.cancellations = 0
+        self.hedges_launched = 0
+        self.hedge_wins = 0
+
+    def record_success(self, latency: float) -> None:
+        """Record a successful call and its latency."""
+        self.successes += 1
+        self._latencies.append(latency)
+        self._outcomes.append(True)
+
+    def record_failure(self, latency: float) -> None:
+        """Record a failed call and its latency."""
+        self.failures += 1
+        self._latencies.append(latency)
+        self._outcomes.append(False)
+
+    @property
+    def sample_count(self) -> int:
+        """Number of latency samples in the window."""
+        return len(self._latencies)
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of failed calls in the window."""
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Latency percentile over the window (None without samples)."""
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+        return ordered[index]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation."""
+        return {
+            "requests": self.requests,
+            "successes": self.successes,
+            "failures": self.failures,
+            "cancellations": self.cancellations,
+            "hedges_launched": self.hedges_launched,
+            "hedge_wins": self.hedge_wins,
+            "samples": self.sample_count,
+            "error_rate": round(self.error_rate, 4),
+            "p50_seconds": self.percentile(50),
+            "p95_seconds": self.percentile(95)
+        }
+
+
+class RoutingTextGenerator(ITextGenerator):
+    """
+    Text generator that routes each call across several providers.
+
+    Features:
+    - Providers ranked by rolling latency and error rate
+    - Hedged second request when the first exceeds its p95 latency
+    - First successful answer wins, the slower call is cancelled
+    - Immediate failover when a provider errors
+    - Template fallback only when every provider has failed
+    """
+
+    def __init__(
+        self,
+        providers: List[ITextGenerator],
+        fallback_generator: Optional[ITextGenerator] = None,
+        default_hedge_delay: float = 8.0,
+        min_samples: int = 20,
+        window: int = 200
+    ):
+        """
+        Initialize the routing text generator.
+
+        Args:
+            providers: Providers in preference order; they should raise on
+                failure rather than return template text
+            fallback_generator: Generator used when every provider fails
+            default_hedge_delay: Hedge delay in seconds before a provider
+                has enough samples for a p95
+            min_samples: Samples required before p95 drives hedging and ranking
+            window: Number of recent calls kept per provider
+        """
+        if not providers:
+            raise ValueError("At least one text provider is required")
+
+        self._providers = providers
+        self._fallback_generator = fallback_generator
+        self._default_hedge_delay = default_hedge_delay
+        self._min_samples = min_samples
+        self._stats: Dict[int, ProviderStats] = {
+            id(provider): ProviderStats(window) for provider in providers
+        }
+        self._fallback_count = 0
+
+        logger.info(
+            "Routing text generator initialized with providers: "
+            + ", ".join(f"{p.provider_name} ({p.model_name})" for p in providers)
+        )
+
+    @property
+    def is_active(self) -> bool:
+        """Check if at least one provider is active."""
+        return bool(self._active_providers())
+
+    @property
+    def model_name(self) -> str:
+        """Return the model of the currently preferred provider."""
+        ranked = self._ranked_providers()
+        return ranked[0].model_name if ranked else self._providers[0].model_name
+
+    @property
+    def provider_name(self) -> str:
+        """Return the provider name."""
+        return "Routed(" + ", ".join(p.provider_name for p in self._providers) + ")"
+
+    async def generate(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        temperature: float = 0.7,
+        context: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Generate text using the fastest healthy provider, hedging slow calls.
+
+        Args:
+            prompt: The text prompt for generation
+            max_tokens: Maximum tokens to generate
+            temperature: Creativity parameter (0.0-1.0)
+            context: Additional context for generation
+
+        Returns:
+            Generated text string
+        """
+        try:
+            return await self._route(
+                lambda provider: provider.generate(
+                    prompt=prompt,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    context=context
+                )
+            )
+        except ExternalServiceException:
+            if not self._fallback_generator:
+                raise
+            self._fallback_count += 1
+            logger.warning("All text providers failed, using fallback generator")
+            return await self._fallback_generator.generate(
+                prompt=prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                context=context
+            )
+
+    async def generate_structured(
+        self,
+        prompt: str,
+        output_schema: Dict[str, Any],
+        max_tokens: int = 2000
+    ) -> Dict[str, Any]:
+        """
+        Generate structured output using the fastest healthy provider.
+
+        Args:
+            prompt: The text prompt for generation
+            output_schema: JSON schema for output structure
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            Structured data matching the schema
+        """
+        try:
+            return await self._route(
+                lambda provider: provider.generate_structured(
+                    prompt=prompt,
+                    output_schema=output_schema,
+                    max_tokens=max_tokens
+                )
+            )
+        except ExternalServiceException:
+            if not self._fallback_generator:
+                raise
+            self._fallback_count += 1
+            logger.warning("All text providers failed, using fallback generator")
+            return await self._fallback_generator.generate_structured(
+                prompt=prompt,
+                output_schema=output_schema,
+                max_tokens=max_tokens
+            )
+
+    async def _route(self, call: Callable[[ITextGenerator], Awaitable[Any]]) -> Any:
+        """
+        Run a call against the ranked providers with hedging and failover.
+
+        The best provider is called first. If it has not answered within its
+        hedge delay, the next provider is called as well and the first
+        successful answer wins. A provider error fails over immediately.
+
+        Args:
+            call: Function issuing the request against a given provider
+
+        Returns:
+            Result of the first successful provider call
+
+        Raises:
+            ExternalServiceException: If every provider failed
+        """
+        remaining = self._ranked_providers()
+        if not remaining:
+            raise ExternalServiceException("text-routing", "No active text providers")
+
+        pending: Dict[asyncio.Task, ITextGenerator] = {}
+        hedged: set = set()
+        last_error: Optional[BaseException] = None
+
+        def launch(is_hedge: bool = False) -> None:
+            provider = remaining.pop(0)
+            task = asyncio.create_task(self._timed_call(provider, call))
+            pending[task] = provider
+            if is_hedge:
+                hedged.add(task)
+                self._stats[id(provider)].hedges_launched += 1
+
+        launch()
+
+        try:
+            while pending:
+                timeout = None
+                if remaining and len(pending) == 1:
+                    timeout = self._hedge_delay(next(iter(pending.values())))
+
+                done, _ = await asyncio.wait(
+                    pending.keys(),
+                    timeout=timeout,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not done:
+                    logger.info(f"Hedging text request after {timeout:.2f}s")
+                    launch(is_hedge=True)
+                    continue
+
+                for task in done:
+                    provider = pending.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        if task in hedged:
+                            self._stats[id(provider)].hedge_wins += 1
+                        return task.result()
+                    last_error = error
+                    logger.warning(f"Text provider {provider.provider_name} failed: {error}")
+
+                if not pending and remaining:
+                    launch()
+        finally:
+            for task, provider in pending.items():
+                task.cancel()
+                self._stats[id(provider)].cancellations += 1
+
+        raise ExternalServiceException("text-routing", f"All text providers failed: {last_error}")
+
+    async def _timed_call(
+        self,
+        provider: ITextGenerator,
+        call: Callable[[ITextGenerator], Awaitable[Any]]
+    ) -> Any:
+        """Call a provider and record its latency and outcome."""
+        stats = self._stats[id(provider)]
+        stats.requests += 1
+        started = time.perf_counter()
+        try:
+            result = await call(provider)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            stats.record_failure(time.perf_counter() - started)
+            raise
+        stats.record_success(time.perf_counter() - started)
+        return result
+
+    def _active_providers(self) -> List[ITextGenerator]:
+        """Providers that report themselves as active."""
+        return [p for p in self._providers if getattr(p, 'is_active', True)]
+
+    def _expected_latency(self, provider: ITextGenerator) -> float:
+        """Expected latency used for ranking, penalized by error rate."""
+        stats = self._stats[id(provider)]
+        if stats.sample_count < self._min_samples:
+            latency = self._default_hedge_delay / 2
+        else:
+            latency = stats.percentile(50)
+        return latency * (1 + 4 * stats.error_rate)
+
+    def _ranked_providers(self) -> List[ITextGenerator]:
+        """Active providers ordered by expected latency (stable on ties)."""
+        return sorted(self._active_providers(), key=self._expected_latency)
+
+    def _hedge_delay(self, provider: ITextGenerator) -> float:
+        """Time to wait for a provider before sending a hedged request."""
+        stats = self._stats[id(provider)]
+        if stats.sample_count < self._min_samples:
+            return self._default_hedge_delay
+        return stats.percentile(95)
+
+    def get_status_info(self) -> Dict[str, Any]:
+        """
+        Get routing status and per-provider statistics.
+
+        Returns:
+            Dictionary with status details
+        """
+        return {
+            "provider": self.provider_name,
+            "model": self.model_name,
+            "is_active": self.is_active,
+            "status": "ACTIVE" if self.is_active else "INACTIVE",
+            "fallback_count": self._fallback_count,
+            "providers": [
+                {
+                    "provider": p.provider_name,
+                    "model": p.model_name,
+                    "is_active": getattr(p, 'is_active', True),
+                    "hedge_delay_seconds": self._hedge_delay(p),
+                    **self._stats[id(p)].to_dict()
+                }
+                for p in self._providers
+            ]
+        }
+
+
+@lru_cache(maxsize=1)
+def get_routing_text_generator() -> RoutingTextGenerator:
+    """
+    Get the process-wide routing text generator.
+
+    A single instance is shared so that latency and error statistics
+    accumulate across requests.
+    """
+    from .gemini_text_generator import GeminiTextGenerator
+    from .huggingface_text_generator import HuggingFaceTextGenerator
+
+    providers: List[ITextGenerator] = [
+        GeminiTextGenerator(
+            api_key=settings.GEMINI_API_KEY,
+            model=settings.GEMINI_MODEL,
+            raise_on_error=True
+        )
+    ]
+    if settings.HUGGINGFACE_API_KEY:
+        providers.append(HuggingFaceTextGenerator(
+            api_key=settings.HUGGINGFACE_API_KEY,
+            model=settings.TEXT_GENERATION_MODEL,
+            raise_on_error=True
+        ))
+
+    # Last resort is template text; every provider has already been tried,
+    # so another API attempt would only add a round trip during an outage
+    return RoutingTextGenerator(
+        providers=providers,
+        fallback_generator=GeminiTextGenerator(
+            model=settings.GEMINI_MODEL,
+            templates_only=True
+        ),
+        default_hedge_delay=settings.TEXT_HEDGE_DELAY_SECONDS,
+        min_samples=settings.TEXT_HEDGE_MIN_SAMPLES,
+        window=settings.TEXT_PROVIDER_STATS_WINDOW
+    )
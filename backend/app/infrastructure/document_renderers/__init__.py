@@ -11,6 +11,7 @@ from .infographic_styles import (
     InfographicLayout,
     get_style_preset
 )
+from .style_registry import StyleRegistry, StyleSheet, get_style_registry
 
 __all__ = [
     "InfographicPDFRenderer",
@@ -18,5 +19,8 @@ __all__ = [
     "InfographicColorScheme",
     "InfographicTypography",
     "InfographicLayout",
-    "get_style_preset"
+    "get_style_preset",
+    "StyleRegistry",
+    "StyleSheet",
+    "get_style_registry"
 ]
@@ -3,9 +3,12 @@ Infographic PDF Renderer Implementation.
 Generates professional infographic PDF documents using ReportLab.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
+from dataclasses import astuple, replace
 from datetime import datetime
+import copy
+import io
 import os
 
 from reportlab.lib.pagesizes import letter, A4
@@ -18,9 +21,14 @@ from reportlab.platypus import (
     PageBreak, Table, TableStyle, KeepTogether, Flowable
 )
 from reportlab.pdfgen import canvas
+from reportlab.graphics.shapes import Drawing, Group
 from PIL import Image
 
-from .infographic_styles import InfographicStyle, InfographicColorScheme, get_style_preset
+from ...domain.value_objects.image_asset import ImageAsset, VectorAsset, ChartAsset
+from .infographic_styles import (
+    InfographicStyle, InfographicColorScheme, InfographicTypography, get_style_preset
+)
+from .style_registry import StyleSheet, get_style_registry
 from ...shared.logger import get_logger
 
 logger = get_logger("infographic_pdf_renderer")
@@ -71,16 +79,33 @@ class InfographicPDFRenderer:
         """
         self._style = style or get_style_preset("professional")
         self._page_width, self._page_height = letter
-        self._styles = self._create_paragraph_styles()
+        self._styles = self._stylesheet(self._style)
 
         logger.info("Infographic PDF Renderer initialized")
         logger.info(f"Page size: {self._page_width}x{self._page_height}")
 
-    def _create_paragraph_styles(self) -> Dict[str, ParagraphStyle]:
-        """Create paragraph styles for the document."""
+    @staticmethod
+    def _stylesheet(style: InfographicStyle) -> StyleSheet:
+        """Shared compiled paragraph styles for a style's colors and typography."""
+        return get_style_registry().get(
+            "infographic", astuple(style.colors), astuple(style.typography)
+        )
+
+    @classmethod
+    def _create_paragraph_styles(
+        cls,
+        color_values: Tuple[str, ...],
+        typography_values: Tuple[Any, ...]
+    ) -> Dict[str, ParagraphStyle]:
+        """
+        Create paragraph styles for the document.
+
+        Called by the style registry once per color scheme and typography,
+        given as field tuples so they can key the registry.
+        """
         base_styles = getSampleStyleSheet()
-        typography = self._style.typography
-        color_scheme = self._style.colors
+        typography = InfographicTypography(*typography_values)
+        color_scheme = InfographicColorScheme(*color_values)
 
         custom_styles = {}
 
@@ -90,7 +115,7 @@ class InfographicPDFRenderer:
             parent=base_styles['Heading1'],
             fontName=typography.heading_font,
             fontSize=typography.cover_title_size,
-            textColor=self._hex_to_color(color_scheme.background),
+            textColor=cls._hex_to_color(color_scheme.background),
             alignment=TA_CENTER,
             spaceAfter=20
         )
@@ -101,18 +126,37 @@ class InfographicPDFRenderer:
             parent=base_styles['Normal'],
             fontName=typography.body_font,
             fontSize=typography.cover_subtitle_size,
-            textColor=self._hex_to_color('#e5e7eb'),
+            textColor=cls._hex_to_color('#e5e7eb'),
             alignment=TA_CENTER,
             spaceAfter=10
         )
 
+        # Cover title on the light cover page
+        custom_styles['CoverTitleDark'] = ParagraphStyle(
+            'CoverTitleDark',
+            fontName=typography.heading_font,
+            fontSize=typography.cover_title_size,
+            textColor=cls._hex_to_color(color_scheme.primary),
+            alignment=TA_CENTER,
+            spaceAfter=20
+        )
+
+        # Cover metadata (author, date)
+        custom_styles['CoverMeta'] = ParagraphStyle(
+            'CoverMeta',
+            fontName=typography.body_font,
+            fontSize=typography.body_size,
+            textColor=cls._hex_to_color(color_scheme.text_light),
+            alignment=TA_CENTER
+        )
+
         # Section heading
         custom_styles['SectionHeading'] = ParagraphStyle(
             'SectionHeading',
             parent=base_styles['Heading1'],
             fontName=typography.heading_font,
             fontSize=typography.section_heading_size,
-            textColor=self._hex_to_color(color_scheme.primary),
+            textColor=cls._hex_to_color(color_scheme.primary),
             spaceBefore=20,
             spaceAfter=12,
             leading=typography.section_heading_size * typography.heading_line_height
@@ -124,7 +168,7 @@ class InfographicPDFRenderer:
             parent=base_styles['Heading2'],
             fontName=typography.heading_font,
             fontSize=typography.subsection_heading_size,
-            textColor=self._hex_to_color(color_scheme.secondary),
+            textColor=cls._hex_to_color(color_scheme.secondary),
             spaceBefore=15,
             spaceAfter=8,
             leftIndent=20
@@ -136,7 +180,7 @@ class InfographicPDFRenderer:
             parent=base_styles['Normal'],
             fontName=typography.body_font,
             fontSize=typography.body_size,
-            textColor=self._hex_to_color(color_scheme.text_dark),
+            textColor=cls._hex_to_color(color_scheme.text_dark),
             alignment=TA_JUSTIFY,
             spaceBefore=6,
             spaceAfter=6,
@@ -163,7 +207,7 @@ class InfographicPDFRenderer:
             parent=base_styles['Normal'],
             fontName=typography.accent_font,
             fontSize=typography.caption_size,
-            textColor=self._hex_to_color(color_scheme.text_light),
+            textColor=cls._hex_to_color(color_scheme.text_light),
             alignment=TA_CENTER,
             spaceBefore=5,
             spaceAfter=15
@@ -175,7 +219,7 @@ class InfographicPDFRenderer:
             parent=base_styles['Normal'],
             fontName=typography.heading_font,
             fontSize=typography.section_heading_size,
-            textColor=self._hex_to_color(color_scheme.accent),
+            textColor=cls._hex_to_color(color_scheme.accent),
             alignment=TA_CENTER,
             spaceBefore=10,
             spaceAfter=5
@@ -183,7 +227,8 @@ class InfographicPDFRenderer:
 
         return custom_styles
 
-    def _hex_to_color(self, hex_color: str) -> colors.Color:
+    @staticmethod
+    def _hex_to_color(hex_color: str) -> colors.Color:
         """Convert hex color to ReportLab Color."""
         hex_color = hex_color.lstrip('#')
         r = int(hex_color[0:2], 16) / 255.0
@@ -195,8 +240,8 @@ class InfographicPDFRenderer:
         self,
         title: str,
         sections: List[Dict[str, Any]],
-        charts: List[Path],
-        illustrations: List[Path],
+        charts: List[ChartAsset],
+        illustrations: List[ImageAsset],
         output_path: Path,
         logo_path: Optional[Path] = None,
         include_cover: bool = True,
@@ -208,8 +253,8 @@ class InfographicPDFRenderer:
         Args:
             title: Document title
             sections: List of section dictionaries with 'heading' and 'content' keys
-            charts: List of paths to chart images
-            illustrations: List of paths to illustration images
+            charts: Chart images or vector drawings (in memory, with dimensions)
+            illustrations: Illustration images (in memory, with dimensions)
             output_path: Path to save the PDF
             logo_path: Optional path to logo image
             include_cover: Whether to include a cover page
@@ -287,29 +332,25 @@ class InfographicPDFRenderer:
 
                 # Add chart if available and this is a good position
                 if chart_index < len(charts) and j == 0:
-                    chart_path = charts[chart_index]
-                    if chart_path.exists():
-                        story.append(Spacer(1, 15))
-                        story.extend(self._add_image(
-                            chart_path,
-                            self._style.layout.chart_width,
-                            self._style.layout.chart_height,
-                            caption=f"Figure {chart_index + 1}"
-                        ))
-                        chart_index += 1
-
-            # Add illustration at end of section
-            if illustration_index < len(illustrations):
-                illus_path = illustrations[illustration_index]
-                if illus_path.exists():
                     story.append(Spacer(1, 15))
                     story.extend(self._add_image(
-                        illus_path,
-                        self._style.layout.illustration_width,
-                        self._style.layout.illustration_height,
-                        caption=f"Illustration: {heading_text}"
+                        charts[chart_index],
+                        self._style.layout.chart_width,
+                        self._style.layout.chart_height,
+                        caption=f"Figure {chart_index + 1}"
                     ))
-                    illustration_index += 1
+                    chart_index += 1
+
+            # Add illustration at end of section
+            if illustration_index < len(illustrations):
+                story.append(Spacer(1, 15))
+                story.extend(self._add_image(
+                    illustrations[illustration_index],
+                    self._style.layout.illustration_width,
+                    self._style.layout.illustration_height,
+                    caption=f"Illustration: {heading_text}"
+                ))
+                illustration_index += 1
 
             # Add spacing between sections
             story.append(Spacer(1, self._style.layout.section_spacing))
@@ -372,15 +413,7 @@ class InfographicPDFRenderer:
         elements.append(Spacer(1, 0.3 * inch))
 
         # Title with custom background simulation using table
-        title_style = ParagraphStyle(
-            'CoverTitleDark',
-            fontName=self._style.typography.heading_font,
-            fontSize=self._style.typography.cover_title_size,
-            textColor=self._hex_to_color(color_scheme.primary),
-            alignment=TA_CENTER,
-            spaceAfter=20
-        )
-        elements.append(Paragraph(title, title_style))
+        elements.append(Paragraph(title, self._styles['CoverTitleDark']))
 
         # Another decorative line
         elements.append(Spacer(1, 0.2 * inch))
@@ -392,13 +425,7 @@ class InfographicPDFRenderer:
         author = metadata.get('author', '')
         date = metadata.get('date', datetime.now().strftime("%B %d, %Y"))
 
-        meta_style = ParagraphStyle(
-            'CoverMeta',
-            fontName=self._style.typography.body_font,
-            fontSize=self._style.typography.body_size,
-            textColor=self._hex_to_color(color_scheme.text_light),
-            alignment=TA_CENTER
-        )
+        meta_style = self._styles['CoverMeta']
 
         if author:
             elements.append(Paragraph(f"Prepared by: {author}", meta_style))
@@ -433,19 +460,17 @@ class InfographicPDFRenderer:
 
     def _add_image(
         self,
-        image_path: Path,
+        image: ChartAsset,
         max_width: float,
         max_height: float,
         caption: Optional[str] = None
     ) -> List[Flowable]:
-        """Add an image with optional caption."""
+        """Add an in-memory image or vector drawing with optional caption."""
         elements = []
 
         try:
-            # Get image dimensions
-            img = Image.open(image_path)
-            img_width, img_height = img.size
-            aspect = img_width / img_height
+            # Dimensions travel with the asset, the image is not decoded here
+            aspect = image.aspect_ratio
 
             # Calculate display dimensions
             if aspect > (max_width / max_height):
@@ -455,12 +480,15 @@ class InfographicPDFRenderer:
                 display_height = max_height
                 display_width = display_height * aspect
 
-            # Create ReportLab image
-            rl_image = RLImage(
-                str(image_path),
-                width=display_width,
-                height=display_height
-            )
+            if isinstance(image, VectorAsset):
+                # Vector drawings are embedded as PDF graphics, scaled to fit
+                rl_image = self._scaled_drawing(image, display_width / image.width)
+            else:
+                rl_image = RLImage(
+                    io.BytesIO(image.data),
+                    width=display_width,
+                    height=display_height
+                )
             rl_image.hAlign = 'CENTER'
 
             elements.append(rl_image)
@@ -470,10 +498,22 @@ class InfographicPDFRenderer:
                 elements.append(Paragraph(caption, self._styles['Caption']))
 
         except Exception as e:
-            logger.error(f"Failed to add image {image_path}: {e}")
+            logger.error(f"Failed to add image {image.name}: {e}")
 
         return elements
 
+    @staticmethod
+    def _scaled_drawing(asset: VectorAsset, scale: float) -> Drawing:
+        """Wrap a reportlab drawing in a scaled drawing, leaving the original untouched."""
+        if asset.kind != "reportlab":
+            raise ValueError(f"Unsupported vector drawing kind: {asset.kind}")
+        drawing = asset.drawing
+        return Drawing(
+            drawing.width * scale,
+            drawing.height * scale,
+            Group(*drawing.contents, transform=(scale, 0, 0, scale, 0, 0))
+        )
+
     def _add_page_elements(self, canvas: canvas.Canvas, doc) -> None:
         """Add header and footer to each page."""
         canvas.saveState()
@@ -514,18 +554,50 @@ class InfographicPDFRenderer:
         """
         Set custom colors for the document.
 
+        Prefer with_colors() when the renderer is shared between requests.
+
         Args:
             colors: List of hex color codes
         """
-        self._style.colors = InfographicColorScheme.from_hex_list(colors)
-        self._styles = self._create_paragraph_styles()
+        # Replace the style rather than modify it: it may be a shared preset
+        self._style = replace(self._style, colors=InfographicColorScheme.from_hex_list(colors))
+        self._styles = self._stylesheet(self._style)
         logger.info(f"Document colors updated: {colors}")
 
+    def with_colors(self, colors: List[str]) -> "InfographicPDFRenderer":
+        """
+        Get a renderer for one document's colors.
+
+        This renderer is left unchanged, so concurrent renders with
+        different colors do not interfere. Paragraph styles come from the
+        style registry and are shared, not rebuilt.
+
+        Args:
+            colors: List of hex color codes
+
+        Returns:
+            Renderer using the given colors
+        """
+        renderer = copy.copy(self)
+        renderer._style = replace(self._style, colors=InfographicColorScheme.from_hex_list(colors))
+        renderer._styles = self._stylesheet(renderer._style)
+        return renderer
+
+    @property
+    def chart_placement(self) -> Tuple[float, float]:
+        """Box charts are fitted into, as (width, height) in inches."""
+        layout = self._style.layout
+        return layout.chart_width / inch, layout.chart_height / inch
+
     def get_status(self) -> Dict[str, Any]:
         """Get renderer status information."""
         return {
             "renderer": "InfographicPDFRenderer",
             "page_size": "letter",
             "style_preset": "custom",
-            "primary_color": self._style.colors.primary
+            "primary_color": self._style.colors.primary,
+            "style_registry": get_style_registry().get_metrics()
         }
+
+
+get_style_registry().register("infographic", InfographicPDFRenderer._create_paragraph_styles)
@@ -0,0 +1,97 @@
+"""
+Paragraph Style Registry.
+Compiles ReportLab paragraph stylesheets once and shares them read-only.
+"""
+
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Hashable, Mapping
+
+from reportlab.lib.styles import ParagraphStyle
+
+from ...shared.logger import get_logger
+from ...config import settings
+
+logger = get_logger("style_registry")
+
+# A compiled stylesheet: style name to paragraph style, read-only
+StyleSheet = Mapping[str, ParagraphStyle]
+
+
+class StyleRegistry:
+    """
+    Compiled paragraph stylesheets, keyed by document type and parameters.
+
+    Each document type registers a builder. The first request for a
+    (document type, parameters) combination, such as an infographic color
+    scheme, runs the builder; later requests get the same stylesheet
+    object. Least recently used combinations are evicted past max_entries.
+
+    Stylesheets are read-only mappings shared by every renderer and
+    request, so they must never be modified; derive a new ParagraphStyle
+    (parent=...) instead.
+    """
+
+    def __init__(self, max_entries: int):
+        """
+        Initialize the registry.
+
+        Args:
+            max_entries: Maximum compiled stylesheets kept
+        """
+        self._builders: Dict[str, Callable[..., Dict[str, ParagraphStyle]]] = {}
+        self._max_entries = max_entries
+        self._compile = lru_cache(maxsize=max_entries)(self._build)
+
+    def register(self, document_type: str, builder: Callable[..., Dict[str, ParagraphStyle]]) -> None:
+        """
+        Register the stylesheet builder for a document type.
+
+        Args:
+            document_type: Name used in lookups (e.g. "infographic")
+            builder: Called with the lookup parameters; returns name to style
+        """
+        self._builders[document_type] = builder
+
+    def get(self, document_type: str, *params: Hashable) -> StyleSheet:
+        """
+        Get the compiled stylesheet for a document type.
+
+        Args:
+            document_type: Registered document type
+            *params: Hashable builder arguments (e.g. a color tuple)
+
+        Returns:
+            Read-only stylesheet shared with other callers
+
+        Raises:
+            KeyError: If no builder is registered for the document type
+        """
+        if document_type not in self._builders:
+            raise KeyError(f"No stylesheet registered for document type: {document_type}")
+        return self._compile(document_type, params)
+
+    def _build(self, document_type: str, params: tuple) -> StyleSheet:
+        """Run a builder and freeze its result."""
+        styles = self._builders[document_type](*params)
+        logger.debug(f"Compiled {document_type} stylesheet ({len(styles)} styles)")
+        return MappingProxyType(dict(styles))
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get registry metrics."""
+        info = self._compile.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            "document_types": sorted(self._builders),
+            "entries": info.currsize,
+            "max_entries": self._max_entries,
+            "hits": info.hits,
+            "misses": info.misses,
+            "hit_rate": round(info.hits / lookups, 3) if lookups else 0.0
+        }
+
+
+@lru_cache()
+def get_style_registry() -> StyleRegistry:
+    """Get the process-wide style registry."""
+    return StyleRegistry(max_entries=settings.STYLE_REGISTRY_MAX_ENTRIES)
@@ -1,6 +1,6 @@
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
-from pymongo.server_api import ServerApi
 from app.config import settings
+from app.infrastructure.persistence.mongo_client import get_mongo_client, close_mongo_client
 import ssl
 import certifi
 
@@ -33,13 +33,8 @@ async def connect_to_mongo():
         print(f"Python SSL version: {ssl.OPENSSL_VERSION}")
         print(f"Certifi CA bundle location: {certifi.where()}")
 
-        # MongoDB Atlas connection with Stable API v1
-        # This is required by newer MongoDB Atlas clusters
-        db.client = AsyncIOMotorClient(
-            settings.MONGODB_URL,
-            server_api=ServerApi('1'),
-            serverSelectionTimeoutMS=30000
-        )
+        # Shared client (Stable API v1, required by newer Atlas clusters)
+        db.client = get_mongo_client()
 
         # Test the connection
         print("Testing connection with ping...")
@@ -67,7 +62,8 @@ async def connect_to_mongo():
 async def close_mongo_connection():
     """Close MongoDB connection"""
     if db.client:
-        db.client.close()
+        close_mongo_client()
+        db.client = None
         print("Closed MongoDB connection")
 
 
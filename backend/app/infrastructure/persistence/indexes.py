@@ -0,0 +1,177 @@
+"""
+MongoDB Index Registry.
+Declares the indexes behind the hot lookups and creates them at startup.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import ConnectionFailure, PyMongoError
+
+from ...shared.logger import get_logger
+from ...config import settings
+
+logger = get_logger("mongo_indexes")
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """
+    One index on one collection.
+
+    Attributes:
+        collection: Collection name (GridFS buckets: "<bucket>.files")
+        keys: (field, direction) pairs
+        name: Index name; fixed so re-running creation is a no-op
+        unique: Reject duplicate values
+        sparse: Skip documents without the field
+        expire_after_seconds: Make it a TTL index (date field + this many seconds)
+        reason: Query the index serves (shown in the usage report)
+    """
+    collection: str
+    keys: Tuple[Tuple[str, int], ...]
+    name: str
+    unique: bool = False
+    sparse: bool = False
+    expire_after_seconds: Optional[int] = None
+    reason: str = ""
+
+    def to_model(self) -> IndexModel:
+        """Convert to a pymongo IndexModel."""
+        options: Dict[str, Any] = {"name": self.name}
+        if self.unique:
+            options["unique"] = True
+        if self.sparse:
+            options["sparse"] = True
+        if self.expire_after_seconds is not None:
+            options["expireAfterSeconds"] = self.expire_after_seconds
+        return IndexModel(list(self.keys), **options)
+
+
+INDEXES: Tuple[IndexSpec, ...] = (
+    # Generated documents
+    IndexSpec("pdfs.files", (("metadata.job_id", ASCENDING),), "metadata_job_id",
+              reason="GridFSStorage.open_pdf / get_file_info by job"),
+    IndexSpec("logos.files", (("metadata.job_id", ASCENDING),), "metadata_job_id",
+              reason="logo lookup by job"),
+    IndexSpec("generation_jobs", (("job_id", ASCENDING),), "job_id_unique", unique=True,
+              reason="/generate/status and downloads by job"),
+    IndexSpec("generation_jobs", (("created_at", DESCENDING),), "created_at",
+              reason="dashboard document counts by date, retention of jobs without expire_at"),
+    # Only with retention on; turning it off later does not drop an existing TTL index
+    *((IndexSpec("generation_jobs", (("expire_at", ASCENDING),), "expire_at_ttl",
+                 expire_after_seconds=settings.RETENTION_TTL_GRACE_SECONDS,
+                 reason="retention sweep; TTL backstop when no sweeper runs"),)
+      if settings.RETENTION_ENABLED else ()),
+    IndexSpec("pdfs.files", (("metadata.expire_at", ASCENDING),), "metadata_expire_at", sparse=True,
+              reason="retention sweep of PDFs whose job is gone"),
+    IndexSpec("documents", (("user_id", ASCENDING), ("created_at", DESCENDING)), "user_id_created_at",
+              reason="a user's documents, newest first"),
+
+    # Authentication
+    IndexSpec("admins", (("username", ASCENDING),), "username_unique", unique=True,
+              reason="admin login and token checks"),
+    IndexSpec("admins", (("email", ASCENDING),), "email_unique", unique=True,
+              reason="admin registration duplicate check"),
+    IndexSpec("admin_sessions", (("last_activity", DESCENDING),), "last_activity",
+              reason="dashboard active admin counts"),
+    IndexSpec("referral_keys", (("key", ASCENDING),), "key_unique", unique=True,
+              reason="referral key validation and deletion"),
+    IndexSpec("users", (("email", ASCENDING),), "email_unique", unique=True,
+              reason="user login and registration"),
+    IndexSpec("users", (("username", ASCENDING),), "username",
+              reason="registration email-or-username duplicate check"),
+    IndexSpec("users", (("id", ASCENDING),), "id", sparse=True,
+              reason="user lookup by application id"),
+)
+
+
+def _by_collection(specs: Sequence[IndexSpec]) -> Dict[str, List[IndexSpec]]:
+    """Group index specs by collection, keeping declaration order."""
+    grouped: Dict[str, List[IndexSpec]] = {}
+    for spec in specs:
+        grouped.setdefault(spec.collection, []).append(spec)
+    return grouped
+
+
+async def ensure_indexes(
+    db: AsyncIOMotorDatabase,
+    specs: Sequence[IndexSpec] = INDEXES
+) -> Dict[str, Any]:
+    """
+    Create the declared indexes.
+
+    Idempotent: existing indexes with the same name and options are left
+    alone. A collection that fails (for example duplicates blocking a
+    unique index) is logged and skipped so startup continues; when the
+    server is unreachable the remaining collections are skipped too.
+
+    Args:
+        db: MongoDB database
+        specs: Indexes to create (default: INDEXES)
+
+    Returns:
+        {"created": {collection: [names]}, "failed": {collection: error}}
+    """
+    created: Dict[str, List[str]] = {}
+    failed: Dict[str, str] = {}
+
+    for collection, collection_specs in _by_collection(specs).items():
+        try:
+            names = await db[collection].create_indexes([spec.to_model() for spec in collection_specs])
+            created[collection] = names
+        except ConnectionFailure as e:
+            failed[collection] = str(e)
+            logger.warning(f"Index creation skipped, MongoDB unreachable: {e}")
+            break
+        except PyMongoError as e:
+            failed[collection] = str(e)
+            logger.warning(f"Index creation failed for {collection}: {e}")
+
+    logger.info(f"Indexes ensured on {len(created)} collections"
+                + (f", {len(failed)} failed" if failed else ""))
+    return {"created": created, "failed": failed}
+
+
+async def index_usage_report(
+    db: AsyncIOMotorDatabase,
+    specs: Sequence[IndexSpec] = INDEXES
+) -> List[Dict[str, Any]]:
+    """
+    Report index usage from $indexStats for the registered collections.
+
+    Args:
+        db: MongoDB database
+        specs: Registered indexes (default: INDEXES)
+
+    Returns:
+        One entry per index: collection, name, key, ops since the server
+        started tracking, tracking start, whether it is registered here
+        and the query it serves
+    """
+    registered = {(spec.collection, spec.name): spec for spec in specs}
+    report: List[Dict[str, Any]] = []
+
+    for collection in _by_collection(specs):
+        try:
+            stats = await db[collection].aggregate([{"$indexStats": {}}]).to_list(length=None)
+        except PyMongoError as e:
+            logger.warning(f"$indexStats failed for {collection}: {e}")
+            continue
+
+        for entry in stats:
+            spec: Optional[IndexSpec] = registered.get((collection, entry["name"]))
+            accesses = entry.get("accesses", {})
+            report.append({
+                "collection": collection,
+                "name": entry["name"],
+                "key": dict(entry.get("key", {})),
+                "ops": int(accesses.get("ops", 0)),
+                "since": accesses.get("since"),
+                "registered": spec is not None,
+                "reason": spec.reason if spec else ""
+            })
+
+    return sorted(report, key=lambda item: (item["collection"], -item["ops"]))
@@ -0,0 +1,211 @@
+"""
+MongoDB Client Factory.
+One tuned Motor client per process, shared by every entry point.
+"""
+
+import time
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Any, Dict, List
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import ReadPreference
+from pymongo.monitoring import (
+    ConnectionPoolListener,
+    ConnectionCheckOutStartedEvent,
+    ConnectionCheckedOutEvent,
+    ConnectionCheckOutFailedEvent
+)
+from pymongo.server_api import ServerApi
+
+try:
+    import zstandard  # noqa: F401
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import snappy  # noqa: F401
+    SNAPPY_AVAILABLE = True
+except ImportError:
+    SNAPPY_AVAILABLE = False
+
+from ...shared.logger import get_logger
+from ...config import settings
+
+logger = get_logger("mongo_client")
+
+READ_PREFERENCES = {
+    "primary": ReadPreference.PRIMARY,
+    "primaryPreferred": ReadPreference.PRIMARY_PREFERRED,
+    "secondary": ReadPreference.SECONDARY,
+    "secondaryPreferred": ReadPreference.SECONDARY_PREFERRED,
+    "nearest": ReadPreference.NEAREST
+}
+
+
+class PoolMetricsListener(ConnectionPoolListener):
+    """
+    Connection pool checkout-wait metrics.
+
+    A checkout waits when every pooled connection is in use (or still
+    being established); sustained waits mean maxPoolSize is too small
+    for the worker's concurrency. Checkouts happen in pymongo's worker
+    threads, so the start time is kept per thread; newer pymongo
+    versions report the duration on the event itself.
+    """
+
+    # Recent checkout waits kept for percentiles
+    WINDOW = 1000
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._waits: deque = deque(maxlen=self.WINDOW)
+        self._checkouts = 0
+        self._failures = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._open = 0
+
+    def _elapsed(self, event: Any) -> float:
+        """Checkout wait in seconds for a checked-out or failed event."""
+        duration = getattr(event, "duration", None)
+        if duration is not None:
+            return duration
+        started = getattr(self._local, "started", None)
+        return time.monotonic() - started if started is not None else 0.0
+
+    def connection_check_out_started(self, event: ConnectionCheckOutStartedEvent) -> None:
+        self._local.started = time.monotonic()
+
+    def connection_checked_out(self, event: ConnectionCheckedOutEvent) -> None:
+        wait = self._elapsed(event)
+        with self._lock:
+            self._checkouts += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+            self._waits.append(wait)
+
+    def connection_check_out_failed(self, event: ConnectionCheckOutFailedEvent) -> None:
+        wait = self._elapsed(event)
+        with self._lock:
+            self._failures += 1
+            self._max_wait = max(self._max_wait, wait)
+            logger.warning(f"MongoDB connection checkout failed after {wait:.3f}s: {event.reason}")
+
+    def connection_created(self, event) -> None:
+        with self._lock:
+            self._open += 1
+
+    def connection_closed(self, event) -> None:
+        with self._lock:
+            self._open -= 1
+
+    # Remaining pool events are not tracked
+    def pool_created(self, event) -> None:
+        pass
+
+    def pool_ready(self, event) -> None:
+        pass
+
+    def pool_cleared(self, event) -> None:
+        pass
+
+    def pool_closed(self, event) -> None:
+        pass
+
+    def connection_ready(self, event) -> None:
+        pass
+
+    def connection_checked_in(self, event) -> None:
+        pass
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get checkout-wait metrics (milliseconds) and open connections."""
+        with self._lock:
+            waits: List[float] = sorted(self._waits)
+            checkouts, failures = self._checkouts, self._failures
+            total_wait, max_wait, open_connections = self._total_wait, self._max_wait, self._open
+
+        def percentile(q: float) -> float:
+            return round(waits[min(len(waits) - 1, int(q * len(waits)))] * 1000, 3) if waits else 0.0
+
+        return {
+            "open_connections": open_connections,
+            "max_pool_size": settings.MONGODB_MAX_POOL_SIZE,
+            "checkouts": checkouts,
+            "checkout_failures": failures,
+            "wait_ms_avg": round(total_wait / checkouts * 1000, 3) if checkouts else 0.0,
+            "wait_ms_p50": percentile(0.5),
+            "wait_ms_p95": percentile(0.95),
+            "wait_ms_max": round(max_wait * 1000, 3)
+        }
+
+
+def _compressors() -> List[str]:
+    """Configured wire compressors that are installed, in preference order."""
+    available = {"zstd": ZSTD_AVAILABLE, "snappy": SNAPPY_AVAILABLE, "zlib": True}
+    names = [name.strip() for name in settings.MONGODB_COMPRESSORS.split(",") if name.strip()]
+    return [name for name in names if available.get(name)]
+
+
+@lru_cache(maxsize=1)
+def get_pool_metrics_listener() -> PoolMetricsListener:
+    """Get the process-wide pool metrics listener."""
+    return PoolMetricsListener()
+
+
+@lru_cache(maxsize=1)
+def get_mongo_client() -> AsyncIOMotorClient:
+    """
+    Get the process-wide Motor client.
+
+    Every gunicorn worker is a process with its own pool, so the pool
+    bounds (MONGODB_MAX_POOL_SIZE and friends) apply per worker: size
+    them so workers x maxPoolSize stays within the cluster's connection
+    limit.
+    """
+    compressors = _compressors()
+    client = AsyncIOMotorClient(
+        settings.MONGODB_URL,
+        server_api=ServerApi("1"),
+        appname=settings.APP_NAME,
+        maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+        minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+        maxIdleTimeMS=settings.MONGODB_MAX_IDLE_TIME_MS,
+        maxConnecting=settings.MONGODB_MAX_CONNECTING,
+        serverSelectionTimeoutMS=settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+        event_listeners=[get_pool_metrics_listener()],
+        **({"compressors": ",".join(compressors)} if compressors else {})
+    )
+    logger.info(f"MongoDB client created (pool {settings.MONGODB_MIN_POOL_SIZE}-"
+                f"{settings.MONGODB_MAX_POOL_SIZE}, compressors: {', '.join(compressors) or 'none'})")
+    return client
+
+
+def get_mongo_database() -> AsyncIOMotorDatabase:
+    """Get the application database on the shared client."""
+    return get_mongo_client()[settings.MONGODB_DB_NAME]
+
+
+def get_analytics_database() -> AsyncIOMotorDatabase:
+    """
+    Get the application database for read-only analytics queries.
+
+    Reads use MONGODB_ANALYTICS_READ_PREFERENCE (secondaries by default),
+    keeping dashboards and reports off the primary. Results may lag
+    slightly behind recent writes.
+    """
+    return get_mongo_client().get_database(
+        settings.MONGODB_DB_NAME,
+        read_preference=READ_PREFERENCES[settings.MONGODB_ANALYTICS_READ_PREFERENCE]
+    )
+
+
+def close_mongo_client() -> None:
+    """Close the shared client (the next get_mongo_client creates a new one)."""
+    if get_mongo_client.cache_info().currsize:
+        get_mongo_client().close()
+        get_mongo_client.cache_clear()
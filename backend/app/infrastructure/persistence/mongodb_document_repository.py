@@ -30,15 +30,17 @@ class MongoDBDocumentRepository(IDocumentRepository):
         """
         self._db = database
         self._collection_name = "documents"
+        self._collection = database[self._collection_name] if database is not None else None
 
     async def _get_collection(self):
-        """Get documents collection."""
-        if not self._db:
+        """Get documents collection (resolved once, then reused)."""
+        if self._collection is None:
             try:
                 self._db = get_database()
             except Exception:
                 return None
-        return self._db[self._collection_name] if self._db else None
+            self._collection = self._db[self._collection_name]
+        return self._collection
 
     async def save_document(
         self,
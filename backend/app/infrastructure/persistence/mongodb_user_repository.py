@@ -7,6 +7,7 @@ import logging
 from typing import Optional, List
 from datetime import datetime
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import DuplicateKeyError
 import bcrypt
 
 from ...domain.interfaces.user_repository import IUserRepository
@@ -65,7 +66,11 @@ class MongoDBUserRepository(IUserRepository):
         if "name" in user_dict and "username" not in user_dict:
             user_dict["username"] = user_dict["name"]
 
-        result = await self._collection.insert_one(user_dict)
+        try:
+            result = await self._collection.insert_one(user_dict)
+        except DuplicateKeyError:
+            # Registered concurrently; the unique email index rejected the second insert
+            raise EntityExistsException("User", user.email)
 
         if not result.inserted_id:
             raise Exception("Failed to create user")
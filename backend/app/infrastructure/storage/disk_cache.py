@@ -0,0 +1,392 @@
+"""
+Disk Cache Implementation.
+Content-addressed, size-bounded byte cache on local disk.
+"""
+
+import os
+import json
+import time
+import uuid
+import asyncio
+import hashlib
+from pathlib import Path
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    fcntl = None
+    FCNTL_AVAILABLE = False
+
+from ...shared.logger import get_logger
+from ...config import settings
+
+logger = get_logger("disk_cache")
+
+
+def content_key(**fields: Any) -> str:
+    """
+    Build a cache key from the fields that determine the cached content.
+
+    Args:
+        **fields: JSON-serializable values (order does not matter)
+
+    Returns:
+        SHA-256 hex digest of the canonical JSON encoding
+    """
+    canonical = json.dumps(fields, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class DiskLRUCache:
+    """
+    Byte cache stored as one file per key under a directory.
+
+    The file system is the index, so every worker process pointed at the
+    same directory shares the cache:
+    - Entries are written to a temporary file and renamed into place
+    - A hit refreshes the entry's mtime, which serves as the LRU order
+    - When the directory exceeds its size bound, the least recently used
+      entries are deleted under an exclusive lock
+    - Temporary files left by killed workers are deleted at startup and
+      on eviction passes once older than TEMP_GRACE_SECONDS
+    """
+
+    # Rescan the directory after this many local writes, since other
+    # workers' writes are not reflected in the local size estimate
+    RESCAN_EVERY_WRITES = 32
+
+    # Age after which an unfinished temporary file is considered abandoned
+    TEMP_GRACE_SECONDS = 3600
+
+    def __init__(self, directory: Path, max_bytes: int, name: str = "cache"):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Cache directory (created if missing)
+            max_bytes: Upper bound for the total size of cached entries
+            name: Cache name used in logs and metrics
+        """
+        self._directory = Path(directory)
+        self._max_bytes = max_bytes
+        self._name = name
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+        self._bytes_served = 0
+        self._bytes_written = 0
+        self._bytes_evicted = 0
+        self._writes_since_scan = 0
+        self._remove_stale_temps()
+        self._size_estimate, self._entry_count = self._scan_size()
+
+        logger.info(f"Disk cache '{name}' at {self._directory} "
+                    f"({self._entry_count} entries, {self._size_estimate} bytes, "
+                    f"max {self._max_bytes} bytes)")
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Read an entry without blocking the event loop (None on miss)."""
+        return await asyncio.to_thread(self.get_sync, key)
+
+    async def put(self, key: str, data: bytes) -> None:
+        """Store an entry without blocking the event loop."""
+        await asyncio.to_thread(self.put_sync, key, data)
+
+    def get_sync(self, key: str) -> Optional[bytes]:
+        """
+        Read an entry and mark it as recently used.
+
+        Args:
+            key: Entry key (see content_key)
+
+        Returns:
+            Cached bytes, or None on a miss
+        """
+        path = self._path_for(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            self._misses += 1
+            return None
+        except OSError as e:
+            logger.warning(f"Disk cache '{self._name}' read failed for {key[:12]}: {e}")
+            self._misses += 1
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass  # Evicted by another worker in the meantime
+        self._hits += 1
+        self._bytes_served += len(data)
+        return data
+
+    def put_sync(self, key: str, data: bytes) -> None:
+        """
+        Atomically store an entry, evicting old entries past the size bound.
+
+        Args:
+            key: Entry key (see content_key)
+            data: Bytes to cache
+        """
+        if not data or len(data) > self._max_bytes:
+            return
+
+        tmp_path = self.temp_path()
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+        except OSError as e:
+            logger.warning(f"Disk cache '{self._name}' write failed for {key[:12]}: {e}")
+            self._discard_temp(tmp_path)
+            return
+
+        self.adopt_sync(key, tmp_path)
+
+    def temp_path(self) -> Path:
+        """
+        Path for writing a future entry incrementally (see adopt_sync).
+
+        The file lives inside the cache directory, so adopting it is a
+        rename on the same file system.
+        """
+        return self._directory / f".{os.getpid()}.{uuid.uuid4().hex}.tmp"
+
+    def adopt_sync(self, key: str, tmp_path: Path) -> None:
+        """
+        Atomically move a fully written temp_path() file into place as an entry.
+
+        The temporary file is removed if it cannot be adopted.
+
+        Args:
+            key: Entry key
+            tmp_path: File from temp_path()
+        """
+        path = self._path_for(key)
+        try:
+            size = tmp_path.stat().st_size
+            if not size or size > self._max_bytes:
+                self._discard_temp(tmp_path)
+                return
+            replaced = path.exists()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Disk cache '{self._name}' write failed for {key[:12]}: {e}")
+            self._discard_temp(tmp_path)
+            return
+
+        self._writes += 1
+        self._bytes_written += size
+        if not replaced:
+            self._size_estimate += size
+            self._entry_count += 1
+        self._writes_since_scan += 1
+
+        if (self._size_estimate > self._max_bytes
+                or self._writes_since_scan >= self.RESCAN_EVERY_WRITES):
+            self._evict()
+
+    def path_sync(self, key: str) -> Optional[Path]:
+        """
+        Locate an entry for serving straight from disk and mark it as recently used.
+
+        Args:
+            key: Entry key
+
+        Returns:
+            Entry path, or None on a miss. The entry may still be evicted by
+            another worker, so open it promptly and handle FileNotFoundError.
+        """
+        path = self._path_for(key)
+        try:
+            os.utime(path)
+            size = path.stat().st_size
+        except OSError:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._bytes_served += size
+        return path
+
+    def discard_sync(self, key: str) -> None:
+        """Delete an entry (for example one that failed verification)."""
+        path = self._path_for(key)
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except OSError:
+            return
+        self._size_estimate = max(0, self._size_estimate - size)
+        self._entry_count = max(0, self._entry_count - 1)
+
+    def contains(self, key: str) -> bool:
+        """Check if an entry exists (does not count as a hit)."""
+        return self._path_for(key).exists()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get cache metrics for this process.
+
+        Returns:
+            Dictionary with hit/miss counts, byte counters and current size
+        """
+        lookups = self._hits + self._misses
+        return {
+            "name": self._name,
+            "directory": str(self._directory),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+            "writes": self._writes,
+            "evictions": self._evictions,
+            "bytes_served": self._bytes_served,
+            "bytes_written": self._bytes_written,
+            "bytes_evicted": self._bytes_evicted,
+            "entries": self._entry_count,
+            "size_bytes": self._size_estimate,
+            "max_bytes": self._max_bytes
+        }
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _discard_temp(tmp_path: Path) -> None:
+        """Remove an abandoned temporary file."""
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+    def _path_for(self, key: str) -> Path:
+        """Entry path, fanned out by key prefix to keep directories small."""
+        return self._directory / key[:2] / f"{key}.bin"
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        """List (mtime, size, path) for every entry."""
+        entries = []
+        for subdir in self._directory.iterdir():
+            if not subdir.is_dir():
+                continue
+            for entry in os.scandir(subdir):
+                if not entry.name.endswith(".bin"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+        return entries
+
+    def _remove_stale_temps(self) -> None:
+        """Delete temporary files older than TEMP_GRACE_SECONDS (writers killed mid-write)."""
+        cutoff = time.time() - self.TEMP_GRACE_SECONDS
+        removed = 0
+        try:
+            for entry in os.scandir(self._directory):
+                if not entry.name.endswith(".tmp"):
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        removed += 1
+                except FileNotFoundError:
+                    continue
+        except OSError as e:
+            logger.warning(f"Disk cache '{self._name}' temp cleanup failed: {e}")
+        if removed:
+            logger.info(f"Disk cache '{self._name}' removed {removed} abandoned temporary files")
+
+    def _scan_size(self) -> Tuple[int, int]:
+        """Total size and count of entries on disk."""
+        try:
+            entries = self._entries()
+        except OSError as e:
+            logger.warning(f"Disk cache '{self._name}' scan failed: {e}")
+            return 0, 0
+        return sum(size for _, size, _ in entries), len(entries)
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the cache is under its bound."""
+        lock_file = None
+        try:
+            if FCNTL_AVAILABLE:
+                lock_file = open(self._directory / ".evict.lock", "a")
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            self._remove_stale_temps()
+            entries = self._entries()
+            total = sum(size for _, size, _ in entries)
+            count = len(entries)
+
+            # Evict down to 90% so that every write does not trigger a scan
+            target = int(self._max_bytes * 0.9)
+            if total > self._max_bytes:
+                for _, size, path in sorted(entries):
+                    if total <= target:
+                        break
+                    try:
+                        path.unlink()
+                    except FileNotFoundError:
+                        continue
+                    total -= size
+                    count -= 1
+                    self._evictions += 1
+                    self._bytes_evicted += size
+                logger.info(f"Disk cache '{self._name}' evicted down to {total} bytes")
+
+            self._size_estimate = total
+            self._entry_count = count
+            self._writes_since_scan = 0
+        except OSError as e:
+            logger.warning(f"Disk cache '{self._name}' eviction failed: {e}")
+        finally:
+            if lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+                lock_file.close()
+
+
+@lru_cache(maxsize=1)
+def get_illustration_cache() -> Optional[DiskLRUCache]:
+    """
+    Get the process-wide illustration cache.
+
+    Returns:
+        DiskLRUCache under ILLUSTRATION_CACHE_DIR, or None when disabled
+    """
+    if not settings.ILLUSTRATION_CACHE_ENABLED:
+        return None
+    return DiskLRUCache(
+        directory=Path(settings.ILLUSTRATION_CACHE_DIR),
+        max_bytes=settings.ILLUSTRATION_CACHE_MAX_BYTES,
+        name="illustrations"
+    )
+
+
+@lru_cache(maxsize=1)
+def get_pdf_cache() -> Optional[DiskLRUCache]:
+    """
+    Get the process-wide hot cache of generated PDFs.
+
+    Returns:
+        DiskLRUCache under PDF_CACHE_DIR, or None when disabled
+    """
+    if not settings.PDF_CACHE_ENABLED:
+        return None
+    return DiskLRUCache(
+        directory=Path(settings.PDF_CACHE_DIR),
+        max_bytes=settings.PDF_CACHE_MAX_BYTES,
+        name="pdfs"
+    )
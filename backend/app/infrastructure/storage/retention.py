@@ -0,0 +1,406 @@
+"""
+Retention Implementation.
+Expires generated artifacts on disk and in MongoDB by document type.
+"""
+
+import os
+import time
+import shutil
+import asyncio
+import tempfile
+from fnmatch import fnmatch
+from pathlib import Path
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from bson import ObjectId
+from gridfs.errors import NoFile
+from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorGridFSBucket
+from pymongo.errors import PyMongoError
+
+from ...shared.logger import get_logger
+from ...config import settings
+
+logger = get_logger("retention")
+
+# Paths listed per policy in a report (counts and bytes always cover everything)
+REPORT_SAMPLE_SIZE = 20
+
+
+def document_retention() -> Dict[str, timedelta]:
+    """Retention per generated document type (zero means keep forever)."""
+    return {
+        "invoice": timedelta(days=settings.RETENTION_INVOICE_DAYS),
+        "formal": timedelta(days=settings.RETENTION_FORMAL_DAYS),
+        "infographic": timedelta(days=settings.RETENTION_INFOGRAPHIC_DAYS)
+    }
+
+
+def expiry_for(document_type: str, created_at: datetime) -> Optional[datetime]:
+    """
+    Expiry time of a generated document.
+
+    Stored as expire_at on the job and in the GridFS file metadata, so
+    changing a retention setting only affects documents generated after.
+
+    Args:
+        document_type: Generated document type
+        created_at: Generation time (UTC)
+
+    Returns:
+        Expiry time, or None to keep the document forever
+    """
+    retention = document_retention().get(document_type)
+    if not retention:
+        return None
+    return created_at + retention
+
+
+@dataclass(frozen=True)
+class DiskRetentionPolicy:
+    """
+    Age limit for entries directly under one directory.
+
+    Attributes:
+        name: Policy name used in reports
+        root: Directory scanned (not recursively)
+        patterns: Glob patterns for entry names; directories match too
+        max_age: Entries whose mtime is older are deleted
+    """
+    name: str
+    root: Path
+    patterns: Tuple[str, ...]
+    max_age: timedelta
+
+    def matches(self, entry_name: str) -> bool:
+        """Check if an entry name falls under this policy."""
+        return any(fnmatch(entry_name, pattern) for pattern in self.patterns)
+
+
+def default_disk_policies() -> List[DiskRetentionPolicy]:
+    """
+    Disk policies for the artifacts the application writes.
+
+    Policies with a zero age are left out.
+    """
+    output_dir = Path(settings.PDF_OUTPUT_DIR)
+    temp = timedelta(hours=settings.RETENTION_TEMP_HOURS)
+    retention = document_retention()
+    policies = [
+        DiskRetentionPolicy("infographics", output_dir, ("infographic_*.pdf",), retention["infographic"]),
+        DiskRetentionPolicy("invoices", output_dir / "invoices", ("*.pdf",), retention["invoice"]),
+        DiskRetentionPolicy("render_dirs", output_dir, ("charts_*", "illustrations_*"), temp),
+        DiskRetentionPolicy("tmp_invoices", Path(tempfile.gettempdir()), ("invoice_*.pdf", "invoice_*.docx"), temp),
+    ]
+    return [policy for policy in policies if policy.max_age]
+
+
+def _entry_size(path: str) -> int:
+    """Size of a file, or the total size of a directory tree."""
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, filename))
+            except OSError:
+                continue
+    return total
+
+
+def sweep_disk(
+    policies: Sequence[DiskRetentionPolicy],
+    dry_run: bool = False,
+    now: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """
+    Delete expired entries for each policy (blocking; run in a thread).
+
+    Args:
+        policies: Disk policies
+        dry_run: Only report what would be deleted
+        now: Current time as a timestamp (default: time.time())
+
+    Returns:
+        Per policy: name, root, expired entry count, their total bytes,
+        entries that could not be deleted and a sample of paths
+    """
+    now = now if now is not None else time.time()
+    report = []
+
+    for policy in policies:
+        cutoff = now - policy.max_age.total_seconds()
+        expired, freed, failed = 0, 0, 0
+        sample: List[str] = []
+
+        try:
+            entries = list(os.scandir(policy.root))
+        except FileNotFoundError:
+            entries = []
+        except OSError as e:
+            logger.warning(f"Retention scan of {policy.root} failed: {e}")
+            entries = []
+
+        for entry in entries:
+            if not policy.matches(entry.name):
+                continue
+            try:
+                if entry.stat(follow_symlinks=False).st_mtime >= cutoff:
+                    continue
+                size = _entry_size(entry.path)
+                if not dry_run:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
+            except FileNotFoundError:
+                continue  # Removed concurrently (another worker's sweep)
+            except OSError as e:
+                failed += 1
+                logger.warning(f"Retention could not delete {entry.path}: {e}")
+                continue
+
+            expired += 1
+            freed += size
+            if len(sample) < REPORT_SAMPLE_SIZE:
+                sample.append(entry.path)
+
+        report.append({
+            "policy": policy.name,
+            "root": str(policy.root),
+            "max_age_seconds": int(policy.max_age.total_seconds()),
+            "expired": expired,
+            "bytes": freed,
+            "failed": failed,
+            "paths": sample
+        })
+
+    return report
+
+
+class RetentionSweeper:
+    """
+    Periodically deletes expired generated artifacts.
+
+    - Disk: entries matching a DiskRetentionPolicy, by mtime
+    - generation_jobs: jobs past expire_at; each job's GridFS PDF is
+      deleted and its logo reference released
+    - pdfs bucket: files past metadata.expire_at whose job is already gone
+    - with RETENTION_LEGACY_CLEANUP only: jobs without an expiry
+      (recorded before expiry existed, or while their type was kept
+      forever) past created_at plus their type's retention, and per-job
+      logo copies stored before logo deduplication (off by default, as
+      the first sweep would remove all such data older than the
+      retention; run it with dry_run first)
+
+    GridFS files cannot use TTL indexes (their chunks would be left
+    behind), so they are deleted here. Jobs also carry a TTL index on
+    expire_at, offset by RETENTION_TTL_GRACE_SECONDS, as a backstop when
+    no sweeper runs. Every worker may run a sweeper: a job is deleted
+    first and only the sweeper that deleted it removes its PDF and logo
+    reference, and files already gone are skipped. A PDF left behind by
+    a sweeper that stopped midway is collected by the pdfs bucket pass.
+    """
+
+    def __init__(
+        self,
+        db: Optional[AsyncIOMotorDatabase] = None,
+        disk_policies: Optional[Sequence[DiskRetentionPolicy]] = None,
+        release_logo: Optional[Callable[[str], Awaitable[None]]] = None,
+        interval_seconds: Optional[float] = None,
+        dry_run: Optional[bool] = None
+    ):
+        """
+        Initialize the sweeper.
+
+        Args:
+            db: MongoDB database (None to sweep disk only)
+            disk_policies: Disk policies (default: default_disk_policies())
+            release_logo: Drops a job's reference to a shared logo, by SHA-256
+            interval_seconds: Time between sweeps (default from settings)
+            dry_run: Report without deleting (default from settings)
+        """
+        self._db = db
+        self._disk_policies = list(disk_policies) if disk_policies is not None else default_disk_policies()
+        self._release_logo = release_logo
+        self._interval = interval_seconds or settings.RETENTION_SWEEP_INTERVAL_SECONDS
+        self._dry_run = settings.RETENTION_DRY_RUN if dry_run is None else dry_run
+        self._task: Optional[asyncio.Task] = None
+        self._last_report: Optional[Dict[str, Any]] = None
+
+        if db is not None:
+            self._pdfs = AsyncIOMotorGridFSBucket(db, bucket_name="pdfs")
+            self._logos = AsyncIOMotorGridFSBucket(db, bucket_name="logos")
+
+    @property
+    def last_report(self) -> Optional[Dict[str, Any]]:
+        """Report of the most recent sweep."""
+        return self._last_report
+
+    def start(self) -> None:
+        """Start sweeping in the background on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"Retention sweeper started (every {self._interval}s"
+                        + (", dry run)" if self._dry_run else ")"))
+
+    async def stop(self) -> None:
+        """Stop the background sweep."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        """Sweep, then sleep, until cancelled."""
+        while True:
+            try:
+                await self.sweep()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Retention sweep failed: {e}", exc_info=True)
+            await asyncio.sleep(self._interval)
+
+    async def sweep(self, dry_run: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        Run one sweep.
+
+        Args:
+            dry_run: Report without deleting (default: the sweeper's setting)
+
+        Returns:
+            Report with the disk policies and the MongoDB collections swept
+        """
+        dry_run = self._dry_run if dry_run is None else dry_run
+        started = time.monotonic()
+        report: Dict[str, Any] = {
+            "dry_run": dry_run,
+            "started_at": datetime.utcnow(),
+            "disk": await asyncio.to_thread(sweep_disk, self._disk_policies, dry_run)
+        }
+        if self._db is not None:
+            report["mongodb"] = await self._sweep_mongodb(dry_run)
+        report["duration_seconds"] = round(time.monotonic() - started, 3)
+
+        if not dry_run:
+            self._last_report = report
+        removed = sum(item["expired"] for item in report["disk"]) + sum(
+            item["expired"] for item in report.get("mongodb", {}).values()
+        )
+        logger.info(f"Retention sweep {'found' if dry_run else 'removed'} {removed} expired artifacts "
+                    f"in {report['duration_seconds']}s")
+        return report
+
+    async def _sweep_mongodb(self, dry_run: bool) -> Dict[str, Dict[str, Any]]:
+        """Expire jobs and their files, then files whose job is gone."""
+        now = datetime.utcnow()
+        results = {}
+        try:
+            results["generation_jobs"] = await self._sweep_jobs(now, dry_run)
+            results["pdfs"] = await self._sweep_files(
+                self._pdfs, "pdfs", {"metadata.expire_at": {"$lt": now}}, dry_run, without_job=True
+            )
+            legacy_logo_retention = max(document_retention().values())
+            if settings.RETENTION_LEGACY_CLEANUP and legacy_logo_retention:
+                results["logos"] = await self._sweep_files(
+                    self._logos, "logos",
+                    {"metadata.job_id": {"$type": "string"}, "uploadDate": {"$lt": now - legacy_logo_retention}},
+                    dry_run
+                )
+        except PyMongoError as e:
+            logger.warning(f"Retention sweep of MongoDB failed: {e}")
+        return results
+
+    def _expired_jobs_filter(self, now: datetime) -> Dict[str, Any]:
+        """Jobs past expire_at, plus (legacy cleanup) jobs without one past their type's retention."""
+        expired = {"expire_at": {"$lt": now}}
+        if not settings.RETENTION_LEGACY_CLEANUP:
+            return expired
+        clauses: List[Dict[str, Any]] = [expired]
+        for document_type, retention in document_retention().items():
+            if retention:
+                clauses.append({
+                    "expire_at": None,  # missing or null
+                    "document_type": document_type,
+                    "created_at": {"$lt": now - retention}
+                })
+        return {"$or": clauses}
+
+    async def _sweep_jobs(self, now: datetime, dry_run: bool) -> Dict[str, Any]:
+        """Delete expired jobs with their PDF and logo reference."""
+        query = self._expired_jobs_filter(now)
+        if dry_run:
+            return {"expired": await self._db.generation_jobs.count_documents(query)}
+
+        cursor = self._db.generation_jobs.find(
+            query, {"job_id": 1, "pdf_file_id": 1, "logo_sha256": 1}
+        ).limit(settings.RETENTION_SWEEP_BATCH)
+        expired = 0
+        async for job in cursor:
+            # Only the worker whose delete wins cleans up, so concurrent
+            # sweepers never release the same logo reference twice
+            deleted = await self._db.generation_jobs.delete_one({"_id": job["_id"]})
+            if deleted.deleted_count != 1:
+                continue
+            if job.get("pdf_file_id"):
+                await self._delete_file(self._pdfs, ObjectId(job["pdf_file_id"]))
+            else:
+                async for grid_out in self._pdfs.find({"metadata.job_id": job["job_id"]}):
+                    await self._delete_file(self._pdfs, grid_out._id)
+            if job.get("logo_sha256") and self._release_logo is not None:
+                await self._release_logo(job["logo_sha256"])
+            expired += 1
+        return {"expired": expired}
+
+    async def _sweep_files(
+        self,
+        bucket: AsyncIOMotorGridFSBucket,
+        bucket_name: str,
+        query: Dict[str, Any],
+        dry_run: bool,
+        without_job: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Delete (or count) the GridFS files matching a query.
+
+        With without_job, files whose metadata.job_id still names a job
+        are kept: the job sweep removes them together with the job.
+        """
+        files = self._db[f"{bucket_name}.files"]
+        pipeline: List[Dict[str, Any]] = [{"$match": query}]
+        if without_job:
+            pipeline += [
+                {"$lookup": {
+                    "from": "generation_jobs",
+                    "localField": "metadata.job_id",
+                    "foreignField": "job_id",
+                    "as": "jobs"
+                }},
+                {"$match": {"jobs": {"$size": 0}}}
+            ]
+        if dry_run:
+            pipeline.append({"$group": {"_id": None, "count": {"$sum": 1}, "bytes": {"$sum": "$length"}}})
+            totals = await files.aggregate(pipeline).to_list(length=1)
+            return {"expired": totals[0]["count"] if totals else 0, "bytes": totals[0]["bytes"] if totals else 0}
+
+        expired, freed = 0, 0
+        pipeline += [{"$limit": settings.RETENTION_SWEEP_BATCH}, {"$project": {"_id": 1, "length": 1}}]
+        async for file_doc in files.aggregate(pipeline):
+            await self._delete_file(bucket, file_doc["_id"])
+            expired += 1
+            freed += file_doc.get("length", 0)
+        return {"expired": expired, "bytes": freed}
+
+    @staticmethod
+    async def _delete_file(bucket: AsyncIOMotorGridFSBucket, file_id: ObjectId) -> None:
+        """Delete a GridFS file and its chunks (already gone is fine)."""
+        try:
+            await bucket.delete(file_id)
+        except NoFile:
+            pass
@@ -4,10 +4,17 @@ Provides chart and graph generation capabilities.
 """
 
 from .matplotlib_engine import MatplotlibEngine
+from .reportlab_engine import ReportLabEngine
+from .engine_factory import create_visualization_engine
 from .chart_styles import ChartStyleManager, ColorScheme
+from .render_pool import start_render_pool, shutdown_render_pool
 
 __all__ = [
     "MatplotlibEngine",
+    "ReportLabEngine",
+    "create_visualization_engine",
     "ChartStyleManager",
-    "ColorScheme"
+    "ColorScheme",
+    "start_render_pool",
+    "shutdown_render_pool"
 ]
@@ -0,0 +1,137 @@
+"""
+Chart Render Cache.
+Two-tier byte cache for rendered charts keyed by chart spec.
+"""
+
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ...shared.logger import get_logger
+from ...config import settings
+from ..storage.disk_cache import DiskLRUCache
+
+logger = get_logger("chart_cache")
+
+
+class ChartRenderCache:
+    """
+    Rendered chart bytes, looked up by content key.
+
+    - Memory tier: per-process LRU bounded by total bytes
+    - Disk tier: optional DiskLRUCache shared by all workers on the host
+
+    A disk hit is promoted into memory, so repeated charts are served
+    without touching the file system.
+    """
+
+    def __init__(self, memory_max_bytes: int, disk: Optional[DiskLRUCache] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            memory_max_bytes: Upper bound for the memory tier
+            disk: Shared disk tier (None for memory only)
+        """
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_max_bytes = memory_max_bytes
+        self._memory_bytes = 0
+        self._disk = disk
+        self._lock = threading.Lock()
+
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up rendered chart bytes.
+
+        Args:
+            key: Content key of the chart
+
+        Returns:
+            Image bytes, or None on miss
+        """
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self._memory_hits += 1
+                return data
+
+        if self._disk is not None:
+            data = await self._disk.get(key)
+            if data is not None:
+                self._disk_hits += 1
+                self._remember(key, data)
+                return data
+
+        self._misses += 1
+        return None
+
+    async def put(self, key: str, data: bytes) -> None:
+        """
+        Store rendered chart bytes in both tiers.
+
+        Args:
+            key: Content key of the chart
+            data: Image bytes
+        """
+        self._remember(key, data)
+        if self._disk is not None:
+            try:
+                await self._disk.put(key, data)
+            except OSError as e:
+                logger.warning(f"Could not write chart to disk cache: {e}")
+
+    def _remember(self, key: str, data: bytes) -> None:
+        """Insert into the memory tier, evicting least recently used entries."""
+        if len(data) > self._memory_max_bytes:
+            return
+
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= len(previous)
+            self._memory[key] = data
+            self._memory_bytes += len(data)
+
+            while self._memory_bytes > self._memory_max_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get hit rates and tier sizes."""
+        lookups = self._memory_hits + self._disk_hits + self._misses
+        hits = self._memory_hits + self._disk_hits
+        return {
+            "memory_hits": self._memory_hits,
+            "disk_hits": self._disk_hits,
+            "misses": self._misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "memory_max_bytes": self._memory_max_bytes,
+            "disk": self._disk.get_metrics() if self._disk is not None else None
+        }
+
+
+@lru_cache(maxsize=1)
+def get_chart_render_cache() -> ChartRenderCache:
+    """
+    Get the process-wide chart render cache.
+
+    Returns:
+        ChartRenderCache with a disk tier under CHART_CACHE_DIR when enabled
+    """
+    disk = None
+    if settings.CHART_CACHE_DISK_ENABLED:
+        disk = DiskLRUCache(
+            directory=Path(settings.CHART_CACHE_DIR),
+            max_bytes=settings.CHART_CACHE_DISK_MAX_BYTES,
+            name="charts"
+        )
+    return ChartRenderCache(settings.CHART_CACHE_MEMORY_BYTES, disk)
@@ -0,0 +1,244 @@
+"""
+Chart Planner.
+Turns a document's statistics into a small set of grouped chart specs.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ...domain.value_objects.chart_spec import ChartSpec
+from ...shared.logger import get_logger
+from ...config import settings
+
+logger = get_logger("chart_planner")
+
+# Units that carry no information in a chart title
+_PLAIN_UNITS = ("", "units", "items")
+
+
+@dataclass(frozen=True)
+class _Group:
+    """Statistics sharing a category and unit."""
+    category: Optional[str]
+    unit: str
+    names: List[str]
+    values: np.ndarray
+    types: List[str]
+    first_index: int
+
+
+class ChartPlanner:
+    """
+    Plans the charts for a document.
+
+    Statistics are grouped by category and unit, and each group becomes one
+    chart instead of one figure per statistic:
+    - Percentages of one category adding up to about 100 become a pie chart
+    - Groups mostly marked line_chart become a line chart; line groups in
+      the same unit are merged into one multi-series chart
+    - Other groups become a bar chart, keeping the largest values and
+      folding the rest into "Other"
+    - Single statistics keep their own visualization type (gauge, number,
+      bar, pie); a lone line_chart value is shown as a number, since one
+      value has no trend
+
+    Charts are ranked by how many statistics they cover and capped per
+    document. Statistics accept any object with name, value, unit,
+    visualization_type and category attributes.
+    """
+
+    def __init__(
+        self,
+        max_charts: Optional[int] = None,
+        max_categories: Optional[int] = None,
+        max_series: int = 4
+    ):
+        """
+        Initialize the planner.
+
+        Args:
+            max_charts: Maximum charts per document (default from settings)
+            max_categories: Maximum bars, slices or line points per chart
+                (default from settings)
+            max_series: Maximum lines in one line chart
+        """
+        self._max_charts = max_charts or settings.MAX_CHARTS_PER_DOCUMENT
+        self._max_categories = max_categories or settings.MAX_CHART_CATEGORIES
+        self._max_series = max_series
+
+    def plan(self, statistics: Sequence[Any], colors: Tuple[str, ...] = ()) -> List[ChartSpec]:
+        """
+        Plan the charts for a set of statistics.
+
+        Args:
+            statistics: Statistics to visualize
+            colors: Hex color codes for every chart
+
+        Returns:
+            Chart specs in document order, at most max_charts
+        """
+        groups = self._group(statistics)
+        if not groups:
+            return []
+
+        # (priority, first_index, spec): more statistics per chart ranks first
+        planned: List[Tuple[int, int, ChartSpec]] = []
+        line_groups: Dict[str, List[_Group]] = {}
+
+        for group in groups:
+            if len(group.names) > 1 and self._is_line_group(group):
+                line_groups.setdefault(group.unit, []).append(group)
+                continue
+            planned.append((len(group.names), group.first_index, self._group_chart(group, colors)))
+
+        for unit_groups in line_groups.values():
+            for start in range(0, len(unit_groups), self._max_series):
+                batch = unit_groups[start:start + self._max_series]
+                covered = sum(len(group.names) for group in batch)
+                planned.append((covered, batch[0].first_index, self._line_chart(batch, colors)))
+
+        kept = sorted(planned, key=lambda item: (-item[0], item[1]))[:self._max_charts]
+        if len(planned) > len(kept):
+            logger.info(f"Chart cap reached: {len(planned) - len(kept)} charts dropped "
+                        f"(max {self._max_charts})")
+
+        # Document order follows the first statistic of each chart
+        specs = [spec for _, _, spec in sorted(kept, key=lambda item: item[1])]
+        logger.info(f"Planned {len(specs)} charts for {len(statistics)} statistics")
+        return specs
+
+    def _group(self, statistics: Sequence[Any]) -> List[_Group]:
+        """Group statistics by category and unit, in order of first appearance."""
+        if not statistics:
+            return []
+
+        values = np.array([float(stat.value) for stat in statistics], dtype=float)
+        finite = np.isfinite(values)
+        keys = np.array([
+            f"{stat.category or ''}\x1f{(stat.unit or '').strip()}" for stat in statistics
+        ])
+
+        # Vectorized grouping: codes[i] is the group of statistic i, and a
+        # stable sort by code lists each group's members in document order
+        unique_keys, first_index, codes = np.unique(keys, return_index=True, return_inverse=True)
+        codes = codes.ravel()
+        order = np.argsort(codes, kind="stable")
+        members_by_code = np.split(order, np.cumsum(np.bincount(codes))[:-1])
+
+        groups = []
+        for code in np.argsort(first_index):
+            members = members_by_code[code]
+            members = members[finite[members]]
+            if members.size == 0:
+                continue
+            category, unit = unique_keys[code].split("\x1f", 1)
+            groups.append(_Group(
+                category=category or None,
+                unit=unit,
+                names=[str(statistics[i].name) for i in members],
+                values=values[members],
+                types=[statistics[i].visualization_type for i in members],
+                first_index=int(first_index[code])
+            ))
+        return groups
+
+    @staticmethod
+    def _is_line_group(group: _Group) -> bool:
+        """A group is a trend when most of its statistics ask for a line chart."""
+        return group.types.count('line_chart') * 2 > len(group.types)
+
+    def _group_chart(self, group: _Group, colors: Tuple[str, ...]) -> ChartSpec:
+        """Chart for one group (bar, pie or a single-statistic chart)."""
+        if len(group.names) == 1:
+            return self._single_chart(group, colors)
+
+        names, values = self._sum_by_name(group.names, group.values)
+        title = self._title(group.category, group.unit)
+
+        is_share = group.unit == '%' and np.all(values >= 0) and abs(values.sum() - 100) <= 1
+        if is_share or (group.types.count('pie_chart') * 2 > len(group.types) and np.all(values >= 0)):
+            return ChartSpec("pie", {"values": self._top(names, values, fold=True)}, title, colors)
+
+        # "Other" only makes sense when values add up (not for percentages)
+        fold = group.unit != '%'
+        return ChartSpec("bar", {"values": self._top(names, values, fold=fold)}, title, colors)
+
+    @staticmethod
+    def _single_chart(group: _Group, colors: Tuple[str, ...]) -> ChartSpec:
+        """Chart for a group holding one statistic."""
+        name, value, unit = group.names[0], float(group.values[0]), group.unit
+        kind = group.types[0]
+
+        if kind == 'gauge_chart':
+            max_value = 100 if unit == '%' else value * 1.5
+            return ChartSpec("gauge", {"value": value, "max_value": max_value}, name, colors)
+
+        if kind == 'pie_chart' and value >= 0:
+            remaining = 100 - value if unit == '%' and value <= 100 else value
+            return ChartSpec("pie", {"values": {name: value, 'Other': max(0, remaining)}}, name, colors)
+
+        if kind == 'bar_chart':
+            return ChartSpec("bar", {"values": {name: value}}, name, colors)
+
+        return ChartSpec("number", {"value": value, "unit": unit}, name, colors)
+
+    def _line_chart(self, groups: List[_Group], colors: Tuple[str, ...]) -> ChartSpec:
+        """Multi-series line chart, one series per group (values in document order)."""
+        series = {}
+        labels = None
+        for group in groups:
+            values = group.values
+            names = np.array(group.names)
+            if values.size > self._max_categories:
+                # Evenly spaced points keep the shape of long series
+                picks = np.linspace(0, values.size - 1, self._max_categories).round().astype(int)
+                values, names = values[picks], names[picks]
+            series[group.category or self._title(None, group.unit)] = values.tolist()
+            if labels is None:
+                labels = names.tolist()
+            elif labels != names.tolist():
+                # Series measured at different points share no x labels
+                labels = []
+
+        if len(groups) == 1:
+            title = self._title(groups[0].category, groups[0].unit)
+        else:
+            title = self._title(None, groups[0].unit, "Trends")
+
+        data: Dict[str, Any] = {"series": series}
+        if labels:
+            data["labels"] = labels
+        return ChartSpec("line", data, title, colors)
+
+    @staticmethod
+    def _sum_by_name(names: List[str], values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Aggregate repeated names (e.g. imported rows) by summing their values."""
+        unique_names, first_index, codes = np.unique(
+            np.array(names), return_index=True, return_inverse=True
+        )
+        codes = codes.ravel()
+        sums = np.bincount(codes, weights=values, minlength=unique_names.size)
+        order = np.argsort(first_index)
+        return unique_names[order], sums[order]
+
+    def _top(self, names: np.ndarray, values: np.ndarray, fold: bool) -> Dict[str, float]:
+        """Keep the largest values; optionally fold the rest into "Other"."""
+        if values.size <= self._max_categories:
+            return {str(name): float(value) for name, value in zip(names, values)}
+
+        keep = self._max_categories - 1 if fold else self._max_categories
+        top = np.sort(np.argsort(-values, kind="stable")[:keep])
+        result = {str(names[i]): float(values[i]) for i in top}
+        if fold:
+            rest = np.ones(values.size, dtype=bool)
+            rest[top] = False
+            result['Other'] = float(values[rest].sum())
+        return result
+
+    @staticmethod
+    def _title(category: Optional[str], unit: str, default: str = "Key Figures") -> str:
+        """Chart title from the category, with the unit when it is informative."""
+        title = category or default
+        return title if unit.lower() in _PLAIN_UNITS else f"{title} ({unit})"
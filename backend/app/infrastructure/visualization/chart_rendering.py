@@ -0,0 +1,328 @@
+"""
+Chart Rendering Functions.
+Stateless chart drawing on matplotlib's object-oriented Figure API.
+
+Every function here builds its own Figure with an explicit Agg canvas and
+never touches pyplot's global state, so renders are safe to run in
+parallel threads or in worker processes. All inputs are picklable value
+objects, so calls can be shipped to a process pool.
+"""
+
+import io
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.patches import Wedge, Circle
+
+from ...domain.value_objects.chart_spec import ChartSpec, MIN_DPI, MAX_DPI
+from .chart_styles import ChartColors, ChartStyle, series_colors
+
+# Largest raster a single chart may allocate (about 100 MB of RGBA)
+MAX_CHART_PIXELS = 25_000_000
+
+
+def render_chart(spec: ChartSpec, palette: ChartColors, style: ChartStyle) -> bytes:
+    """
+    Render a chart to image bytes.
+
+    Args:
+        spec: Chart specification (type, data, title, format, dpi, placement)
+        palette: Resolved colors for this chart
+        style: Resolved style for this chart
+
+    Returns:
+        Encoded image bytes in the spec's format
+
+    Raises:
+        ValueError: If the image would exceed MAX_CHART_PIXELS
+    """
+    draw = _DRAWERS[spec.chart_type]
+
+    figsize = _FIGURE_SIZES.get(spec.chart_type, (style.figure_width, style.figure_height))
+    dpi = render_dpi(spec, figsize, style)
+    pixels = figsize[0] * figsize[1] * dpi * dpi
+    if pixels > MAX_CHART_PIXELS:
+        raise ValueError(f"Chart too large: {pixels:,.0f} pixels (max {MAX_CHART_PIXELS:,})")
+
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+
+    draw(ax, spec, palette, style)
+    fig.tight_layout()
+
+    buffer = io.BytesIO()
+    fig.savefig(
+        buffer,
+        format=spec.image_format,
+        dpi=dpi,
+        bbox_inches='tight',
+        facecolor='white',
+        edgecolor='none'
+    )
+    return buffer.getvalue()
+
+
+def render_dpi(spec: ChartSpec, figsize: Tuple[float, float], style: ChartStyle) -> float:
+    """
+    Resolution to save a figure at.
+
+    Without a placement this is the spec's dpi (or the style's). With one,
+    the figure keeps its size, so text and lines keep their proportions,
+    and the resolution is scaled so the image has the target pixels per
+    inch once it is fitted into the placement box, instead of the figure
+    size times the target.
+
+    Args:
+        spec: Chart specification
+        figsize: Figure size in inches
+        style: Resolved style for this chart
+
+    Returns:
+        Dots per inch of the figure, within MIN_DPI and MAX_DPI
+    """
+    target = spec.dpi or style.figure_dpi
+    if spec.placement is None:
+        return target
+
+    figure_width, figure_height = figsize
+    box_width, box_height = spec.placement
+    # Same fit as the document renderer: width-bound unless the figure is taller than the box
+    placed_width = min(box_width, box_height * figure_width / figure_height)
+    return min(MAX_DPI, max(MIN_DPI, target * placed_width / figure_width))
+
+
+def warm_up() -> None:
+    """
+    Prepare a worker for rendering.
+
+    Loads matplotlib, the font cache and the Agg renderer so the first real
+    chart does not pay for them. Used as the process pool initializer.
+    """
+    render_chart(ChartSpec("bar", {"values": {"warm-up": 1.0}}, dpi=10), _WARM_UP_PALETTE, ChartStyle())
+
+
+def _draw_bar_chart(ax, spec: ChartSpec, palette: ChartColors, style: ChartStyle) -> None:
+    """Horizontal bar chart with value labels."""
+    data: Dict[str, float] = spec.data["values"]
+    labels = list(data.keys())
+    values = list(data.values())
+    chart_colors = series_colors(palette, len(data))
+
+    # Horizontal bars for better label readability
+    y_pos = np.arange(len(labels))
+    bars = ax.barh(
+        y_pos,
+        values,
+        height=style.bar_width,
+        color=chart_colors[:len(labels)],
+        edgecolor='white',
+        linewidth=style.bar_edge_width
+    )
+
+    # Value labels on bars
+    max_value = max(values) if values else 0
+    for bar, value in zip(bars, values):
+        ax.text(
+            bar.get_width() + max_value * 0.02,
+            bar.get_y() + bar.get_height() / 2,
+            f'{value:,.1f}',
+            va='center',
+            fontsize=style.tick_fontsize,
+            color=palette.text
+        )
+
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels(labels)
+    ax.set_xlabel('Value', fontsize=style.label_fontsize)
+    ax.set_title(spec.title, fontsize=style.title_fontsize, pad=style.title_pad, fontweight='bold')
+
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.spines['left'].set_color(palette.grid)
+    ax.spines['bottom'].set_color(palette.grid)
+
+    ax.xaxis.grid(True, alpha=style.grid_alpha, linestyle=style.grid_linestyle)
+
+
+def _draw_line_chart(ax, spec: ChartSpec, palette: ChartColors, style: ChartStyle) -> None:
+    """Line chart with markers, one line per series."""
+    data: Dict[str, List[float]] = spec.data["series"]
+    chart_colors = series_colors(palette, len(data))
+
+    for i, (label, values) in enumerate(data.items()):
+        color = chart_colors[i % len(chart_colors)]
+        ax.plot(
+            np.arange(len(values)),
+            values,
+            label=label,
+            color=color,
+            linewidth=style.line_width,
+            marker=style.marker_style,
+            markersize=style.marker_size,
+            markerfacecolor='white',
+            markeredgecolor=color,
+            markeredgewidth=2
+        )
+
+    labels = spec.data.get("labels")
+    if labels:
+        ax.set_xticks(np.arange(len(labels)))
+        ax.set_xticklabels(labels, rotation=30 if len(labels) > 6 else 0, ha='right' if len(labels) > 6 else 'center')
+
+    ax.set_xlabel('Period', fontsize=style.label_fontsize)
+    ax.set_ylabel('Value', fontsize=style.label_fontsize)
+    ax.set_title(spec.title, fontsize=style.title_fontsize, pad=style.title_pad, fontweight='bold')
+
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.grid(True, alpha=style.grid_alpha, linestyle=style.grid_linestyle)
+
+    if style.show_legend and len(data) > 1:
+        ax.legend(loc=style.legend_location, framealpha=0.9)
+
+
+def _draw_pie_chart(ax, spec: ChartSpec, palette: ChartColors, style: ChartStyle) -> None:
+    """Pie chart with the first segment pulled out."""
+    data: Dict[str, float] = spec.data["values"]
+    labels = list(data.keys())
+    values = list(data.values())
+    chart_colors = series_colors(palette, len(data))
+
+    explode = [style.pie_explode_factor] * len(values)
+    explode[0] = style.pie_explode_factor * 2
+
+    _, texts, autotexts = ax.pie(
+        values,
+        labels=labels,
+        colors=chart_colors[:len(values)],
+        explode=explode,
+        autopct='%1.1f%%',
+        startangle=style.pie_start_angle,
+        shadow=False,
+        wedgeprops={'edgecolor': 'white', 'linewidth': 2}
+    )
+
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_fontweight('bold')
+        autotext.set_fontsize(style.tick_fontsize)
+
+    for text in texts:
+        text.set_fontsize(style.label_fontsize)
+
+    ax.set_title(spec.title, fontsize=style.title_fontsize, pad=style.title_pad, fontweight='bold')
+
+    # Equal aspect ratio ensures circular pie
+    ax.axis('equal')
+
+
+def _draw_gauge_chart(ax, spec: ChartSpec, palette: ChartColors, style: ChartStyle) -> None:
+    """Half-circle gauge showing a value against its maximum."""
+    value: float = spec.data["value"]
+    max_value: float = spec.data["max_value"]
+    percentage = min(value / max_value, 1.0) if max_value > 0 else 0
+
+    center = (0.5, 0.3)
+    radius = 0.4
+    thickness = style.gauge_thickness
+
+    # Background arc
+    ax.add_patch(Wedge(
+        center, radius, 180, 0,
+        width=thickness, facecolor='#e5e7eb', edgecolor='white', linewidth=2
+    ))
+
+    # Gauge color follows the value unless colors were given explicitly
+    if spec.colors:
+        gauge_color = palette.primary
+    elif percentage < 0.33:
+        gauge_color = palette.accent
+    elif percentage < 0.66:
+        gauge_color = palette.secondary
+    else:
+        gauge_color = palette.primary
+
+    # Value arc
+    end_angle = 180 - (percentage * 180)
+    ax.add_patch(Wedge(
+        center, radius, 180, end_angle,
+        width=thickness, facecolor=gauge_color, edgecolor='white', linewidth=2
+    ))
+
+    # Center circle
+    ax.add_patch(Circle(
+        center, radius - thickness - 0.02,
+        facecolor='white', edgecolor='#e5e7eb', linewidth=2
+    ))
+
+    ax.text(center[0], center[1] + 0.05, f'{value:,.1f}',
+            ha='center', va='center', fontsize=28, fontweight='bold', color=palette.text)
+    ax.text(center[0], center[1] - 0.08, f'{percentage * 100:.0f}%',
+            ha='center', va='center', fontsize=14, color=palette.text)
+    ax.text(center[0], 0.85, spec.title,
+            ha='center', va='center', fontsize=style.title_fontsize, fontweight='bold', color=palette.text)
+
+    # Min and max labels
+    ax.text(center[0] - radius - 0.05, center[1] - 0.15, '0',
+            ha='center', va='center', fontsize=style.tick_fontsize, color=palette.text)
+    ax.text(center[0] + radius + 0.05, center[1] - 0.15, f'{max_value:,.0f}',
+            ha='center', va='center', fontsize=style.tick_fontsize, color=palette.text)
+
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    ax.set_aspect('equal')
+    ax.axis('off')
+
+
+def _draw_number_display(ax, spec: ChartSpec, palette: ChartColors, style: ChartStyle) -> None:
+    """Large formatted number with a label."""
+    value: float = spec.data["value"]
+    unit: str = spec.data.get("unit") or ""
+
+    if value >= 1_000_000:
+        value_text = f'{value / 1_000_000:.1f}M'
+    elif value >= 1_000:
+        value_text = f'{value / 1_000:.1f}K'
+    else:
+        value_text = f'{value:,.0f}'
+
+    if unit and unit not in ['items', 'units']:
+        if unit == '%':
+            value_text = f'{value:.1f}%'
+        elif unit in ['USD', 'EUR', 'GBP']:
+            value_text = f'${value:,.0f}' if unit == 'USD' else f'{unit} {value:,.0f}'
+
+    ax.text(0.5, 0.55, value_text, ha='center', va='center', fontsize=48,
+            fontweight='bold', color=palette.primary, transform=ax.transAxes)
+    ax.text(0.5, 0.25, spec.title, ha='center', va='center', fontsize=16,
+            color=palette.text, transform=ax.transAxes)
+
+    ax.axis('off')
+
+
+_DRAWERS: Dict[str, Callable[..., None]] = {
+    "bar": _draw_bar_chart,
+    "line": _draw_line_chart,
+    "pie": _draw_pie_chart,
+    "gauge": _draw_gauge_chart,
+    "number": _draw_number_display
+}
+
+# Chart types with a fixed figure size (others use the style's size)
+_FIGURE_SIZES = {
+    "gauge": (8, 5),
+    "number": (6, 4)
+}
+
+_WARM_UP_PALETTE = ChartColors(
+    primary="#1e40af",
+    secondary="#3b82f6",
+    tertiary="#60a5fa",
+    accent="#93c5fd",
+    text="#1f2937",
+    background="#ffffff",
+    grid="#e5e7eb"
+)
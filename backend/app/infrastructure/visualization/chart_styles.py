@@ -3,7 +3,8 @@ Chart Styles Configuration.
 Defines color schemes and styling for visualizations.
 """
 
-from dataclasses import dataclass, field
+import math
+from dataclasses import dataclass, field, replace
 from typing import List, Dict, Any, Tuple
 from enum import Enum
 
@@ -113,6 +114,104 @@ COLOR_PALETTES: Dict[ColorScheme, ChartColors] = {
 }
 
 
+def lighten_color(hex_color: str, factor: float) -> str:
+    """
+    Lighten a hex color by a factor.
+
+    Args:
+        hex_color: Hex color code (e.g., "#1e40af")
+        factor: Lightening factor (0.0 to 1.0)
+
+    Returns:
+        Lightened hex color
+    """
+    hex_color = hex_color.lstrip('#')
+
+    r = int(hex_color[0:2], 16)
+    g = int(hex_color[2:4], 16)
+    b = int(hex_color[4:6], 16)
+
+    r = min(255, max(0, int(r + (255 - r) * factor)))
+    g = min(255, max(0, int(g + (255 - g) * factor)))
+    b = min(255, max(0, int(b + (255 - b) * factor)))
+
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def palette_from_hex(colors: List[str], default: ChartColors) -> ChartColors:
+    """
+    Build a palette from a list of hex color codes.
+
+    Args:
+        colors: Hex color codes (1-4 are used)
+        default: Palette returned when no colors are given
+
+    Returns:
+        New ChartColors instance (the default is never modified)
+    """
+    if len(colors) >= 4:
+        return ChartColors(
+            primary=colors[0],
+            secondary=colors[1],
+            tertiary=colors[2],
+            accent=colors[3],
+            text="#1f2937",
+            background="#ffffff",
+            grid="#e5e7eb"
+        )
+    if len(colors) >= 2:
+        # Generate shades from available colors
+        return ChartColors(
+            primary=colors[0],
+            secondary=colors[1],
+            tertiary=colors[0],
+            accent=colors[1],
+            text="#1f2937",
+            background="#ffffff",
+            grid="#e5e7eb"
+        )
+    if len(colors) == 1:
+        # Use single color with variations
+        base = colors[0]
+        return ChartColors(
+            primary=base,
+            secondary=lighten_color(base, 0.2),
+            tertiary=lighten_color(base, 0.4),
+            accent=lighten_color(base, 0.6),
+            text="#1f2937",
+            background="#ffffff",
+            grid="#e5e7eb"
+        )
+    return default
+
+
+def series_colors(palette: ChartColors, count: int = 4) -> List[str]:
+    """
+    Get a list of colors for chart series.
+
+    Args:
+        palette: Base palette
+        count: Number of colors needed
+
+    Returns:
+        List of hex color codes
+    """
+    base_colors = palette.to_list()
+
+    if count <= len(base_colors):
+        return base_colors[:count]
+
+    # Generate additional colors by lightening existing ones
+    extended = base_colors.copy()
+    while len(extended) < count:
+        for color in base_colors:
+            if len(extended) >= count:
+                break
+            extended.append(lighten_color(color, 0.3))
+
+    return extended[:count]
+
+
 @dataclass
 class ChartStyle:
     """Style configuration for charts."""
@@ -158,6 +257,86 @@ class ChartStyle:
     gauge_thickness: float = 0.3
 
 
+# Per-chart overridable style fields: (type, minimum, maximum) for numbers,
+# a tuple of allowed values for strings, bool for switches
+STYLE_OVERRIDES: Dict[str, Any] = {
+    "figure_width": (float, 1.0, 20.0),
+    "figure_height": (float, 1.0, 20.0),
+    "figure_dpi": (int, 10, 600),
+    "title_fontsize": (int, 4, 72),
+    "label_fontsize": (int, 4, 72),
+    "tick_fontsize": (int, 4, 72),
+    "legend_fontsize": (int, 4, 72),
+    "font_family": ("sans-serif", "serif", "monospace"),
+    "title_pad": (int, 0, 100),
+    "label_pad": (int, 0, 100),
+    "show_grid": bool,
+    "grid_alpha": (float, 0.0, 1.0),
+    "grid_linestyle": ("-", "--", ":", "-."),
+    "show_legend": bool,
+    "legend_location": (
+        "best", "upper right", "upper left", "lower left", "lower right", "right",
+        "center left", "center right", "lower center", "upper center", "center"
+    ),
+    "bar_width": (float, 0.05, 1.0),
+    "bar_edge_width": (float, 0.0, 10.0),
+    "pie_start_angle": (int, -360, 360),
+    "pie_explode_factor": (float, 0.0, 1.0),
+    "line_width": (float, 0.1, 20.0),
+    "marker_size": (int, 0, 50),
+    "marker_style": ("o", "s", "^", "v", "D", "d", "x", "+", "*", ".", "p", "h", ""),
+    "gauge_thickness": (float, 0.05, 1.0)
+}
+
+
+def _check_override(name: str, value: Any) -> Any:
+    """Validate one style override against STYLE_OVERRIDES."""
+    if name not in STYLE_OVERRIDES:
+        raise ValueError(f"Invalid chart style override: unknown field '{name}'")
+    rule = STYLE_OVERRIDES[name]
+
+    if rule is bool:
+        if not isinstance(value, bool):
+            raise ValueError(f"Invalid chart style override: {name} must be true or false")
+        return value
+
+    if isinstance(rule[0], str):
+        if value not in rule:
+            raise ValueError(f"Invalid chart style override: {name} must be one of {', '.join(map(repr, rule))}")
+        return value
+
+    kind, minimum, maximum = rule
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or (
+        kind is int and not float(value).is_integer()
+    ):
+        raise ValueError(f"Invalid chart style override: {name} must be a number")
+    if not math.isfinite(value) or not minimum <= value <= maximum:
+        raise ValueError(f"Invalid chart style override: {name} must be between {minimum} and {maximum}")
+    return kind(value)
+
+
+def style_with_overrides(style: ChartStyle, overrides: Dict[str, Any]) -> ChartStyle:
+    """
+    Apply per-chart overrides to a style.
+
+    Only the fields in STYLE_OVERRIDES can be overridden, with values of
+    the listed type and within the listed bounds.
+
+    Args:
+        style: Base style (never modified)
+        overrides: ChartStyle field names to values
+
+    Returns:
+        The base style, or a new ChartStyle with the overrides applied
+
+    Raises:
+        ValueError: If an override names an unknown field or has an invalid value
+    """
+    if not overrides:
+        return style
+    return replace(style, **{name: _check_override(name, value) for name, value in overrides.items()})
+
+
 class ChartStyleManager:
     """
     Manages chart styles and color schemes.
@@ -196,39 +375,7 @@ class ChartStyleManager:
         Args:
             colors: List of hex color codes (at least 2)
         """
-        if len(colors) >= 4:
-            self._colors = ChartColors(
-                primary=colors[0],
-                secondary=colors[1],
-                tertiary=colors[2],
-                accent=colors[3] if len(colors) > 3 else colors[2],
-                text="#1f2937",
-                background="#ffffff",
-                grid="#e5e7eb"
-            )
-        elif len(colors) >= 2:
-            # Generate shades from available colors
-            self._colors = ChartColors(
-                primary=colors[0],
-                secondary=colors[1],
-                tertiary=colors[0],
-                accent=colors[1],
-                text="#1f2937",
-                background="#ffffff",
-                grid="#e5e7eb"
-            )
-        elif len(colors) == 1:
-            # Use single color with variations
-            base = colors[0]
-            self._colors = ChartColors(
-                primary=base,
-                secondary=self._lighten_color(base, 0.2),
-                tertiary=self._lighten_color(base, 0.4),
-                accent=self._lighten_color(base, 0.6),
-                text="#1f2937",
-                background="#ffffff",
-                grid="#e5e7eb"
-            )
+        self._colors = palette_from_hex(colors, self._colors)
 
     def get_color_list(self, count: int = 4) -> List[str]:
         """
@@ -240,51 +387,11 @@ class ChartStyleManager:
         Returns:
             List of hex color codes
         """
-        base_colors = self._colors.to_list()
-
-        if count <= len(base_colors):
-            return base_colors[:count]
-
-        # Generate additional colors by lightening existing ones
-        extended = base_colors.copy()
-        while len(extended) < count:
-            for color in base_colors:
-                if len(extended) >= count:
-                    break
-                extended.append(self._lighten_color(color, 0.3))
-
-        return extended[:count]
+        return series_colors(self._colors, count)
 
     def _lighten_color(self, hex_color: str, factor: float) -> str:
-        """
-        Lighten a hex color by a factor.
-
-        Args:
-            hex_color: Hex color code (e.g., "#1e40af")
-            factor: Lightening factor (0.0 to 1.0)
-
-        Returns:
-            Lightened hex color
-        """
-        # Remove # if present
-        hex_color = hex_color.lstrip('#')
-
-        # Parse RGB values
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-
-        # Lighten each component
-        r = int(r + (255 - r) * factor)
-        g = int(g + (255 - g) * factor)
-        b = int(b + (255 - b) * factor)
-
-        # Ensure values are in valid range
-        r = min(255, max(0, r))
-        g = min(255, max(0, g))
-        b = min(255, max(0, b))
-
-        return f"#{r:02x}{g:02x}{b:02x}"
+        """Lighten a hex color by a factor (see lighten_color)."""
+        return lighten_color(hex_color, factor)
 
     def _darken_color(self, hex_color: str, factor: float) -> str:
         """
@@ -0,0 +1,43 @@
+"""
+Visualization Engine Factory.
+Selects the chart engine used for infographic documents.
+"""
+
+from typing import Optional
+
+from ...domain.interfaces.visualization_engine import IVisualizationEngine
+from ...config import settings
+from .chart_styles import ChartStyleManager
+
+CHART_ENGINES = ("matplotlib", "reportlab")
+
+
+def create_visualization_engine(
+    engine: Optional[str] = None,
+    style_manager: Optional[ChartStyleManager] = None
+) -> IVisualizationEngine:
+    """
+    Create a visualization engine.
+
+    Args:
+        engine: "matplotlib" (raster PNG charts) or "reportlab" (vector
+            drawings), defaults to settings.CHART_ENGINE
+        style_manager: Optional style manager for default colors and style
+
+    Returns:
+        The engine instance
+
+    Raises:
+        ValueError: If the engine name is unknown
+    """
+    name = (engine or settings.CHART_ENGINE).lower()
+
+    if name == "reportlab":
+        from .reportlab_engine import ReportLabEngine
+        return ReportLabEngine(style_manager)
+
+    if name == "matplotlib":
+        from .matplotlib_engine import MatplotlibEngine
+        return MatplotlibEngine(style_manager)
+
+    raise ValueError(f"Unknown chart engine: {name} (expected one of {', '.join(CHART_ENGINES)})")
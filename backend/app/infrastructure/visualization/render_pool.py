@@ -0,0 +1,111 @@
+"""
+Chart Render Pool.
+Process pool that runs chart rendering on every CPU core.
+"""
+
+import os
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+from ...shared.logger import get_logger
+from ...config import settings
+from .chart_rendering import warm_up
+
+logger = get_logger("render_pool")
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_size = 0
+
+
+def _worker_count() -> int:
+    """Configured number of render processes (0 means one per CPU core)."""
+    return settings.CHART_RENDER_PROCESSES or os.cpu_count() or 1
+
+
+def start_render_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Create the render pool and warm every worker.
+
+    Workers are started with the "spawn" method so they do not inherit the
+    server's threads and locks. Each worker loads matplotlib and renders a
+    tiny chart before accepting work.
+
+    Returns:
+        The pool, or None when process rendering is disabled
+    """
+    global _pool, _pool_size
+    if not settings.CHART_RENDER_POOL_ENABLED:
+        return None
+    if settings.CHART_ENGINE != "matplotlib":
+        # Infographics use the vector engine; occasional raster renders run in threads
+        return None
+    if _pool is not None:
+        return _pool
+
+    _pool_size = _worker_count()
+    _pool = ProcessPoolExecutor(
+        max_workers=_pool_size,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=warm_up
+    )
+    # Submitting one no-op per worker makes the pool start all of them now
+    for _ in range(_pool_size):
+        _pool.submit(int)
+    logger.info(f"Chart render pool started with {_pool_size} processes")
+    return _pool
+
+
+async def run_render(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a render function in the pool (or a thread when the pool is disabled).
+
+    A broken pool (e.g. a worker killed by the OOM killer) is replaced once;
+    if that also fails the call runs in a thread.
+
+    Args:
+        func: Module-level, picklable function
+        *args: Picklable arguments
+
+    Returns:
+        The function's result
+    """
+    global _pool
+    pool = start_render_pool()
+    if pool is None:
+        return await asyncio.to_thread(func, *args)
+
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(pool, func, *args)
+    except BrokenProcessPool:
+        logger.warning("Chart render pool broken, restarting it")
+        if _pool is pool:
+            _pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    try:
+        return await loop.run_in_executor(start_render_pool(), func, *args)
+    except BrokenProcessPool:
+        logger.error("Chart render pool unavailable, rendering in a thread")
+        return await asyncio.to_thread(func, *args)
+
+
+def shutdown_render_pool() -> None:
+    """Stop the render pool (call on application shutdown)."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
+        logger.info("Chart render pool stopped")
+
+
+def get_render_pool_status() -> Dict[str, Any]:
+    """Get render pool configuration and state."""
+    return {
+        "enabled": settings.CHART_RENDER_POOL_ENABLED and settings.CHART_ENGINE == "matplotlib",
+        "running": _pool is not None,
+        "processes": _pool_size if _pool is not None else _worker_count()
+    }
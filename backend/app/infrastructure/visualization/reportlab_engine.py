@@ -0,0 +1,518 @@
+"""
+ReportLab Visualization Engine.
+Implements IVisualizationEngine with vector drawings from reportlab.graphics.
+"""
+
+import asyncio
+from typing import Callable, Dict, List, Any, Optional
+from pathlib import Path
+
+from reportlab import Version as REPORTLAB_VERSION
+from reportlab.lib import colors as rl_colors
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.graphics import renderPDF, renderPM, renderSVG
+from reportlab.graphics.shapes import Drawing, String, Wedge
+from reportlab.graphics.charts.barcharts import HorizontalBarChart
+from reportlab.graphics.charts.linecharts import HorizontalLineChart
+from reportlab.graphics.charts.piecharts import Pie
+from reportlab.graphics.charts.legends import Legend
+from reportlab.graphics.widgets.markers import makeMarker
+
+from ...domain.interfaces.visualization_engine import IVisualizationEngine
+from ...domain.value_objects.chart_spec import ChartSpec
+from ...domain.value_objects.image_asset import VectorAsset
+from ...shared.logger import get_logger
+from .chart_styles import (
+    ChartColors,
+    ChartStyle,
+    ChartStyleManager,
+    ColorScheme,
+    palette_from_hex,
+    series_colors,
+    style_with_overrides
+)
+
+logger = get_logger("reportlab_engine")
+
+FONT = "Helvetica"
+FONT_BOLD = "Helvetica-Bold"
+
+# Points per inch (ChartStyle sizes are in inches, like matplotlib figures)
+POINTS_PER_INCH = 72
+
+# Chart types with a fixed drawing size in inches (others use the style's size)
+_DRAWING_SIZES = {
+    "gauge": (8, 5),
+    "number": (6, 4)
+}
+
+
+class ReportLabEngine(IVisualizationEngine):
+    """
+    ReportLab implementation of visualization engine.
+
+    Charts are built as reportlab.graphics Drawings: vector graphics the
+    infographic PDF renderer embeds directly, with no rasterizing step and
+    no matplotlib or numpy import. Drawings are cheap to build, so they are
+    created on the event loop and not cached.
+
+    Uses the same ChartStyleManager palettes and ChartStyle settings as
+    MatplotlibEngine. Files written by the create_* methods are PDF or SVG
+    (vector) by extension, anything else is rasterized to PNG.
+    """
+
+    def __init__(self, style_manager: Optional[ChartStyleManager] = None):
+        """
+        Initialize the ReportLab engine.
+
+        Args:
+            style_manager: Optional style manager providing the default
+                colors and style, creates default if not provided
+        """
+        style_manager = style_manager or ChartStyleManager(ColorScheme.BLUE)
+        self._default_colors: ChartColors = style_manager.colors
+        self._default_style: ChartStyle = style_manager.style
+        self._is_active = True
+
+        logger.info("REPORTLAB VISUALIZATION ENGINE INITIALIZED")
+        logger.info(f"ReportLab version: {REPORTLAB_VERSION}")
+
+    @property
+    def is_active(self) -> bool:
+        """Check if the engine is active."""
+        return self._is_active
+
+    def set_colors(self, colors: List[str]) -> None:
+        """
+        Set the default colors used when a call passes no colors.
+
+        Args:
+            colors: List of hex color codes
+        """
+        self._default_colors = palette_from_hex(colors, self._default_colors)
+        logger.info(f"Default chart colors updated: {colors}")
+
+    async def create_bar_chart(
+        self,
+        data: Dict[str, float],
+        title: str,
+        colors: List[str],
+        output_path: Path,
+        style: Optional[ChartStyle] = None
+    ) -> Path:
+        """Create a bar chart file (see MatplotlibEngine.create_bar_chart)."""
+        spec = ChartSpec("bar", {"values": data}, title, tuple(colors or ()))
+        return await self._render_to_file(spec, output_path, style)
+
+    async def create_line_chart(
+        self,
+        data: Dict[str, List[float]],
+        title: str,
+        colors: List[str],
+        output_path: Path,
+        style: Optional[ChartStyle] = None
+    ) -> Path:
+        """Create a line chart file (see MatplotlibEngine.create_line_chart)."""
+        spec = ChartSpec("line", {"series": data}, title, tuple(colors or ()))
+        return await self._render_to_file(spec, output_path, style)
+
+    async def create_pie_chart(
+        self,
+        data: Dict[str, float],
+        title: str,
+        colors: List[str],
+        output_path: Path,
+        style: Optional[ChartStyle] = None
+    ) -> Path:
+        """Create a pie chart file (see MatplotlibEngine.create_pie_chart)."""
+        spec = ChartSpec("pie", {"values": data}, title, tuple(colors or ()))
+        return await self._render_to_file(spec, output_path, style)
+
+    async def create_gauge_chart(
+        self,
+        value: float,
+        max_value: float,
+        title: str,
+        colors: List[str],
+        output_path: Path,
+        style: Optional[ChartStyle] = None
+    ) -> Path:
+        """Create a gauge chart file (see MatplotlibEngine.create_gauge_chart)."""
+        spec = ChartSpec(
+            "gauge", {"value": value, "max_value": max_value}, title, tuple(colors or ())
+        )
+        return await self._render_to_file(spec, output_path, style)
+
+    async def create_number_display(
+        self,
+        value: float,
+        label: str,
+        unit: str,
+        colors: List[str],
+        output_path: Path,
+        style: Optional[ChartStyle] = None
+    ) -> Path:
+        """Create a number display file (see MatplotlibEngine.create_number_display)."""
+        spec = ChartSpec("number", {"value": value, "unit": unit}, label, tuple(colors or ()))
+        return await self._render_to_file(spec, output_path, style)
+
+    async def render_asset(self, spec: ChartSpec, style: Optional[ChartStyle] = None) -> VectorAsset:
+        """
+        Build a chart as a vector drawing for direct embedding in a PDF.
+
+        Args:
+            spec: Chart specification (format, dpi and placement are ignored)
+            style: Base style (engine default when None)
+
+        Returns:
+            VectorAsset wrapping a reportlab Drawing
+        """
+        drawing = self.build_drawing(spec, style)
+        logger.info(f"{spec.chart_type.capitalize()} chart drawn: {spec.title}")
+        return VectorAsset(drawing, drawing.width, drawing.height, "reportlab", spec.title)
+
+    def build_drawing(self, spec: ChartSpec, style: Optional[ChartStyle] = None) -> Drawing:
+        """
+        Build the reportlab Drawing for a chart.
+
+        Args:
+            spec: Chart specification
+            style: Base style (engine default when None)
+
+        Returns:
+            Drawing sized in points
+
+        Raises:
+            ValueError: If the spec's style overrides are invalid
+        """
+        palette = palette_from_hex(list(spec.colors), self._default_colors)
+        resolved_style = style_with_overrides(style or self._default_style, spec.style)
+
+        width_in, height_in = _DRAWING_SIZES.get(
+            spec.chart_type, (resolved_style.figure_width, resolved_style.figure_height)
+        )
+        drawing = Drawing(width_in * POINTS_PER_INCH, height_in * POINTS_PER_INCH)
+        _BUILDERS[spec.chart_type](drawing, spec, palette, resolved_style)
+        return drawing
+
+    async def _render_to_file(
+        self,
+        spec: ChartSpec,
+        output_path: Path,
+        style: Optional[ChartStyle]
+    ) -> Path:
+        """
+        Build a chart and save it.
+
+        Args:
+            spec: Chart specification
+            output_path: Path to save the chart (.pdf, .svg or raster)
+            style: Style for this call (engine default when None)
+
+        Returns:
+            Path to the saved chart
+        """
+        try:
+            drawing = self.build_drawing(spec, style)
+            dpi = spec.dpi or (style or self._default_style).figure_dpi
+            await asyncio.to_thread(self._write_file, drawing, output_path, dpi)
+        except Exception as e:
+            logger.error(f"Failed to create {spec.chart_type} chart: {e}")
+            raise
+
+        logger.info(f"{spec.chart_type.capitalize()} chart saved: {output_path}")
+        return output_path
+
+    @staticmethod
+    def _write_file(drawing: Drawing, output_path: Path, dpi: int) -> None:
+        """Write a drawing to disk in the format given by the file extension."""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        suffix = output_path.suffix.lower()
+        if suffix == ".pdf":
+            renderPDF.drawToFile(drawing, str(output_path))
+        elif suffix == ".svg":
+            renderSVG.drawToFile(drawing, str(output_path))
+        else:
+            renderPM.drawToFile(drawing, str(output_path), fmt="PNG", dpi=dpi)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get engine status information."""
+        return {
+            "engine": "ReportLab",
+            "version": REPORTLAB_VERSION,
+            "backend": "vector",
+            "is_active": self._is_active,
+            "status": "ACTIVE" if self._is_active else "INACTIVE"
+        }
+
+
+def _color(hex_color: str) -> rl_colors.Color:
+    """Convert a hex color code to a reportlab color."""
+    return rl_colors.HexColor(hex_color)
+
+
+def _add_title(drawing: Drawing, title: str, palette: ChartColors, style: ChartStyle) -> float:
+    """
+    Draw the chart title at the top.
+
+    Returns:
+        Y coordinate below the title, where the plot area may end
+    """
+    y = drawing.height - style.title_fontsize - 4
+    drawing.add(String(
+        drawing.width / 2, y, title,
+        fontName=FONT_BOLD, fontSize=style.title_fontsize,
+        fillColor=_color(palette.text), textAnchor="middle"
+    ))
+    return y - style.title_pad
+
+
+def _build_bar_chart(drawing: Drawing, spec: ChartSpec, palette: ChartColors, style: ChartStyle) -> None:
+    """Horizontal bar chart with value labels."""
+    data: Dict[str, float] = spec.data["values"]
+    labels = list(data.keys())
+    values = list(data.values())
+    chart_colors = series_colors(palette, len(data))
+
+    plot_top = _add_title(drawing, spec.title, palette, style)
+    label_width = max((stringWidth(label, FONT, style.tick_fontsize) for label in labels), default=0)
+
+    chart = HorizontalBarChart()
+    chart.x = label_width + 16
+    chart.y = style.label_fontsize + style.tick_fontsize + 16
+    chart.width = drawing.width - chart.x - 60
+    chart.height = plot_top - chart.y
+    chart.data = [values]
+    chart.barWidth = style.bar_width * 10
+    chart.groupSpacing = (1 - style.bar_width) * 10
+    chart.bars.strokeColor = rl_colors.white
+    chart.bars.strokeWidth = style.bar_edge_width
+    for i, color in enumerate(chart_colors[:len(labels)]):
+        chart.bars[(0, i)].fillColor = _color(color)
+
+    # Value labels on bars
+    chart.barLabelFormat = lambda value: f"{value:,.1f}"
+    chart.barLabels.boxAnchor = "w"
+    chart.barLabels.dx = 4
+    chart.barLabels.fontName = FONT
+    chart.barLabels.fontSize = style.tick_fontsize
+    chart.barLabels.fillColor = _color(palette.text)
+
+    chart.categoryAxis.categoryNames = labels
+    chart.categoryAxis.labels.fontName = FONT
+    chart.categoryAxis.labels.fontSize = style.tick_fontsize
+    chart.categoryAxis.strokeColor = _color(palette.grid)
+
+    max_value = max(values) if values else 0
+    chart.valueAxis.valueMin = 0
+    chart.valueAxis.valueMax = max_value * 1.15 if max_value > 0 else 1
+    chart.valueAxis.labels.fontName = FONT
+    chart.valueAxis.labels.fontSize = style.tick_fontsize
+    chart.valueAxis.strokeColor = _color(palette.grid)
+    chart.valueAxis.visibleGrid = style.show_grid
+    chart.valueAxis.gridStrokeColor = _color(palette.grid)
+    chart.valueAxis.labelTextFormat = lambda value: f"{value:,.0f}"
+    drawing.add(chart)
+
+    drawing.add(String(
+        chart.x + chart.width / 2, 4, "Value",
+        fontName=FONT, fontSize=style.label_fontsize,
+        fillColor=_color(palette.text), textAnchor="middle"
+    ))
+
+
+def _build_line_chart(drawing: Drawing, spec: ChartSpec, palette: ChartColors, style: ChartStyle) -> None:
+    """Line chart with markers, one line per series."""
+    data: Dict[str, List[float]] = spec.data["series"]
+    chart_colors = series_colors(palette, len(data))
+    show_legend = style.show_legend and len(data) > 1
+
+    plot_top = _add_title(drawing, spec.title, palette, style)
+    if show_legend:
+        plot_top -= style.legend_fontsize + 10
+
+    points = max((len(values) for values in data.values()), default=0)
+    labels = [str(label) for label in spec.data.get("labels") or range(points)]
+    # Long label runs are slanted; reserve their height below the axis
+    slanted = len(labels) > 6
+    label_height = style.tick_fontsize
+    if slanted:
+        label_height = max(stringWidth(label, FONT, style.tick_fontsize) for label in labels) * 0.5
+
+    chart = HorizontalLineChart()
+    chart.x = style.label_fontsize + 48
+    chart.y = style.label_fontsize + label_height + 16
+    chart.width = drawing.width - chart.x - 24
+    chart.height = plot_top - chart.y
+    chart.data = [list(values) for values in data.values()]
+    chart.joinedLines = 1
+
+    for i in range(len(data)):
+        color = _color(chart_colors[i % len(chart_colors)])
+        marker = makeMarker("FilledCircle")
+        marker.size = style.marker_size
+        marker.fillColor = rl_colors.white
+        marker.strokeColor = color
+        marker.strokeWidth = 2
+        chart.lines[i].strokeColor = color
+        chart.lines[i].strokeWidth = style.line_width
+        chart.lines[i].symbol = marker
+
+    chart.categoryAxis.categoryNames = labels
+    if slanted:
+        chart.categoryAxis.labels.angle = 30
+        chart.categoryAxis.labels.boxAnchor = "ne"
+    chart.categoryAxis.labels.fontName = FONT
+    chart.categoryAxis.labels.fontSize = style.tick_fontsize
+    chart.categoryAxis.strokeColor = _color(palette.grid)
+    chart.categoryAxis.visibleGrid = style.show_grid
+    chart.categoryAxis.gridStrokeColor = _color(palette.grid)
+
+    chart.valueAxis.labels.fontName = FONT
+    chart.valueAxis.labels.fontSize = style.tick_fontsize
+    chart.valueAxis.strokeColor = _color(palette.grid)
+    chart.valueAxis.visibleGrid = style.show_grid
+    chart.valueAxis.gridStrokeColor = _color(palette.grid)
+    chart.valueAxis.labelTextFormat = lambda value: f"{value:,.0f}"
+    drawing.add(chart)
+
+    drawing.add(String(
+        chart.x + chart.width / 2, 4, "Period",
+        fontName=FONT, fontSize=style.label_fontsize,
+        fillColor=_color(palette.text), textAnchor="middle"
+    ))
+
+    if show_legend:
+        legend = Legend()
+        legend.x = chart.x
+        legend.y = plot_top + style.legend_fontsize + 4
+        legend.alignment = "right"
+        legend.columnMaximum = 1
+        legend.fontName = FONT
+        legend.fontSize = style.legend_fontsize
+        legend.colorNamePairs = [
+            (_color(chart_colors[i % len(chart_colors)]), name) for i, name in enumerate(data)
+        ]
+        drawing.add(legend)
+
+
+def _build_pie_chart(drawing: Drawing, spec: ChartSpec, palette: ChartColors, style: ChartStyle) -> None:
+    """Pie chart with the first segment pulled out."""
+    data: Dict[str, float] = spec.data["values"]
+    labels = list(data.keys())
+    values = list(data.values())
+    chart_colors = series_colors(palette, len(data))
+    total = sum(values) or 1
+
+    plot_top = _add_title(drawing, spec.title, palette, style)
+    # Leave room around the pie for the side labels
+    size = min(drawing.width * 0.5, plot_top * 0.75)
+
+    pie = Pie()
+    pie.x = (drawing.width - size) / 2
+    pie.y = (plot_top - size) / 2
+    pie.width = size
+    pie.height = size
+    pie.data = values
+    pie.labels = [f"{label} ({value / total * 100:.1f}%)" for label, value in zip(labels, values)]
+    pie.startAngle = style.pie_start_angle
+    pie.direction = "anticlockwise"
+    pie.sideLabels = True
+    pie.slices.strokeColor = rl_colors.white
+    pie.slices.strokeWidth = 2
+    pie.slices.fontName = FONT
+    pie.slices.fontSize = style.label_fontsize
+    pie.slices.fontColor = _color(palette.text)
+    # Explode factors are fractions of the radius, as in matplotlib
+    pie.slices.popout = style.pie_explode_factor * size / 2
+    for i, color in enumerate(chart_colors[:len(values)]):
+        pie.slices[i].fillColor = _color(color)
+    if values:
+        pie.slices[0].popout = style.pie_explode_factor * size
+    drawing.add(pie)
+
+
+def _build_gauge_chart(drawing: Drawing, spec: ChartSpec, palette: ChartColors, style: ChartStyle) -> None:
+    """Half-circle gauge showing a value against its maximum."""
+    value: float = spec.data["value"]
+    max_value: float = spec.data["max_value"]
+    percentage = min(value / max_value, 1.0) if max_value > 0 else 0
+
+    cx = drawing.width / 2
+    cy = drawing.height * 0.3
+    radius = drawing.height * 0.5
+    inner_radius = radius * (1 - style.gauge_thickness)
+
+    # Background arc
+    drawing.add(Wedge(
+        cx, cy, radius, 0, 180, radius1=inner_radius,
+        fillColor=_color("#e5e7eb"), strokeColor=rl_colors.white, strokeWidth=2
+    ))
+
+    # Gauge color follows the value unless colors were given explicitly
+    if spec.colors:
+        gauge_color = palette.primary
+    elif percentage < 0.33:
+        gauge_color = palette.accent
+    elif percentage < 0.66:
+        gauge_color = palette.secondary
+    else:
+        gauge_color = palette.primary
+
+    # Value arc
+    if percentage > 0:
+        drawing.add(Wedge(
+            cx, cy, radius, 180 - percentage * 180, 180, radius1=inner_radius,
+            fillColor=_color(gauge_color), strokeColor=rl_colors.white, strokeWidth=2
+        ))
+
+    text_color = _color(palette.text)
+    drawing.add(String(cx, cy + 12, f"{value:,.1f}", fontName=FONT_BOLD, fontSize=28,
+                       fillColor=text_color, textAnchor="middle"))
+    drawing.add(String(cx, cy - 10, f"{percentage * 100:.0f}%", fontName=FONT, fontSize=14,
+                       fillColor=text_color, textAnchor="middle"))
+    drawing.add(String(cx, drawing.height - style.title_fontsize - 4, spec.title,
+                       fontName=FONT_BOLD, fontSize=style.title_fontsize,
+                       fillColor=text_color, textAnchor="middle"))
+
+    # Min and max labels
+    label_y = cy - style.tick_fontsize - 6
+    drawing.add(String(cx - (radius + inner_radius) / 2, label_y, "0", fontName=FONT,
+                       fontSize=style.tick_fontsize, fillColor=text_color, textAnchor="middle"))
+    drawing.add(String(cx + (radius + inner_radius) / 2, label_y, f"{max_value:,.0f}", fontName=FONT,
+                       fontSize=style.tick_fontsize, fillColor=text_color, textAnchor="middle"))
+
+
+def _build_number_display(drawing: Drawing, spec: ChartSpec, palette: ChartColors, style: ChartStyle) -> None:
+    """Large formatted number with a label."""
+    value: float = spec.data["value"]
+    unit: str = spec.data.get("unit") or ""
+
+    if value >= 1_000_000:
+        value_text = f'{value / 1_000_000:.1f}M'
+    elif value >= 1_000:
+        value_text = f'{value / 1_000:.1f}K'
+    else:
+        value_text = f'{value:,.0f}'
+
+    if unit and unit not in ['items', 'units']:
+        if unit == '%':
+            value_text = f'{value:.1f}%'
+        elif unit in ['USD', 'EUR', 'GBP']:
+            value_text = f'${value:,.0f}' if unit == 'USD' else f'{unit} {value:,.0f}'
+
+    drawing.add(String(drawing.width / 2, drawing.height * 0.5, value_text,
+                       fontName=FONT_BOLD, fontSize=48,
+                       fillColor=_color(palette.primary), textAnchor="middle"))
+    drawing.add(String(drawing.width / 2, drawing.height * 0.25, spec.title,
+                       fontName=FONT, fontSize=16,
+                       fillColor=_color(palette.text), textAnchor="middle"))
+
+
+_BUILDERS: Dict[str, Callable[..., None]] = {
+    "bar": _build_bar_chart,
+    "line": _build_line_chart,
+    "pie": _build_pie_chart,
+    "gauge": _build_gauge_chart,
+    "number": _build_number_display
+}
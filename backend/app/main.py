@@ -8,7 +8,10 @@ import os
 from app.config import settings
 # from app.database import connect_to_mongo, close_mongo_connection
 # Routes
-from app.presentation.routes import infographic_routes, invoice_routes, generation_routes, credits_routes
+from app.presentation.routes import infographic_routes, invoice_routes, generation_routes, credits_routes, chart_routes
+from app.infrastructure.ai_providers.http_sessions import close_http_sessions
+from app.infrastructure.visualization.render_pool import start_render_pool, shutdown_render_pool
+from app.infrastructure.storage.retention import RetentionSweeper
 import asyncio
 
 # Debug: Print environment variables at startup
@@ -39,12 +42,23 @@ async def lifespan(app: FastAPI):
     os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
     os.makedirs(settings.PDF_OUTPUT_DIR, exist_ok=True)
 
+    # Warm chart render workers before the first request
+    start_render_pool()
+
+    # Expire generated files on disk (this app keeps no documents in MongoDB)
+    retention_sweeper = RetentionSweeper()
+    if settings.RETENTION_ENABLED:
+        retention_sweeper.start()
+
     # Start Bitcoin payment background processor
     # processor_task = asyncio.create_task(bitcoin_payment_processor.start_background_processor())
 
     yield
 
     # Shutdown
+    await retention_sweeper.stop()
+    await close_http_sessions()
+    shutdown_render_pool()
     # bitcoin_payment_processor.stop_background_processor()
     # await close_mongo_connection()
 
@@ -77,6 +91,7 @@ app.include_router(infographic_routes.router, prefix=settings.API_PREFIX)
 app.include_router(invoice_routes.router, prefix=f"{settings.API_PREFIX}/invoice", tags=["invoices"])
 app.include_router(generation_routes.router, prefix=settings.API_PREFIX)
 app.include_router(credits_routes.router, prefix=f"{settings.API_PREFIX}/credits", tags=["credits"])
+app.include_router(chart_routes.router, prefix=settings.API_PREFIX)
 # app.include_router(auth.router, prefix=f"{settings.API_PREFIX}/auth", tags=["authentication"])
 # app.include_router(admin.router, prefix=f"{settings.API_PREFIX}/admin", tags=["admin"])
 # app.include_router(bitcoin.router, prefix=f"{settings.API_PREFIX}/bitcoin", tags=["bitcoin-payments"])
@@ -23,7 +23,10 @@ from app.domain.interfaces.auth_service import IAuthService
 from app.infrastructure.persistence.in_memory_user_repository import InMemoryUserRepository
 from app.infrastructure.persistence.mongodb_user_repository import MongoDBUserRepository
 from app.infrastructure.persistence.database import connect_to_mongo, close_mongo_connection, get_database
+from app.infrastructure.persistence.indexes import ensure_indexes
 from app.infrastructure.auth.jwt_auth_service import JWTAuthService
+from app.infrastructure.ai_providers.http_sessions import close_http_sessions
+from app.infrastructure.visualization.render_pool import start_render_pool, shutdown_render_pool
 
 # Import application use cases
 from app.application.use_cases.register_user import RegisterUserUseCase
@@ -34,6 +37,7 @@ from app.presentation.routes import auth_routes
 from app.presentation.routes import invoice_routes
 from app.presentation.routes import credits_routes
 from app.presentation.routes import generation_routes
+from app.presentation.routes import chart_routes
 
 # Global instances (in production, use proper dependency injection container)
 user_repository: IUserRepository = None
@@ -59,6 +63,8 @@ async def lifespan(app: FastAPI):
         database = get_database()
         user_repository = MongoDBUserRepository(database)
         print("✅ Using MongoDB for user persistence")
+        if settings.MONGODB_ENSURE_INDEXES:
+            await ensure_indexes(database)
     except Exception as e:
         print(f"⚠️ MongoDB not available: {e}")
         print("⚠️ Falling back to in-memory repository")
@@ -88,12 +94,17 @@ async def lifespan(app: FastAPI):
     os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
     os.makedirs(settings.PDF_OUTPUT_DIR, exist_ok=True)
 
+    # Warm chart render workers before the first request
+    start_render_pool()
+
     print("Authentication system initialized successfully!")
 
     yield
 
     # Shutdown
     print("Shutting down RapidDocs...")
+    await close_http_sessions()
+    shutdown_render_pool()
     await close_mongo_connection()
 
 
@@ -173,6 +184,12 @@ app.include_router(
     tags=["Document Generation"]
 )
 
+# Include chart routes (direct chart rendering)
+app.include_router(
+    chart_routes.router,
+    prefix="/api/v1"
+)
+
 
 @app.get("/health")
 async def health_check():
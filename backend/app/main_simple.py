@@ -1,7 +1,7 @@
 from fastapi import FastAPI, Form, UploadFile, File, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, JSONResponse, HTMLResponse, Response
+from fastapi.responses import FileResponse, JSONResponse, HTMLResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
 from contextlib import asynccontextmanager
@@ -12,10 +12,8 @@ import uuid
 from pathlib import Path
 from datetime import datetime
 import logging
-import cairosvg
 from PIL import Image
 import io
-import motor.motor_asyncio
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from app.config import settings
@@ -23,6 +21,14 @@ from app.services.gemini_service import GeminiService
 from app.services.pdf_service import PDFService
 from app.services.auth_service import AuthService
 from app.services.gridfs_storage import GridFSStorage
+from app.services.job_index import JobIndex
+from app.services.logo_assets import LogoAssetStore
+from app.infrastructure.persistence.indexes import ensure_indexes
+from app.infrastructure.persistence.mongo_client import (
+    close_mongo_client, get_analytics_database, get_mongo_database, get_pool_metrics_listener
+)
+from app.infrastructure.storage.retention import RetentionSweeper
+from app.shared.http_range import RangeNotSatisfiable, http_date, if_range_matches, parse_byte_range
 from app.routes import admin, user_auth
 from app.middleware.auth import AuthMiddleware, security
 
@@ -37,8 +43,10 @@ templates = Jinja2Templates(directory="app/templates")
 async def lifespan(app: FastAPI):
     # Startup
     # Initialize MongoDB connection
-    client = motor.motor_asyncio.AsyncIOMotorClient(settings.MONGODB_URL)
-    app.state.db = client[settings.MONGODB_DB_NAME]
+    app.state.db = get_mongo_database()
+    app.state.analytics_db = get_analytics_database()  # Read-only dashboards and reports
+    if settings.MONGODB_ENSURE_INDEXES:
+        await ensure_indexes(app.state.db)
 
     # Initialize services
     app.state.gemini_service = GeminiService()
@@ -46,6 +54,19 @@ async def lifespan(app: FastAPI):
     app.state.auth_service = AuthService(app.state.db)
     app.state.auth_middleware = AuthMiddleware(app.state.auth_service)
     app.state.gridfs_storage = GridFSStorage(app.state.db)  # GridFS for file storage
+    app.state.logo_assets = LogoAssetStore(app.state.db, app.state.gridfs_storage)  # Deduplicated logos
+
+    async def release_dropped_job_logo(job: dict) -> None:
+        if job.get("logo_sha256"):
+            await app.state.logo_assets.release(job["logo_sha256"])
+
+    # Job status and download lookups; jobs that can never be written give back their logo
+    app.state.job_index = JobIndex(app.state.db, on_dropped=release_dropped_job_logo)
+    if settings.JOB_WRITE_BEHIND_ENABLED:
+        app.state.job_index.start()
+    app.state.retention_sweeper = RetentionSweeper(app.state.db, release_logo=app.state.logo_assets.release)
+    if settings.RETENTION_ENABLED:
+        app.state.retention_sweeper.start()
     app.state.start_time = datetime.utcnow()
 
     logger.info("Services initialized successfully (using MongoDB GridFS for file storage)")
@@ -63,7 +84,9 @@ async def lifespan(app: FastAPI):
     yield
 
     # Shutdown
-    client.close()
+    await app.state.retention_sweeper.stop()
+    await app.state.job_index.stop()  # Flush queued job records
+    close_mongo_client()
 
 
 app = FastAPI(
@@ -301,6 +324,15 @@ async def detailed_health_check(request: Request):
         health_status["services"]["database"] = "error"
         health_status["status"] = "degraded"
 
+    health_status["mongodb_pool"] = get_pool_metrics_listener().get_metrics()
+
+    if hasattr(request.app.state, 'gridfs_storage'):
+        health_status["caches"] = {
+            "pdfs": request.app.state.gridfs_storage.get_cache_metrics(),
+            "jobs": request.app.state.job_index.get_metrics(),
+            "logos": request.app.state.logo_assets.get_metrics()
+        }
+
     return health_status
 
 
@@ -493,65 +525,48 @@ async def generate_document(
             # Set the invoice number to match our job ID
             invoice_data["invoice_number"] = job_id
 
-            # Handle logo upload if provided - process in memory, no filesystem
+            # Normalized logo, shared by every job uploading the same file
             logo_bytes = None
+            logo_sha256 = None
             if logo:
-                content = await logo.read()
-
-                # Check if the uploaded file is SVG
-                if logo.filename.lower().endswith('.svg'):
-                    try:
-                        # Convert SVG to PNG in memory using cairosvg
-                        logo_bytes = cairosvg.svg2png(bytestring=content, output_width=400, output_height=200)
-                        logger.info(f"SVG logo converted to PNG in memory for job {job_id}")
-                    except Exception as e:
-                        logger.error(f"Failed to convert SVG to PNG: {e}")
-                        # Use original content as fallback
-                        logo_bytes = content
-                else:
-                    # For non-SVG files, use as-is
-                    logo_bytes = content
-                    logger.info(f"Logo processed in memory for job {job_id}")
-
-                # Store logo in GridFS for record keeping
-                gridfs = request.app.state.gridfs_storage
-                await gridfs.store_logo(
-                    file_data=logo_bytes,
-                    filename=logo.filename,
-                    job_id=job_id,
-                    content_type="image/png" if logo.filename.lower().endswith('.svg') else logo.content_type
-                )
+                logo_asset = await request.app.state.logo_assets.acquire(await logo.read(), logo.filename)
+                logo_bytes, logo_sha256 = logo_asset.data, logo_asset.sha256
+                logger.info(f"Logo {logo_sha256[:12]} ready for job {job_id}")
 
-            # Generate the PDF to bytes (no filesystem)
+            # Render the PDF straight into GridFS, chunk by chunk (no filesystem)
             logger.info(f"Generating PDF for invoice {job_id}")
-            pdf_bytes = await pdf_service.generate_invoice_pdf_bytes(
-                invoice_data=invoice_data,
-                logo_bytes=logo_bytes
-            )
-
-            logger.info(f"PDF generated successfully ({len(pdf_bytes)} bytes)")
-
-            # Store PDF in GridFS
             gridfs = request.app.state.gridfs_storage
-            pdf_file_id = await gridfs.store_pdf(
-                file_data=pdf_bytes,
-                job_id=job_id,
-                document_type=document_type,
-                metadata={
-                    "invoice_data": invoice_data,
-                    "user_ip": request.client.host if request.client else None
-                }
-            )
+            try:
+                stored_pdf = await gridfs.store_pdf_stream(
+                    render=lambda output: pdf_service.write_invoice_pdf(output, invoice_data, logo_bytes),
+                    job_id=job_id,
+                    document_type=document_type,
+                    metadata={
+                        "invoice_data": invoice_data,
+                        "user_ip": request.client.host if request.client else None
+                    }
+                )
 
-            # Log document generation to database
-            await request.app.state.db.generation_jobs.insert_one({
-                "job_id": job_id,
-                "document_type": document_type,
-                "created_at": datetime.utcnow(),
-                "status": "completed",
-                "pdf_file_id": pdf_file_id,
-                "user_ip": request.client.host if request.client else None
-            })
+                logger.info(f"PDF generated successfully ({stored_pdf['length']} bytes)")
+
+                # Log document generation to database
+                await request.app.state.job_index.record({
+                    "job_id": job_id,
+                    "document_type": document_type,
+                    "created_at": datetime.utcnow(),
+                    "status": "completed",
+                    "pdf_file_id": stored_pdf["file_id"],
+                    "length": stored_pdf["length"],
+                    "checksum": stored_pdf["sha256"],
+                    "expire_at": stored_pdf["expire_at"],
+                    "logo_sha256": logo_sha256,
+                    "user_ip": request.client.host if request.client else None
+                })
+            except BaseException:
+                # No job holds the logo reference yet: give it back
+                if logo_sha256:
+                    await request.app.state.logo_assets.release(logo_sha256)
+                raise
 
             return {
                 "job_id": job_id,
@@ -597,31 +612,13 @@ async def generate_document(
             content = await gemini_service.generate_formal_document_content(document_data)
             logger.info(f"Generated content: {len(content)} characters")
 
-            # Handle logo upload if provided - process in memory
+            # Normalized logo, shared by every job uploading the same file
             logo_bytes = None
+            logo_sha256 = None
             if logo:
-                logo_content = await logo.read()
-
-                # Convert SVG to PNG if needed
-                if logo.filename.lower().endswith('.svg'):
-                    try:
-                        logo_bytes = cairosvg.svg2png(bytestring=logo_content, output_width=400, output_height=200)
-                        logger.info(f"SVG logo converted to PNG in memory for job {job_id}")
-                    except Exception as e:
-                        logger.error(f"Failed to convert SVG to PNG: {e}")
-                        logo_bytes = logo_content
-                else:
-                    logo_bytes = logo_content
-                    logger.info(f"Logo processed in memory for job {job_id}")
-
-                # Store logo in GridFS for record keeping
-                gridfs = request.app.state.gridfs_storage
-                await gridfs.store_logo(
-                    file_data=logo_bytes,
-                    filename=logo.filename,
-                    job_id=job_id,
-                    content_type="image/png" if logo.filename.lower().endswith('.svg') else logo.content_type
-                )
+                logo_asset = await request.app.state.logo_assets.acquire(await logo.read(), logo.filename)
+                logo_bytes, logo_sha256 = logo_asset.data, logo_asset.sha256
+                logger.info(f"Logo {logo_sha256[:12]} ready for job {job_id}")
 
             # Parse color scheme from design spec
             color_scheme = None
@@ -632,40 +629,48 @@ async def generate_document(
 
             # Generate the formal document PDF
             logger.info(f"Generating PDF for formal document {job_id}")
-            pdf_bytes = await pdf_service.generate_formal_document_pdf_bytes(
-                document_data=document_data,
-                content=content,
-                logo_bytes=logo_bytes,
-                color_scheme=color_scheme,
-                use_watermark=use_watermark,
-                edge_decorations=True
-            )
-
-            logger.info(f"Formal document PDF generated successfully ({len(pdf_bytes)} bytes)")
-
-            # Store PDF in GridFS
             gridfs = request.app.state.gridfs_storage
-            pdf_file_id = await gridfs.store_pdf(
-                file_data=pdf_bytes,
-                job_id=job_id,
-                document_type=document_type,
-                metadata={
+            try:
+                stored_pdf = await gridfs.store_pdf_stream(
+                    render=lambda output: pdf_service.write_formal_document_pdf(
+                        output,
+                        document_data=document_data,
+                        content=content,
+                        logo_bytes=logo_bytes,
+                        color_scheme=color_scheme,
+                        use_watermark=use_watermark,
+                        edge_decorations=True
+                    ),
+                    job_id=job_id,
+                    document_type=document_type,
+                    metadata={
+                        "document_data": document_data,
+                        "content_length": len(content),
+                        "user_ip": request.client.host if request.client else None
+                    }
+                )
+
+                logger.info(f"Formal document PDF generated successfully ({stored_pdf['length']} bytes)")
+
+                # Log document generation to database
+                await request.app.state.job_index.record({
+                    "job_id": job_id,
+                    "document_type": document_type,
+                    "created_at": datetime.utcnow(),
+                    "status": "completed",
+                    "pdf_file_id": stored_pdf["file_id"],
+                    "length": stored_pdf["length"],
+                    "checksum": stored_pdf["sha256"],
+                    "expire_at": stored_pdf["expire_at"],
+                    "logo_sha256": logo_sha256,
                     "document_data": document_data,
-                    "content_length": len(content),
                     "user_ip": request.client.host if request.client else None
-                }
-            )
-
-            # Log document generation to database
-            await request.app.state.db.generation_jobs.insert_one({
-                "job_id": job_id,
-                "document_type": document_type,
-                "created_at": datetime.utcnow(),
-                "status": "completed",
-                "pdf_file_id": pdf_file_id,
-                "document_data": document_data,
-                "user_ip": request.client.host if request.client else None
-            })
+                })
+            except BaseException:
+                # No job holds the logo reference yet: give it back
+                if logo_sha256:
+                    await request.app.state.logo_assets.release(logo_sha256)
+                raise
 
             return {
                 "job_id": job_id,
@@ -685,24 +690,18 @@ async def generate_document(
 
 @app.get("/generate/status/{job_id}", dependencies=[Depends(check_auth_or_frontend)])
 async def get_job_status(request: Request, job_id: str):
-    """Get generation job status."""
-    # Check in database first
-    job = await request.app.state.db.generation_jobs.find_one({"job_id": job_id})
-
-    if job and job.get("status") == "completed":
-        return {
-            "job_id": job_id,
-            "status": "completed",
-            "progress": 100,
-            "current_step": "completed",
-            "message": "Document ready for download"
-        }
+    """
+    Get generation job status (one job lookup, cached once completed).
 
-    # Check if PDF exists in GridFS
-    gridfs = request.app.state.gridfs_storage
-    file_info = await gridfs.get_file_info(job_id)
+    A job queued for write-behind by another worker is not in the
+    database yet, so a miss falls back to its GridFS file, which is
+    stored before the generation request returns.
+    """
+    job = await request.app.state.job_index.get(job_id)
+    if job is None and await request.app.state.gridfs_storage.get_file_info(job_id):
+        job = {"status": "completed"}
 
-    if file_info:
+    if job and job.get("status") == "completed":
         return {
             "job_id": job_id,
             "status": "completed",
@@ -723,28 +722,115 @@ async def get_job_status(request: Request, job_id: str):
 
 @app.get("/generate/download/{job_id}", dependencies=[Depends(check_auth_or_frontend)])
 async def download_generated_document(request: Request, job_id: str):
-    """Download generated document PDF from MongoDB GridFS."""
+    """
+    Download generated document PDF.
+
+    Recent documents are served from the local-disk hot cache, keyed by
+    the job checksum; otherwise the job document names the GridFS file,
+    which is opened by _id (jobs recorded without a file ID fall back to
+    a lookup by job metadata) and streamed chunk by chunk, filling the
+    hot cache on full downloads. Whole cached files are sent with
+    FileResponse (by path); a file evicted by another worker in the
+    meantime is served from GridFS instead. Single byte ranges (Range,
+    with If-Range) are answered with 206, and ETag/Last-Modified support
+    conditional requests.
+    """
     try:
-        # Fetch PDF from GridFS
         gridfs = request.app.state.gridfs_storage
-        pdf_bytes = await gridfs.get_pdf(job_id)
+        job = await request.app.state.job_index.get(job_id)
+        checksum = job.get("checksum") if job else None
+
+        async def open_from_gridfs():
+            if job and job.get("pdf_file_id"):
+                grid_out = await gridfs.open_pdf_by_id(job["pdf_file_id"])
+            else:
+                grid_out = await gridfs.open_pdf(job_id)
+            if grid_out is None:
+                logger.error(f"PDF not found in GridFS for job_id: {job_id}")
+                raise HTTPException(status_code=404, detail="Document not found")
+            return grid_out
+
+        cached_file = None
+        if checksum and job.get("length"):
+            cached_file = await gridfs.open_cached_pdf(checksum, job["length"])
+
+        grid_out = None
+        if cached_file is not None:
+            length = job["length"]
+            etag = f'"{checksum}"'
+            last_modified = http_date(job["created_at"])
+        else:
+            grid_out = await open_from_gridfs()
+            length = grid_out.length
+            etag = gridfs.file_etag(grid_out)
+            # The job timestamp keeps validators identical across both tiers
+            last_modified = http_date(job["created_at"] if job and job.get("created_at") else grid_out.upload_date)
+
+        headers = {
+            "Content-Disposition": f"attachment; filename={job_id}.pdf",
+            "Accept-Ranges": "bytes",
+            "ETag": etag,
+            "Last-Modified": last_modified
+        }
 
-        if pdf_bytes:
-            logger.info(f"Serving PDF from GridFS for job_id: {job_id} ({len(pdf_bytes)} bytes)")
-            return Response(
-                content=pdf_bytes,
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+            if cached_file is not None:
+                cached_file.close()
+            return Response(status_code=304, headers=headers)
+
+        byte_range = None
+        if if_range_matches(request.headers.get("if-range"), etag, last_modified):
+            try:
+                byte_range = parse_byte_range(request.headers.get("range"), length)
+            except RangeNotSatisfiable:
+                if cached_file is not None:
+                    cached_file.close()
+                return Response(
+                    status_code=416,
+                    headers={**headers, "Content-Range": f"bytes */{length}"}
+                )
+
+        if byte_range is None:
+            if cached_file is not None:
+                cached_path = cached_file.name
+                cached_file.close()
+                try:
+                    stat_result = os.stat(cached_path)
+                    logger.info(f"Serving cached PDF for job_id: {job_id} ({length} bytes)")
+                    return FileResponse(
+                        cached_path, media_type="application/pdf", headers=headers, stat_result=stat_result
+                    )
+                except FileNotFoundError:
+                    logger.info(f"Cached PDF for job_id {job_id} was evicted, reading from GridFS")
+                    grid_out = await open_from_gridfs()
+
+            logger.info(f"Streaming PDF from GridFS for job_id: {job_id} ({length} bytes)")
+            return StreamingResponse(
+                gridfs.iter_pdf_caching(grid_out, checksum),
                 media_type="application/pdf",
-                headers={
-                    "Content-Disposition": f"attachment; filename={job_id}.pdf",
-                    "Content-Length": str(len(pdf_bytes))
-                }
+                headers={**headers, "Content-Length": str(length)}
             )
 
-        logger.error(f"PDF not found in GridFS for job_id: {job_id}")
-        raise HTTPException(status_code=404, detail="Document not found")
+        start, end = byte_range
+        logger.info(f"Streaming bytes {start}-{end}/{length} of PDF for job_id: {job_id}")
+        if cached_file is not None:
+            body = gridfs.iter_cached_pdf(cached_file, start, end)
+        else:
+            body = gridfs.iter_pdf(grid_out, start, end)
+        return StreamingResponse(
+            body,
+            status_code=206,
+            media_type="application/pdf",
+            headers={
+                **headers,
+                "Content-Range": f"bytes {start}-{end}/{length}",
+                "Content-Length": str(end - start + 1)
+            }
+        )
 
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Failed to download document: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
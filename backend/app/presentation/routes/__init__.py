@@ -6,9 +6,11 @@ Contains API endpoint definitions.
 from . import infographic_routes
 from . import generation_routes
 from . import credits_routes
+from . import chart_routes
 
 __all__ = [
     "infographic_routes",
     "generation_routes",
-    "credits_routes"
+    "credits_routes",
+    "chart_routes"
 ]
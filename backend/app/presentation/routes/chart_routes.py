@@ -0,0 +1,92 @@
+"""
+Chart Routes.
+API endpoint rendering a single chart from its specification.
+"""
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from typing import Optional
+
+from ..schemas.chart_schemas import ChartRenderRequest
+from ...domain.value_objects.chart_spec import ChartSpec
+from ...infrastructure.visualization.matplotlib_engine import MatplotlibEngine
+from ...shared.logger import get_logger
+
+logger = get_logger("chart_routes")
+
+router = APIRouter(prefix="/charts", tags=["Charts"])
+
+_MEDIA_TYPES = {
+    "png": "image/png",
+    "svg": "image/svg+xml"
+}
+
+# Rendered charts never change for a given ETag
+_CACHE_CONTROL = "public, max-age=86400"
+
+
+def get_visualization_engine() -> MatplotlibEngine:
+    """Dependency for visualization engine."""
+    return MatplotlibEngine()
+
+
+def _spec_from_request(request: ChartRenderRequest) -> ChartSpec:
+    """Build a chart spec, surfacing invalid input as a 400 response."""
+    try:
+        return ChartSpec(
+            chart_type=request.chart_type,
+            data=request.data,
+            title=request.title,
+            colors=tuple(request.colors),
+            style=request.style,
+            dpi=request.dpi,
+            image_format=request.format,
+            placement=tuple(request.placement) if request.placement else None
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post(
+    "/render",
+    summary="Render Chart",
+    description="Render a chart specification to PNG or SVG. Identical specifications "
+                "are served from the chart cache; the ETag supports conditional requests.",
+    responses={
+        200: {"content": {"image/png": {}, "image/svg+xml": {}}},
+        304: {"description": "Chart unchanged since the given ETag"}
+    }
+)
+async def render_chart_spec(
+    request: ChartRenderRequest,
+    if_none_match: Optional[str] = Header(None),
+    engine: MatplotlibEngine = Depends(get_visualization_engine)
+) -> Response:
+    """Render a chart and return the image bytes."""
+    spec = _spec_from_request(request)
+
+    try:
+        etag = f'"{engine.cache_key(spec)}"'
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+
+    try:
+        image_bytes = await engine.render(spec)
+    except (KeyError, TypeError, ValueError) as e:
+        # Data that does not match the chart type
+        raise HTTPException(status_code=400, detail=f"Invalid chart data: {e}")
+    except Exception as e:
+        logger.error(f"Chart rendering failed: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to render chart: {str(e)}"
+        )
+
+    return Response(
+        content=image_bytes,
+        media_type=_MEDIA_TYPES[spec.image_format],
+        headers=headers
+    )
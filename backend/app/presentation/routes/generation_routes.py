@@ -15,7 +15,6 @@ import json
 try:
     from ...application.use_cases.generate_invoice import GenerateInvoiceUseCase
     from ...application.dto.invoice_request import InvoiceRequest, InvoiceLineItemDTO
-    from ...infrastructure.ai_providers.huggingface_text_generator import HuggingFaceTextGenerator
     from ...infrastructure.document_renderers.invoice_pdf_renderer import InvoicePDFRenderer
     from ...infrastructure.tables.reportlab_tables import ReportLabTableGenerator
     from ...infrastructure.persistence.mongodb_document_repository import MongoDBDocumentRepository
@@ -27,10 +26,13 @@ except ImportError:
 # Import infographic use case
 from ...application.dto.infographic_request import InfographicRequest, StatisticDTO
 from ...application.use_cases.generate_infographic import GenerateInfographicUseCase
-from ...infrastructure.ai_providers.gemini_text_generator import GeminiTextGenerator
+from ...domain.interfaces.text_generator import ITextGenerator
+from ...domain.interfaces.image_generator import IImageGenerator
+from ...domain.interfaces.visualization_engine import IVisualizationEngine
+from ...infrastructure.ai_providers.coalescing import CoalescingImageGenerator, get_shared_text_generator
 from ...infrastructure.ai_providers.banana_image_generator import BananaImageGenerator
 from ...infrastructure.ai_providers.prompt_analyzer import PromptAnalyzer
-from ...infrastructure.visualization.matplotlib_engine import MatplotlibEngine
+from ...infrastructure.visualization.engine_factory import create_visualization_engine
 from ...infrastructure.document_renderers.infographic_pdf_renderer import InfographicPDFRenderer
 from ...infrastructure.document_renderers.infographic_styles import get_style_preset
 from ...infrastructure.data_import.csv_importer import CSVImporter
@@ -47,25 +49,24 @@ router = APIRouter(prefix="/generate", tags=["Document Generation"])
 
 
 # Dependency injection functions for infographic generation
-def get_text_generator() -> GeminiTextGenerator:
-    """Dependency for text generator."""
-    return GeminiTextGenerator(
-        api_key=settings.GEMINI_API_KEY,
-        model=settings.GEMINI_MODEL
-    )
+def get_text_generator() -> ITextGenerator:
+    """Dependency for text generator (shared so routing statistics and coalescing span requests)."""
+    return get_shared_text_generator()
 
 
-def get_image_generator() -> BananaImageGenerator:
-    """Dependency for image generator."""
-    return BananaImageGenerator(
+def get_image_generator() -> IImageGenerator:
+    """Dependency for image generator (identical concurrent requests are coalesced)."""
+    return CoalescingImageGenerator(BananaImageGenerator(
         api_key=settings.HUGGINGFACE_API_KEY,
-        model=settings.IMAGE_GENERATION_MODEL
-    )
+        model=settings.IMAGE_GENERATION_MODEL,
+        probe_timeout=settings.IMAGE_PROBE_TIMEOUT_SECONDS,
+        deadline=settings.ILLUSTRATION_DEADLINE_SECONDS
+    ))
 
 
-def get_visualization_engine() -> MatplotlibEngine:
-    """Dependency for visualization engine."""
-    return MatplotlibEngine()
+def get_visualization_engine() -> IVisualizationEngine:
+    """Dependency for visualization engine (selected by CHART_ENGINE)."""
+    return create_visualization_engine()
 
 
 def get_document_renderer() -> InfographicPDFRenderer:
@@ -74,7 +75,7 @@ def get_document_renderer() -> InfographicPDFRenderer:
 
 
 def get_prompt_analyzer(
-    text_generator: GeminiTextGenerator = Depends(get_text_generator)
+    text_generator: ITextGenerator = Depends(get_text_generator)
 ) -> PromptAnalyzer:
     """Dependency for prompt analyzer."""
     return PromptAnalyzer(text_generator)
@@ -86,9 +87,9 @@ def get_csv_importer() -> CSVImporter:
 
 
 def get_infographic_use_case(
-    text_generator: GeminiTextGenerator = Depends(get_text_generator),
-    image_generator: BananaImageGenerator = Depends(get_image_generator),
-    visualization_engine: MatplotlibEngine = Depends(get_visualization_engine),
+    text_generator: ITextGenerator = Depends(get_text_generator),
+    image_generator: IImageGenerator = Depends(get_image_generator),
+    visualization_engine: IVisualizationEngine = Depends(get_visualization_engine),
     document_renderer: InfographicPDFRenderer = Depends(get_document_renderer),
     prompt_analyzer: PromptAnalyzer = Depends(get_prompt_analyzer),
     csv_importer: CSVImporter = Depends(get_csv_importer)
@@ -138,10 +139,7 @@ async def generate_document(
                 )
 
             # Build invoice use case
-            inv_text_gen = HuggingFaceTextGenerator(
-                api_key=settings.HUGGINGFACE_API_KEY,
-                model=settings.TEXT_GENERATION_MODEL
-            )
+            inv_text_gen = get_shared_text_generator()
             inv_table_gen = ReportLabTableGenerator()
             inv_renderer = InvoicePDFRenderer(inv_table_gen)
             inv_repo = MongoDBDocumentRepository()
@@ -162,11 +160,7 @@ async def generate_document(
             }
 
             # Use AI to extract invoice data from the user's prompt
-            gemini_gen = GeminiTextGenerator(
-                api_key=settings.GEMINI_API_KEY,
-                model=settings.GEMINI_MODEL
-            )
-            invoice_analyzer = InvoicePromptAnalyzer(gemini_gen)
+            invoice_analyzer = InvoicePromptAnalyzer(get_shared_text_generator())
             extracted = await invoice_analyzer.analyze(description)
             logger.info(f"AI extracted invoice data: vendor={extracted.vendor_name}, client={extracted.client_name}, items={len(extracted.line_items)}")
 
@@ -323,15 +317,15 @@ async def generate_document(
 
             try:
                 # Execute generation
-                output_path = await infographic_use_case.execute(dto)
+                output_path = await infographic_use_case.execute(dto, job=_job_storage[job_id])
 
-                # Update job status
-                _job_storage[job_id] = {
+                # Update job status (keeps the stage timings recorded by the use case)
+                _job_storage[job_id].update({
                     "status": "completed",
                     "progress": 100,
                     "message": "Generation complete",
                     "file_path": str(output_path)
-                }
+                })
 
                 return {
                     "job_id": job_id,
@@ -343,12 +337,12 @@ async def generate_document(
                 }
 
             except Exception as e:
-                _job_storage[job_id] = {
+                _job_storage[job_id].update({
                     "status": "failed",
                     "progress": 0,
                     "message": str(e),
                     "error": str(e)
-                }
+                })
                 raise
 
         elif document_type == "formal":
@@ -382,7 +376,8 @@ async def get_job_status(job_id: str):
             "progress": job.get("progress", 0),
             "message": job.get("message"),
             "file_path": job.get("file_path"),
-            "error": job.get("error")
+            "error": job.get("error"),
+            "stage_timings": job.get("stage_timings")
         }
 
     return {
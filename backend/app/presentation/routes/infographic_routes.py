@@ -22,10 +22,13 @@ from ..schemas.infographic_schemas import (
 )
 from ...application.dto.infographic_request import InfographicRequest, StatisticDTO
 from ...application.use_cases.generate_infographic import GenerateInfographicUseCase
-from ...infrastructure.ai_providers.gemini_text_generator import GeminiTextGenerator
+from ...domain.interfaces.text_generator import ITextGenerator
+from ...domain.interfaces.image_generator import IImageGenerator
+from ...domain.interfaces.visualization_engine import IVisualizationEngine
+from ...infrastructure.ai_providers.coalescing import CoalescingImageGenerator, get_shared_text_generator
 from ...infrastructure.ai_providers.banana_image_generator import BananaImageGenerator
 from ...infrastructure.ai_providers.prompt_analyzer import PromptAnalyzer
-from ...infrastructure.visualization.matplotlib_engine import MatplotlibEngine
+from ...infrastructure.visualization.engine_factory import create_visualization_engine
 from ...infrastructure.document_renderers.infographic_pdf_renderer import InfographicPDFRenderer
 from ...infrastructure.data_import.csv_importer import CSVImporter
 from ...infrastructure.data_import.excel_importer import ExcelImporter
@@ -40,25 +43,24 @@ router = APIRouter(prefix="/infographic", tags=["Infographic Documents"])
 _job_storage = {}
 
 
-def get_text_generator() -> GeminiTextGenerator:
-    """Dependency for text generator."""
-    return GeminiTextGenerator(
-        api_key=settings.GEMINI_API_KEY,
-        model=settings.GEMINI_MODEL
-    )
+def get_text_generator() -> ITextGenerator:
+    """Dependency for text generator (shared so routing statistics and coalescing span requests)."""
+    return get_shared_text_generator()
 
 
-def get_image_generator() -> BananaImageGenerator:
-    """Dependency for image generator."""
-    return BananaImageGenerator(
+def get_image_generator() -> IImageGenerator:
+    """Dependency for image generator (identical concurrent requests are coalesced)."""
+    return CoalescingImageGenerator(BananaImageGenerator(
         api_key=settings.HUGGINGFACE_API_KEY,
-        model=settings.IMAGE_GENERATION_MODEL
-    )
+        model=settings.IMAGE_GENERATION_MODEL,
+        probe_timeout=settings.IMAGE_PROBE_TIMEOUT_SECONDS,
+        deadline=settings.ILLUSTRATION_DEADLINE_SECONDS
+    ))
 
 
-def get_visualization_engine() -> MatplotlibEngine:
-    """Dependency for visualization engine."""
-    return MatplotlibEngine()
+def get_visualization_engine() -> IVisualizationEngine:
+    """Dependency for visualization engine (selected by CHART_ENGINE)."""
+    return create_visualization_engine()
 
 
 def get_document_renderer() -> InfographicPDFRenderer:
@@ -67,7 +69,7 @@ def get_document_renderer() -> InfographicPDFRenderer:
 
 
 def get_prompt_analyzer(
-    text_generator: GeminiTextGenerator = Depends(get_text_generator)
+    text_generator: ITextGenerator = Depends(get_text_generator)
 ) -> PromptAnalyzer:
     """Dependency for prompt analyzer."""
     return PromptAnalyzer(text_generator)
@@ -84,9 +86,9 @@ def get_excel_importer() -> ExcelImporter:
 
 
 def get_infographic_use_case(
-    text_generator: GeminiTextGenerator = Depends(get_text_generator),
-    image_generator: BananaImageGenerator = Depends(get_image_generator),
-    visualization_engine: MatplotlibEngine = Depends(get_visualization_engine),
+    text_generator: ITextGenerator = Depends(get_text_generator),
+    image_generator: IImageGenerator = Depends(get_image_generator),
+    visualization_engine: IVisualizationEngine = Depends(get_visualization_engine),
     document_renderer: InfographicPDFRenderer = Depends(get_document_renderer),
     prompt_analyzer: PromptAnalyzer = Depends(get_prompt_analyzer),
     csv_importer: CSVImporter = Depends(get_csv_importer)
@@ -155,7 +157,8 @@ async def generate_infographic(
             color_scheme=request.color_scheme,
             logo_path=request.logo_path,
             output_format=request.output_format,
-            include_cover_page=request.include_cover_page
+            include_cover_page=request.include_cover_page,
+            preview=request.preview
         )
 
         # Validate request
@@ -174,15 +177,15 @@ async def generate_infographic(
         }
 
         # Execute generation (could be moved to background for long tasks)
-        output_path = await use_case.execute(dto)
+        output_path = await use_case.execute(dto, job=_job_storage[job_id])
 
-        # Update job status
-        _job_storage[job_id] = {
+        # Update job status (keeps the stage timings recorded by the use case)
+        _job_storage[job_id].update({
             "status": "completed",
             "progress": 100,
             "message": "Generation complete",
             "file_path": str(output_path)
-        }
+        })
 
         # Build download URL
         download_url = f"{settings.API_PREFIX}/infographic/download/{job_id}"
@@ -204,12 +207,12 @@ async def generate_infographic(
         raise
     except Exception as e:
         logger.error(f"Infographic generation failed: {e}")
-        _job_storage[job_id] = {
+        _job_storage.setdefault(job_id, {}).update({
             "status": "failed",
             "progress": 0,
             "message": str(e),
             "error": str(e)
-        }
+        })
         raise HTTPException(
             status_code=500,
             detail=f"Failed to generate infographic: {str(e)}"
@@ -237,7 +240,8 @@ async def get_job_status(job_id: str) -> InfographicStatusResponse:
         progress=job.get("progress", 0),
         message=job.get("message"),
         file_path=job.get("file_path"),
-        error=job.get("error")
+        error=job.get("error"),
+        stage_timings=job.get("stage_timings")
     )
 
 
@@ -356,9 +360,9 @@ async def import_statistics_data(
     description="Get the status of all infographic generation components."
 )
 async def get_component_status(
-    text_generator: GeminiTextGenerator = Depends(get_text_generator),
-    image_generator: BananaImageGenerator = Depends(get_image_generator),
-    visualization_engine: MatplotlibEngine = Depends(get_visualization_engine),
+    text_generator: ITextGenerator = Depends(get_text_generator),
+    image_generator: IImageGenerator = Depends(get_image_generator),
+    visualization_engine: IVisualizationEngine = Depends(get_visualization_engine),
     document_renderer: InfographicPDFRenderer = Depends(get_document_renderer)
 ) -> ComponentStatusResponse:
     """Get status of all generation components."""
@@ -23,7 +23,7 @@ from ...infrastructure.document_renderers.invoice_pdf_renderer import InvoicePDF
 from ...infrastructure.tables.reportlab_tables import ReportLabTableGenerator
 from ...infrastructure.storage.file_storage import FileStorage
 from ...infrastructure.persistence.mongodb_document_repository import MongoDBDocumentRepository
-from ...infrastructure.ai_providers.huggingface_text_generator import HuggingFaceTextGenerator
+from ...infrastructure.ai_providers.coalescing import get_shared_text_generator
 from ...config import settings
 
 logger = logging.getLogger(__name__)
@@ -33,11 +33,8 @@ router = APIRouter()
 
 # Dependency injection functions
 def get_text_generator() -> ITextGenerator:
-    """Get text generator instance."""
-    return HuggingFaceTextGenerator(
-        api_key=settings.HUGGINGFACE_API_KEY,
-        model=settings.TEXT_GENERATION_MODEL
-    )
+    """Get the shared routing text generator instance."""
+    return get_shared_text_generator()
 
 
 def get_image_generator() -> IImageGenerator:
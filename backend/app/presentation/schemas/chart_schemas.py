@@ -0,0 +1,78 @@
+"""
+Chart API Schemas.
+Pydantic models for direct chart rendering.
+"""
+
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field, field_validator
+
+from ...config import settings
+from ...domain.value_objects.chart_spec import MAX_PLACEMENT_INCHES, valid_placement
+
+# Longest label or series name accepted in chart data
+MAX_CHART_LABEL_LENGTH = 100
+
+
+class ChartRenderRequest(BaseModel):
+    """Request schema for rendering a single chart."""
+    chart_type: str = Field(..., description="Chart type: bar, line, pie, gauge, number")
+    data: Dict[str, Any] = Field(
+        ...,
+        description="Chart data: bar/pie {'values': {label: value}}, "
+                    "line {'series': {name: [values]}}, "
+                    "gauge {'value': v, 'max_value': m}, number {'value': v, 'unit': u}"
+    )
+    title: str = Field(default="", max_length=200, description="Chart title (label for number displays)")
+    colors: List[str] = Field(default_factory=list, max_length=10, description="Hex color codes")
+    style: Dict[str, Any] = Field(default_factory=dict, description="Chart style overrides")
+    dpi: Optional[int] = Field(None, ge=10, le=600, description="Raster resolution")
+    format: str = Field(default="png", description="Image format: png or svg")
+    placement: Optional[List[float]] = Field(
+        None,
+        min_length=2,
+        max_length=2,
+        description=f"Placement box (width, height) in inches, each at most {MAX_PLACEMENT_INCHES:g}; "
+                    "dpi then applies at that size"
+    )
+
+    @field_validator('chart_type', 'format')
+    @classmethod
+    def lowercase(cls, v: str) -> str:
+        return v.lower()
+
+    @field_validator('data')
+    @classmethod
+    def data_within_limits(cls, v: Dict[str, Any]) -> Dict[str, Any]:
+        """Bound the size of chart data (categories, series, points and labels)."""
+        categories = settings.MAX_CHART_CATEGORIES
+
+        def check_labels(labels, what: str) -> None:
+            if len(labels) > categories:
+                raise ValueError(f"at most {categories} {what} allowed")
+            if any(len(str(label)) > MAX_CHART_LABEL_LENGTH for label in labels):
+                raise ValueError(f"{what} must be at most {MAX_CHART_LABEL_LENGTH} characters")
+
+        values = v.get("values")
+        if isinstance(values, dict):
+            check_labels(values, "values")
+
+        series = v.get("series")
+        if isinstance(series, dict):
+            if len(series) > settings.MAX_CHART_SERIES:
+                raise ValueError(f"at most {settings.MAX_CHART_SERIES} series allowed")
+            check_labels(series, "series names")
+            for name, points in series.items():
+                if isinstance(points, list) and len(points) > categories:
+                    raise ValueError(f"series '{str(name)[:MAX_CHART_LABEL_LENGTH]}' has more than {categories} points")
+
+        labels = v.get("labels")
+        if isinstance(labels, list):
+            check_labels(labels, "labels")
+        return v
+
+    @field_validator('placement')
+    @classmethod
+    def placement_within_page(cls, v: Optional[List[float]]) -> Optional[List[float]]:
+        if v is not None and not valid_placement(v):
+            raise ValueError(f"width and height must be finite and between 0 and {MAX_PLACEMENT_INCHES:g} inches")
+        return v
@@ -3,7 +3,7 @@ Infographic API Schemas.
 Pydantic models for infographic document generation API.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -76,6 +76,10 @@ class InfographicGenerateRequest(BaseModel):
         default=True,
         description="Whether to include a cover page"
     )
+    preview: bool = Field(
+        default=False,
+        description="Render charts at low resolution for a quick draft"
+    )
 
     @field_validator('color_scheme')
     @classmethod
@@ -114,6 +118,10 @@ class InfographicStatusResponse(BaseModel):
     message: Optional[str] = Field(None, description="Status message")
     file_path: Optional[str] = Field(None, description="Path to generated file if completed")
     error: Optional[str] = Field(None, description="Error message if failed")
+    stage_timings: Optional[Dict[str, Dict[str, Any]]] = Field(
+        None,
+        description="Per-stage status, start offset and duration in seconds"
+    )
 
 
 class ImportDataRequest(BaseModel):
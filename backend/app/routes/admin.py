@@ -13,8 +13,11 @@ from app.schemas.auth import (
     ReferralKeyResponse,
     DashboardStats
 )
+from app.config import settings
 from app.services.auth_service import AuthService
 from app.middleware.auth import security, get_current_admin, require_superuser
+from app.infrastructure.persistence.indexes import INDEXES, index_usage_report
+from app.infrastructure.storage.retention import document_retention
 
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
@@ -231,7 +234,7 @@ async def get_dashboard_stats(
 ):
     """Get dashboard statistics (admin only)."""
     auth_service: AuthService = request.app.state.auth_service
-    db = request.app.state.db
+    db = request.app.state.analytics_db  # Counts only; may read from secondaries
 
     # Verify admin
     token_data = auth_service.decode_token(credentials.credentials)
@@ -261,16 +264,18 @@ async def get_dashboard_stats(
     })
 
     # Document generation stats (from generation_jobs collection if exists)
-    total_docs = await db.generation_jobs.count_documents({}) if "generation_jobs" in await db.list_collection_names() else 0
+    # Date counts use the generation_jobs created_at index
+    has_jobs = "generation_jobs" in await db.list_collection_names()
+    total_docs = await db.generation_jobs.estimated_document_count() if has_jobs else 0
     docs_today = await db.generation_jobs.count_documents({
         "created_at": {"$gte": today_start}
-    }) if "generation_jobs" in await db.list_collection_names() else 0
+    }) if has_jobs else 0
     docs_week = await db.generation_jobs.count_documents({
         "created_at": {"$gte": week_start}
-    }) if "generation_jobs" in await db.list_collection_names() else 0
+    }) if has_jobs else 0
     docs_month = await db.generation_jobs.count_documents({
         "created_at": {"$gte": month_start}
-    }) if "generation_jobs" in await db.list_collection_names() else 0
+    }) if has_jobs else 0
 
     # Calculate uptime (from app start time)
     uptime = datetime.utcnow() - request.app.state.start_time
@@ -292,6 +297,68 @@ async def get_dashboard_stats(
     )
 
 
+@router.get("/indexes")
+async def get_index_report(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """Get MongoDB index usage for the registered collections (superuser only)."""
+    auth_service: AuthService = request.app.state.auth_service
+
+    # Verify admin
+    token_data = auth_service.decode_token(credentials.credentials)
+    if not token_data:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    admin = await auth_service.get_admin_by_username(token_data["username"])
+    if not admin or not admin.is_superuser:
+        raise HTTPException(status_code=403, detail="Superuser access required")
+
+    indexes = await index_usage_report(request.app.state.db)
+    return {
+        "indexes": indexes,
+        "unused": [f"{item['collection']}.{item['name']}" for item in indexes if item["ops"] == 0],
+        "missing": [
+            f"{spec.collection}.{spec.name}" for spec in INDEXES
+            if not any(item["collection"] == spec.collection and item["name"] == spec.name for item in indexes)
+        ]
+    }
+
+
+@router.get("/retention")
+async def get_retention_report(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """
+    Dry-run retention report: what the sweeper would delete now (superuser only).
+
+    Also returns the report of the last real sweep in this worker.
+    """
+    auth_service: AuthService = request.app.state.auth_service
+
+    # Verify admin
+    token_data = auth_service.decode_token(credentials.credentials)
+    if not token_data:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    admin = await auth_service.get_admin_by_username(token_data["username"])
+    if not admin or not admin.is_superuser:
+        raise HTTPException(status_code=403, detail="Superuser access required")
+
+    sweeper = request.app.state.retention_sweeper
+    return {
+        "enabled": settings.RETENTION_ENABLED,
+        "legacy_cleanup": settings.RETENTION_LEGACY_CLEANUP,
+        "retention_days": {
+            document_type: retention.days
+            for document_type, retention in document_retention().items()
+        },
+        "pending": await sweeper.sweep(dry_run=True),
+        "last_sweep": sweeper.last_report
+    }
+
+
 @router.delete("/referral-key/{key}")
 async def delete_referral_key(
     request: Request,
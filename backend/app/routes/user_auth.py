@@ -7,6 +7,7 @@ from pydantic import BaseModel, EmailStr
 from passlib.context import CryptContext
 from jose import jwt
 from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
 from app.config import settings
 
 # Password hashing
@@ -195,8 +196,14 @@ async def register(request: Request, registration: UserRegister):
         "role": "user"
     }
 
-    # Insert user
-    result = await db.users.insert_one(user_data)
+    # Insert user (the unique email index catches concurrent registrations)
+    try:
+        result = await db.users.insert_one(user_data)
+    except DuplicateKeyError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User with this email or username already exists"
+        )
     user_data["_id"] = result.inserted_id
 
     # Create initial credits entry
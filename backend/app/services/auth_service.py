@@ -7,6 +7,7 @@ from passlib.context import CryptContext
 from jose import JWTError, jwt
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
 from app.models.admin import AdminUser, ReferralKey
 from app.config import settings
 
@@ -137,7 +138,11 @@ class AuthService:
             "permissions": ["*"] if is_superuser else ["docs:read", "health:read"]
         }
 
-        result = await self.db.admins.insert_one(admin_dict)
+        try:
+            result = await self.db.admins.insert_one(admin_dict)
+        except DuplicateKeyError:
+            # Registered concurrently under the same username or email
+            return None
         admin_dict["_id"] = result.inserted_id
 
         # Update referral key usage
@@ -7,6 +7,9 @@ import logging
 from typing import Dict, Any, Optional, List, Tuple
 import google.generativeai as genai
 
+from app.config import settings
+from app.shared.concurrency import bounded_gather
+
 logger = logging.getLogger(__name__)
 
 class GeminiService:
@@ -429,6 +432,11 @@ class GeminiService:
         if not self.model:
             return self._get_fallback_formal_content(document_data)
 
+        if settings.SECTIONAL_GENERATION_ENABLED and word_count >= settings.SECTIONAL_GENERATION_MIN_WORDS:
+            content = await self._generate_formal_content_sectional(document_data)
+            if content is not None:
+                return content
+
         sections_text = ""
         if sections:
             sections_text = f"\nCover these sections/topics: {', '.join(sections)}"
@@ -480,7 +488,7 @@ class GeminiService:
         """
 
         try:
-            response = self.model.generate_content(system_prompt)
+            response = await self.model.generate_content_async(system_prompt)
             content = response.text.strip()
 
             # Clean up any markdown that might have slipped through
@@ -492,6 +500,139 @@ class GeminiService:
             logger.error(f"Gemini formal content generation failed: {e}")
             return self._get_fallback_formal_content(document_data)
 
+    async def _generate_formal_content_sectional(self, document_data: Dict[str, Any]) -> Optional[str]:
+        """
+        Generate a long formal document as an outline plus concurrent sections.
+
+        Each section is its own Gemini call with its own word budget, bounded by
+        SECTION_GENERATION_CONCURRENCY, and the results are assembled in outline order.
+        Returns None when half or more sections fail, so the caller can fall back
+        to a single generation call.
+        """
+        word_count = document_data.get("word_count", 500)
+        topic = document_data.get("topic", document_data.get("summary", ""))
+
+        outline = await self._generate_formal_outline(document_data)
+
+        # Introduction and conclusion get half the weight of body sections
+        weights = [1.0] * len(outline)
+        if len(outline) >= 3:
+            weights[0] = weights[-1] = 0.5
+        budgets = [max(80, int(word_count * w / sum(weights))) for w in weights]
+
+        logger.info(f"Sectional formal generation: {len(outline)} sections for {word_count} words")
+
+        results = await bounded_gather(
+            [
+                lambda i=i: self._generate_formal_section(document_data, outline, i, budgets[i])
+                for i in range(len(outline))
+            ],
+            limit=settings.SECTION_GENERATION_CONCURRENCY,
+            return_exceptions=True
+        )
+
+        failed = [i for i, result in enumerate(results, start=1) if isinstance(result, Exception)]
+        for i in failed:
+            logger.error(f"Gemini formal section {i} failed: {results[i - 1]}")
+        if len(failed) * 2 >= len(outline):
+            logger.warning(
+                f"{len(failed)} of {len(outline)} formal sections failed, "
+                f"falling back to single-call generation"
+            )
+            return None
+
+        parts = []
+        for i, (heading, result) in enumerate(zip(outline, results), start=1):
+            if isinstance(result, Exception):
+                result = self._generate_additional_content(topic, budgets[i - 1])
+            parts.append(f"{i}. {heading}\n\n{result}")
+
+        return "\n\n".join(parts)
+
+    async def _generate_formal_outline(self, document_data: Dict[str, Any]) -> List[str]:
+        """Generate the ordered list of section headings for a formal document"""
+        title = document_data.get("title", "Formal Document")
+        topic = document_data.get("topic", document_data.get("summary", ""))
+        word_count = document_data.get("word_count", 500)
+        requested = [str(s) for s in document_data.get("sections", []) if s]
+
+        # Roughly one section per 250 words, including introduction and conclusion
+        num_sections = max(3, min(word_count // 250, 12))
+        if requested:
+            num_sections = max(len(requested) + 2, 3)
+
+        system_prompt = f"""
+        Plan the outline of a formal {document_data.get("tone", "professional")} document.
+
+        Title: {title}
+        Topic/Subject: {topic}
+        {"Sections that must be covered: " + ", ".join(requested) if requested else ""}
+
+        Return a JSON array of exactly {num_sections} short section headings in reading order.
+        The first heading is the introduction and the last is the conclusion.
+        Each heading starts with a capital letter and has no trailing period.
+
+        Return ONLY the JSON array, no additional text or markdown.
+        """
+
+        try:
+            response = await self.model.generate_content_async(system_prompt)
+            text = response.text.strip()
+
+            if text.startswith("```json"):
+                text = text[7:]
+            if text.startswith("```"):
+                text = text[3:]
+            if text.endswith("```"):
+                text = text[:-3]
+
+            headings = [str(h).strip().rstrip('.') for h in json.loads(text.strip()) if str(h).strip()]
+            if len(headings) >= 2:
+                return headings[:12]
+
+        except Exception as e:
+            logger.error(f"Gemini formal outline generation failed: {e}")
+
+        return ["Introduction"] + (requested or [f"{topic[:40].strip() or title} Analysis", "Key Considerations"]) + ["Conclusion"]
+
+    async def _generate_formal_section(
+        self,
+        document_data: Dict[str, Any],
+        outline: List[str],
+        index: int,
+        word_budget: int
+    ) -> str:
+        """Generate the body text of one formal document section"""
+        title = document_data.get("title", "Formal Document")
+        topic = document_data.get("topic", document_data.get("summary", ""))
+        tone = document_data.get("tone", "professional")
+        outline_text = "\n".join(f"{i}. {h}" for i, h in enumerate(outline, start=1))
+
+        system_prompt = f"""
+        You are writing ONE section of a formal document.
+
+        Title: {title}
+        Topic/Subject: {topic}
+        Tone: {tone}
+
+        Full outline (for context only):
+        {outline_text}
+
+        Write section {index + 1} of {len(outline)}: "{outline[index]}"
+        Target length: approximately {word_budget} words.
+
+        FORMATTING RULES:
+        1. DO NOT repeat the section heading and DO NOT write any other section
+        2. DO NOT use bullet points (•, -, *) for any enumeration
+        3. For lists, use ONLY letters (a, b, c) for points and roman numerals (i, ii, iii) for sub-points
+        4. Do not use markdown formatting (no #, **, etc.)
+        5. Use formal language appropriate for {tone} documents, with substantive paragraphs
+        """
+
+        config = genai.GenerationConfig(max_output_tokens=min(word_budget * 2, 4000))
+        response = await self.model.generate_content_async(system_prompt, generation_config=config)
+        return self._clean_formal_content(response.text.strip())
+
     def _validate_formal_data(self, data: Dict[str, Any], original_prompt: str) -> Dict[str, Any]:
         """Validate and fill missing formal document data fields"""
         import re
@@ -2,18 +2,171 @@
 GridFS Storage Service for MongoDB file storage.
 Stores logos, PDFs, and other files in MongoDB instead of local filesystem.
 """
+import asyncio
+import concurrent.futures
+import hashlib
+import io
 import logging
-from typing import Optional, Dict, Any
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, Any, Callable, BinaryIO, AsyncIterator
 from datetime import datetime
 from io import BytesIO
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorGridFSBucket, AsyncIOMotorDatabase
 
+from app.config import settings
+from app.infrastructure.storage.disk_cache import DiskLRUCache, get_pdf_cache
+from app.infrastructure.storage.retention import expiry_for
+
 logger = logging.getLogger(__name__)
 
 
+class GridFSUploadSink(io.RawIOBase):
+    """
+    Write-only file object that streams into a GridFS upload stream.
+
+    Meant for synchronous writers (such as ReportLab) running in a worker
+    thread. Writes are cut into fixed-size chunks, and each chunk is
+    written to the upload stream on the event loop before the writer may
+    continue, so at most one chunk is buffered per upload (backpressure).
+    A chunk write taking longer than GRIDFS_WRITE_TIMEOUT_SECONDS fails
+    the render instead of blocking the thread forever.
+    Uploaded chunks can also be copied into a mirror file (the hot cache);
+    a failing mirror is dropped without affecting the upload. A sink whose
+    writer failed is abandoned: nothing more is forwarded, and a close()
+    from any other thread (such as a finalizer on the event loop) never
+    uploads.
+    """
+
+    def __init__(
+        self,
+        grid_in,
+        loop: asyncio.AbstractEventLoop,
+        chunk_size: int,
+        mirror: Optional[BinaryIO] = None
+    ):
+        """
+        Initialize the sink.
+
+        Args:
+            grid_in: Motor GridFS upload stream
+            loop: Event loop owning the upload stream
+            chunk_size: Bytes forwarded per upload write
+            mirror: Optional file receiving a copy of every uploaded chunk
+        """
+        super().__init__()
+        self._grid_in = grid_in
+        self._loop = loop
+        self._chunk_size = chunk_size
+        self._mirror = mirror
+        self._buffer = bytearray()
+        self._bytes_written = 0
+        self._sha256 = hashlib.sha256()
+        self._writer_thread = threading.get_ident()
+        self._abandoned = False
+
+    @property
+    def bytes_written(self) -> int:
+        """Total bytes accepted from the writer."""
+        return self._bytes_written
+
+    @property
+    def sha256(self) -> str:
+        """SHA-256 hex digest of the bytes forwarded so far."""
+        return self._sha256.hexdigest()
+
+    @property
+    def mirrored(self) -> bool:
+        """Whether the mirror file received every forwarded chunk."""
+        return self._mirror is not None
+
+    def close_mirror(self) -> None:
+        """Close the mirror file (a failed flush drops it)."""
+        if self._mirror is not None:
+            try:
+                self._mirror.close()
+            except OSError as e:
+                self._drop_mirror(e)
+
+    def abandon(self) -> None:
+        """Give up after a writer failure: drop the buffer and close without uploading."""
+        self._abandoned = True
+        self._buffer.clear()
+        self.close()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        """Buffer data and forward every full chunk (blocks while uploading)."""
+        if self.closed or self._abandoned:
+            raise ValueError("write to closed sink")
+
+        view = memoryview(data).cast("B")
+        size = len(view)
+        while view:
+            take = self._chunk_size - len(self._buffer)
+            self._buffer += view[:take]
+            view = view[take:]
+            if len(self._buffer) >= self._chunk_size:
+                self._forward()
+
+        self._bytes_written += size
+        return size
+
+    def close(self) -> None:
+        """Forward the last partial chunk. The upload stream stays open."""
+        if not self.closed:
+            try:
+                # Forwarding blocks on the event loop, so only the writer thread may do it
+                if self._buffer and not self._abandoned and threading.get_ident() == self._writer_thread:
+                    self._forward()
+            finally:
+                super().close()
+
+    def _forward(self) -> None:
+        """Upload the buffered chunk and wait for it."""
+        chunk = bytes(self._buffer)
+        self._buffer.clear()
+        self._sha256.update(chunk)
+        future = asyncio.run_coroutine_threadsafe(self._grid_in.write(chunk), self._loop)
+        try:
+            future.result(timeout=settings.GRIDFS_WRITE_TIMEOUT_SECONDS)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(
+                f"GridFS chunk write timed out after {settings.GRIDFS_WRITE_TIMEOUT_SECONDS}s"
+            )
+        if self._mirror is not None:
+            try:
+                self._mirror.write(chunk)
+            except OSError as e:
+                self._drop_mirror(e)
+
+    def _drop_mirror(self, error: OSError) -> None:
+        """Stop mirroring after a write error; the upload continues."""
+        logger.warning(f"Hot cache write failed, uploading without caching: {error}")
+        try:
+            self._mirror.close()
+        except OSError:
+            pass
+        self._mirror = None
+
+
 class GridFSStorage:
-    """Service for storing and retrieving files from MongoDB GridFS."""
+    """
+    Service for storing and retrieving files from MongoDB GridFS.
+
+    Generated PDFs also go through a local-disk hot cache (when enabled),
+    keyed by their SHA-256: streamed uploads are written through to it,
+    full downloads from GridFS fill it, and downloads of recent documents
+    are served from it instead of MongoDB.
+    """
+
+    # Checksums of cache entries verified by this process, kept up to this many
+    VERIFIED_CACHE_ENTRIES = 4096
 
     def __init__(self, db: AsyncIOMotorDatabase):
         """
@@ -27,12 +180,16 @@ class GridFSStorage:
         # Separate buckets for different file types
         self.logos_bucket = AsyncIOMotorGridFSBucket(db, bucket_name="logos")
         self.pdfs_bucket = AsyncIOMotorGridFSBucket(db, bucket_name="pdfs")
+        # Local-disk tier for recent PDFs (None when disabled)
+        self.hot_cache: Optional[DiskLRUCache] = get_pdf_cache()
+        self._verified: "OrderedDict[str, None]" = OrderedDict()
+        self._verify_failures = 0
 
     async def store_logo(
         self,
         file_data: bytes,
         filename: str,
-        job_id: str,
+        job_id: Optional[str] = None,
         content_type: str = "image/png",
         metadata: Optional[Dict[str, Any]] = None
     ) -> str:
@@ -42,7 +199,7 @@ class GridFSStorage:
         Args:
             file_data: Binary content of the logo
             filename: Original filename
-            job_id: Associated job ID
+            job_id: Associated job ID (None for shared logo assets)
             content_type: MIME type of the file
             metadata: Additional metadata
 
@@ -59,7 +216,7 @@ class GridFSStorage:
             }
 
             grid_in = self.logos_bucket.open_upload_stream(
-                filename=f"{job_id}_{filename}",
+                filename=f"{job_id}_{filename}" if job_id else filename,
                 metadata=file_metadata
             )
 
@@ -113,11 +270,13 @@ class GridFSStorage:
         """
         try:
             filename = f"{job_id}.pdf"
+            generated_at = datetime.utcnow()
             file_metadata = {
                 "job_id": job_id,
                 "document_type": document_type,
                 "content_type": "application/pdf",
-                "generated_at": datetime.utcnow(),
+                "generated_at": generated_at,
+                "expire_at": expiry_for(document_type, generated_at),
                 **(metadata or {})
             }
 
@@ -137,31 +296,140 @@ class GridFSStorage:
             logger.error(f"Failed to store PDF in GridFS: {e}")
             raise
 
+    async def store_pdf_stream(
+        self,
+        render: Callable[[BinaryIO], None],
+        job_id: str,
+        document_type: str = "invoice",
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Render a PDF straight into GridFS.
+
+        The render callable runs in a worker thread and writes into a
+        GridFSUploadSink, so the document is uploaded chunk by chunk and
+        never held as one complete byte string by this service. The
+        SHA-256 of the content is stored on the file document (used as
+        download ETag). The chunks are also written through to the hot
+        cache (cache errors only skip caching). On failure or cancellation
+        the partial upload is aborted.
+
+        Args:
+            render: Writes the PDF into the given file object
+            job_id: Job ID (used as filename)
+            document_type: Type of document (invoice, infographic, formal)
+            metadata: Additional metadata
+
+        Returns:
+            Dict with file_id (GridFS file ID as string), length (bytes),
+            sha256 (hex digest of the content) and expire_at (retention
+            expiry, None to keep forever)
+        """
+        filename = f"{job_id}.pdf"
+        generated_at = datetime.utcnow()
+        file_metadata = {
+            "job_id": job_id,
+            "document_type": document_type,
+            "content_type": "application/pdf",
+            "generated_at": generated_at,
+            "expire_at": expiry_for(document_type, generated_at),
+            **(metadata or {})
+        }
+
+        grid_in = self.pdfs_bucket.open_upload_stream(
+            filename=filename,
+            chunk_size_bytes=settings.GRIDFS_CHUNK_BYTES,
+            metadata=file_metadata
+        )
+        cache_path = self.hot_cache.temp_path() if self.hot_cache else None
+
+        def render_into_sink() -> GridFSUploadSink:
+            mirror = self._open_cache_temp(cache_path) if cache_path else None
+            sink = GridFSUploadSink(grid_in, loop, settings.GRIDFS_CHUNK_BYTES, mirror)
+            try:
+                render(sink)
+                sink.close()
+            except BaseException:
+                sink.abandon()
+                raise
+            finally:
+                sink.close_mirror()
+            return sink
+
+        loop = asyncio.get_running_loop()
+        try:
+            sink = await asyncio.to_thread(render_into_sink)
+            await grid_in.set("sha256", sink.sha256)
+            await grid_in.close()
+        except BaseException as e:
+            # Also reached on cancellation (client gone, shutdown): never leave orphan chunks
+            logger.error(f"Failed to stream PDF into GridFS: {e!r}")
+            try:
+                await grid_in.abort()
+            except Exception as abort_error:
+                logger.error(f"Failed to abort GridFS upload {grid_in._id}: {abort_error}")
+            if cache_path:
+                self._discard_cache_temp(cache_path)
+            raise
+
+        if cache_path and sink.mirrored:
+            await asyncio.to_thread(self.hot_cache.adopt_sync, sink.sha256, cache_path)
+            self._mark_verified(sink.sha256)
+        elif cache_path:
+            await asyncio.to_thread(self._discard_cache_temp, cache_path)
+
+        file_id = str(grid_in._id)
+        logger.info(f"Streamed PDF into GridFS: {file_id} for job {job_id} ({sink.bytes_written} bytes)")
+        return {
+            "file_id": file_id,
+            "length": sink.bytes_written,
+            "sha256": sink.sha256,
+            "expire_at": file_metadata["expire_at"]
+        }
+
     async def get_pdf(self, job_id: str) -> Optional[bytes]:
         """
         Retrieve a PDF from GridFS by job ID.
 
+        Reads the whole file into memory; use open_pdf and iter_pdf to
+        stream it instead.
+
         Args:
             job_id: Job ID to search for
 
         Returns:
             Binary content of the PDF or None if not found
         """
+        grid_out = await self.open_pdf(job_id)
+        if grid_out is None:
+            return None
         try:
-            # Find the file by job_id in metadata
-            cursor = self.pdfs_bucket.find({"metadata.job_id": job_id})
-            async for file_doc in cursor:
-                # file_doc is a document with _id, we need to open a download stream
-                grid_out = await self.pdfs_bucket.open_download_stream(file_doc._id)
-                data = await grid_out.read()
-                return data
+            return await grid_out.read()
+        except Exception as e:
+            logger.error(f"Failed to retrieve PDF from GridFS: {e}")
+            return None
+
+    async def open_pdf(self, job_id: str):
+        """
+        Open a PDF for reading by job ID, without reading its content.
+
+        Args:
+            job_id: Job ID to search for
+
+        Returns:
+            Motor GridOut (length, upload_date, metadata, seek/read)
+            or None if not found
+        """
+        try:
+            # Find the file by job_id in metadata; cursor results are readable
+            cursor = self.pdfs_bucket.find({"metadata.job_id": job_id}, limit=1)
+            async for grid_out in cursor:
+                return grid_out
 
             # Fallback: try to find by filename
             filename = f"{job_id}.pdf"
             try:
-                grid_out = await self.pdfs_bucket.open_download_stream_by_name(filename)
-                data = await grid_out.read()
-                return data
+                return await self.pdfs_bucket.open_download_stream_by_name(filename)
             except Exception:
                 pass  # File not found by name
 
@@ -169,9 +437,238 @@ class GridFSStorage:
             return None
 
         except Exception as e:
-            logger.error(f"Failed to retrieve PDF from GridFS: {e}")
+            logger.error(f"Failed to open PDF from GridFS: {e}")
             return None
 
+    async def open_pdf_by_id(self, file_id: str):
+        """
+        Open a PDF for reading by GridFS file ID (one lookup by _id).
+
+        Args:
+            file_id: GridFS file ID
+
+        Returns:
+            Motor GridOut or None if not found
+        """
+        try:
+            return await self.pdfs_bucket.open_download_stream(ObjectId(file_id))
+        except Exception as e:
+            logger.warning(f"Failed to open PDF from GridFS by ID: {e}")
+            return None
+
+    @staticmethod
+    async def iter_pdf(grid_out, start: int = 0, end: Optional[int] = None) -> AsyncIterator[bytes]:
+        """
+        Stream a byte range of an opened file chunk by chunk.
+
+        Args:
+            grid_out: File returned by open_pdf
+            start: First byte position
+            end: Last byte position, inclusive (None for the end of the file)
+
+        Yields:
+            Chunks of at most GRIDFS_CHUNK_BYTES
+        """
+        if end is None:
+            end = grid_out.length - 1
+        grid_out.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            data = await grid_out.read(min(settings.GRIDFS_CHUNK_BYTES, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            yield data
+
+    async def open_cached_pdf(self, checksum: str, length: int) -> Optional[BinaryIO]:
+        """
+        Find a PDF in the hot cache and open it.
+
+        Every hit is checked against the expected length. The first hit of
+        an entry in this process also re-hashes the file against the
+        checksum (entries this process wrote are trusted); a mismatching
+        entry is deleted and reported as a miss. The file is returned open,
+        so it stays readable even if another worker evicts it meanwhile; an
+        entry evicted before it could be opened is a miss.
+
+        Args:
+            checksum: SHA-256 of the PDF (job checksum)
+            length: Expected size in bytes
+
+        Returns:
+            The verified cached file opened for reading (the caller closes
+            it, iter_cached_pdf does), or None to read from GridFS
+        """
+        if self.hot_cache is None or not checksum:
+            return None
+
+        path = await asyncio.to_thread(self.hot_cache.path_sync, checksum)
+        if path is None:
+            return None
+        if checksum in self._verified:
+            self._verified.move_to_end(checksum)
+            valid = await asyncio.to_thread(self._cache_size_matches, path, length)
+        else:
+            valid = await asyncio.to_thread(self._cache_file_matches, path, checksum, length)
+        if not valid:
+            self._verify_failures += 1
+            self._verified.pop(checksum, None)
+            logger.warning(f"Cached PDF {checksum[:12]} failed verification, reading from GridFS")
+            await asyncio.to_thread(self.hot_cache.discard_sync, checksum)
+            return None
+
+        self._mark_verified(checksum)
+        try:
+            return await asyncio.to_thread(open, path, "rb")
+        except OSError:
+            logger.info(f"Cached PDF {checksum[:12]} was evicted, reading from GridFS")
+            return None
+
+    async def iter_pdf_caching(self, grid_out, checksum: Optional[str]) -> AsyncIterator[bytes]:
+        """
+        Stream a whole file from GridFS while filling the hot cache.
+
+        The copy is adopted only if the download completes and its SHA-256
+        matches the checksum; otherwise it is discarded. Cache file errors
+        stop the copy but never the download.
+
+        Args:
+            grid_out: File returned by open_pdf / open_pdf_by_id
+            checksum: Expected SHA-256 (no caching when None)
+
+        Yields:
+            Chunks of at most GRIDFS_CHUNK_BYTES
+        """
+        if self.hot_cache is None or not checksum:
+            async for data in self.iter_pdf(grid_out):
+                yield data
+            return
+
+        cache_path = self.hot_cache.temp_path()
+        mirror = await asyncio.to_thread(self._open_cache_temp, cache_path)
+        digest = hashlib.sha256()
+        complete = False
+        try:
+            async for data in self.iter_pdf(grid_out):
+                if mirror is not None:
+                    try:
+                        await asyncio.to_thread(mirror.write, data)
+                        digest.update(data)
+                    except OSError as e:
+                        logger.warning(f"Hot cache write failed, streaming without caching: {e}")
+                        await asyncio.to_thread(self._close_cache_temp, mirror)
+                        mirror = None
+                yield data
+            complete = True
+        finally:
+            if mirror is not None and not await asyncio.to_thread(self._close_cache_temp, mirror):
+                mirror = None
+            if complete and mirror is not None and digest.hexdigest() == checksum:
+                await asyncio.to_thread(self.hot_cache.adopt_sync, checksum, cache_path)
+                self._mark_verified(checksum)
+            else:
+                await asyncio.to_thread(self._discard_cache_temp, cache_path)
+
+    @staticmethod
+    async def iter_cached_pdf(f: BinaryIO, start: int, end: int) -> AsyncIterator[bytes]:
+        """
+        Stream a byte range of a cached PDF, closing it afterwards.
+
+        Args:
+            f: File from open_cached_pdf
+            start: First byte position
+            end: Last byte position, inclusive
+
+        Yields:
+            Chunks of at most GRIDFS_CHUNK_BYTES
+        """
+        with f:
+            f.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                data = await asyncio.to_thread(f.read, min(settings.GRIDFS_CHUNK_BYTES, remaining))
+                if not data:
+                    break
+                remaining -= len(data)
+                yield data
+
+    def get_cache_metrics(self) -> Optional[Dict[str, Any]]:
+        """Get hot cache metrics (None when the cache is disabled)."""
+        if self.hot_cache is None:
+            return None
+        return {
+            **self.hot_cache.get_metrics(),
+            "verified_entries": len(self._verified),
+            "verification_failures": self._verify_failures
+        }
+
+    def _mark_verified(self, checksum: str) -> None:
+        """Remember a cache entry whose content matches its checksum."""
+        self._verified[checksum] = None
+        self._verified.move_to_end(checksum)
+        while len(self._verified) > self.VERIFIED_CACHE_ENTRIES:
+            self._verified.popitem(last=False)
+
+    @staticmethod
+    def _cache_size_matches(path: Path, length: int) -> bool:
+        """Check a cached file's size."""
+        try:
+            return path.stat().st_size == length
+        except OSError:
+            return False
+
+    @staticmethod
+    def _cache_file_matches(path: Path, checksum: str, length: int) -> bool:
+        """Check a cached file's size and SHA-256."""
+        digest = hashlib.sha256()
+        try:
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(block)
+                return f.tell() == length and digest.hexdigest() == checksum
+        except OSError:
+            return False
+
+    @staticmethod
+    def _open_cache_temp(path: Path) -> Optional[BinaryIO]:
+        """Open a hot cache temp file for writing (None if the cache is unwritable)."""
+        try:
+            return open(path, "wb")
+        except OSError as e:
+            logger.warning(f"Hot cache unavailable, continuing without caching: {e}")
+            return None
+
+    @staticmethod
+    def _close_cache_temp(mirror: BinaryIO) -> bool:
+        """Close a hot cache temp file; False if its data may not have been written."""
+        try:
+            mirror.close()
+            return True
+        except OSError as e:
+            logger.warning(f"Hot cache write failed, not caching: {e}")
+            return False
+
+    @staticmethod
+    def _discard_cache_temp(path: Path) -> None:
+        """Remove an unfinished hot cache file."""
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    @staticmethod
+    def file_etag(grid_out) -> str:
+        """
+        Strong ETag for a stored file.
+
+        Uses the SHA-256 recorded at upload, then a legacy GridFS md5, and
+        otherwise the file id and length (GridFS files never change).
+        """
+        checksum = getattr(grid_out, "sha256", None) or getattr(grid_out, "md5", None)
+        if not checksum:
+            checksum = f"{grid_out._id}-{grid_out.length}"
+        return f'"{checksum}"'
+
     async def get_pdf_by_id(self, file_id: str) -> Optional[bytes]:
         """
         Retrieve a PDF from GridFS by file ID.
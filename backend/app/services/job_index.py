@@ -0,0 +1,291 @@
+"""
+Job Index Service.
+Generation job documents as the single source of truth for status polls
+and downloads, with an in-process TTL cache of completed jobs and
+write-behind persistence of new jobs.
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import BulkWriteError, PyMongoError
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Fields status and download handlers need; large payloads stay in the database
+JOB_PROJECTION = {
+    "_id": 0,
+    "job_id": 1,
+    "document_type": 1,
+    "status": 1,
+    "created_at": 1,
+    "pdf_file_id": 1,
+    "length": 1,
+    "checksum": 1
+}
+
+
+class JobIndex:
+    """
+    Job lookups by job ID against the generation_jobs collection.
+
+    A completed job row carries everything a download needs (GridFS file
+    ID, length, SHA-256 checksum), so a poll-then-download costs at most
+    one job lookup plus one GridFS open by _id. Completed jobs never
+    change, so they are cached in memory for ttl_seconds; other states
+    are always read from the database.
+
+    Once started, record() is write-behind: the job is queued (bounded,
+    so callers wait when MongoDB falls behind) and a background flusher
+    inserts queued jobs in batches with insert_many. Failed batches are
+    retried with backoff until they succeed; a batch failing for another
+    reason (a document BSON cannot encode) is written job by job and the
+    bad jobs are logged and dropped. A flusher that dies anyway is
+    restarted. Queued jobs are answered from memory until written, and
+    stop() flushes the queue.
+    """
+
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        on_dropped: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
+    ):
+        """
+        Initialize the job index.
+
+        Args:
+            db: MongoDB database instance
+            ttl_seconds: Cache lifetime of a completed job (default from settings)
+            max_entries: Maximum cached jobs (default from settings)
+            on_dropped: Called with each queued job that could not be written
+                (e.g. to release references the job document would hold)
+        """
+        self.collection = db.generation_jobs
+        self._ttl = ttl_seconds if ttl_seconds is not None else settings.JOB_CACHE_TTL_SECONDS
+        self._max_entries = max_entries or settings.JOB_CACHE_MAX_ENTRIES
+        self._on_dropped = on_dropped
+        self._cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        # Write-behind state (event loop only)
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._batches = 0
+        self._written = 0
+        self._retries = 0
+        self._dropped = 0
+        self._flusher_restarts = 0
+
+    def start(self) -> None:
+        """Start write-behind persistence on the running event loop."""
+        if self._flusher is None:
+            self._queue = asyncio.Queue(maxsize=settings.JOB_WRITE_QUEUE_MAX)
+            self._start_flusher()
+            logger.info("Job write-behind started")
+
+    def _start_flusher(self) -> None:
+        """Run the flusher task, restarting it if it ever exits."""
+        self._flusher = asyncio.create_task(self._flush_forever())
+        self._flusher.add_done_callback(self._flusher_exited)
+
+    def _flusher_exited(self, task: asyncio.Task) -> None:
+        """Restart a flusher that stopped other than by stop()."""
+        if task.cancelled() or self._flusher is not task:
+            return
+        logger.error("Job write-behind flusher exited, restarting it", exc_info=task.exception())
+        self._flusher_restarts += 1
+        self._start_flusher()
+
+    async def stop(self) -> None:
+        """Write every queued job, then stop the flusher."""
+        if self._flusher is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=settings.JOB_WRITE_SHUTDOWN_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.error(f"Job write-behind stopped with {len(self._pending)} jobs not persisted")
+        self._flusher.cancel()
+        try:
+            await self._flusher
+        except asyncio.CancelledError:
+            pass
+        self._flusher = None
+
+    async def record(self, job: Dict[str, Any]) -> None:
+        """
+        Persist a job document and cache it when completed.
+
+        With write-behind started the job is queued and this returns as
+        soon as there is room in the queue; otherwise it is inserted now.
+
+        Args:
+            job: Job document (must contain job_id)
+        """
+        # insert_one/insert_many add _id to the document; cache only the projected fields
+        projected = {key: job[key] for key, keep in JOB_PROJECTION.items() if keep and key in job}
+        if self._flusher is None:
+            await self.collection.insert_one(job)
+        else:
+            self._pending[job["job_id"]] = projected
+            try:
+                await self._queue.put(job)
+            except BaseException:
+                # Cancelled while waiting for room: the job was never queued
+                self._pending.pop(job["job_id"], None)
+                raise
+        self._remember(projected)
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a job.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Job fields in JOB_PROJECTION, or None if there is no such job
+        """
+        pending = self._pending.get(job_id)
+        if pending is not None:
+            return pending
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._cache.get(job_id)
+            if entry is not None and entry[0] > now:
+                self._cache.move_to_end(job_id)
+                self._hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._cache[job_id]
+            self._misses += 1
+
+        job = await self.collection.find_one({"job_id": job_id}, JOB_PROJECTION)
+        if job is not None:
+            self._remember(job)
+        return job
+
+    async def _flush_forever(self) -> None:
+        """Write queued jobs in batches until cancelled."""
+        while True:
+            batch = [await self._queue.get()]
+            # Let a burst accumulate into one insert_many
+            deadline = time.monotonic() + settings.JOB_WRITE_FLUSH_INTERVAL_SECONDS
+            while len(batch) < settings.JOB_WRITE_BATCH:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._write(batch)
+            except Exception as e:
+                logger.error(f"Job write-behind: batch of {len(batch)} failed ({e!r}), writing jobs one by one")
+                await self._write_each(batch)
+            finally:
+                for job in batch:
+                    self._pending.pop(job["job_id"], None)
+                    self._queue.task_done()
+
+    async def _write_each(self, batch: List[Dict[str, Any]]) -> None:
+        """Write jobs separately, dropping the ones that cannot be written."""
+        for job in batch:
+            try:
+                await self._write([job])
+            except Exception as e:
+                logger.error(f"Job write-behind: dropping job {job['job_id']}: {e!r}")
+                await self._drop([job])
+
+    async def _drop(self, jobs: List[Dict[str, Any]]) -> None:
+        """Count jobs given up on and hand them to on_dropped."""
+        self._dropped += len(jobs)
+        if self._on_dropped is None:
+            return
+        for job in jobs:
+            try:
+                await self._on_dropped(job)
+            except Exception as e:
+                logger.error(f"Job write-behind: cleanup of dropped job {job['job_id']} failed: {e}")
+
+    async def _write(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        Insert a batch, retrying with capped exponential backoff.
+
+        Connection and server errors are retried until they succeed.
+        Documents the server rejects (other than as duplicates of an earlier
+        attempt) are retried JOB_WRITE_REJECT_ATTEMPTS times, then dropped.
+        """
+        delay = 0.5
+        rejected_attempts = 0
+        while batch:
+            try:
+                await self.collection.insert_many(batch, ordered=False)
+                self._batches += 1
+                self._written += len(batch)
+                return
+            except BulkWriteError as e:
+                # Duplicates were written by an earlier attempt; retry the rest
+                failed = {
+                    error["index"] for error in e.details.get("writeErrors", [])
+                    if error.get("code") != 11000
+                }
+                self._written += len(batch) - len(failed)
+                batch = [job for index, job in enumerate(batch) if index in failed]
+                if not batch:
+                    return
+                rejected_attempts += 1
+                if rejected_attempts >= settings.JOB_WRITE_REJECT_ATTEMPTS:
+                    logger.error(f"Job write-behind: dropping rejected jobs "
+                                 f"{[job['job_id'] for job in batch]}: {e.details.get('writeErrors')}")
+                    await self._drop(batch)
+                    return
+                logger.warning(f"Job write-behind: {len(batch)} jobs failed, retrying in {delay:.1f}s")
+            except PyMongoError as e:
+                logger.warning(f"Job write-behind: batch of {len(batch)} failed ({e}), retrying in {delay:.1f}s")
+            self._retries += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, settings.JOB_WRITE_RETRY_MAX_DELAY_SECONDS)
+
+    def _remember(self, job: Dict[str, Any]) -> None:
+        """Cache a completed job, evicting the least recently used past the limit."""
+        if job.get("status") != "completed" or self._ttl <= 0:
+            return
+        with self._lock:
+            self._cache[job["job_id"]] = (time.monotonic() + self._ttl, job)
+            self._cache.move_to_end(job["job_id"])
+            while len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get cache metrics."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._cache),
+                "max_entries": self._max_entries,
+                "ttl_seconds": self._ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+                "write_behind": self._flusher is not None,
+                "flusher_running": self._flusher is not None and not self._flusher.done(),
+                "flusher_restarts": self._flusher_restarts,
+                "pending_writes": len(self._pending),
+                "batches_written": self._batches,
+                "jobs_written": self._written,
+                "write_retries": self._retries,
+                "jobs_dropped": self._dropped
+            }
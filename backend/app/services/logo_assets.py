@@ -0,0 +1,262 @@
+"""
+Logo Asset Service.
+Content-addressed logo storage: each distinct upload is normalized once and
+kept as a single GridFS object, shared by every job that uses it.
+"""
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from io import BytesIO
+from typing import Any, Dict, Optional
+
+import cairosvg
+from PIL import Image
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from app.config import settings
+from app.services.gridfs_storage import GridFSStorage
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LogoAsset:
+    """
+    A normalized logo.
+
+    Attributes:
+        sha256: SHA-256 hex digest of the original upload bytes
+        data: Normalized image bytes, ready for the PDF header
+        content_type: MIME type of data
+        file_id: GridFS file ID in the logos bucket
+    """
+    sha256: str
+    data: bytes
+    content_type: str
+    file_id: str
+
+
+def normalize_logo(content: bytes, filename: str) -> tuple:
+    """
+    Normalize an uploaded logo for the PDF headers.
+
+    SVGs are rasterized and raster images are scaled down (aspect ratio
+    kept) to fit LOGO_MAX_WIDTH_PX x LOGO_MAX_HEIGHT_PX, the largest
+    header logo box (2 x 1 inch in invoices) at print resolution.
+    Everything is re-encoded as PNG, keeping transparency.
+
+    Args:
+        content: Uploaded bytes
+        filename: Original filename (used to detect SVG)
+
+    Returns:
+        Tuple of (image bytes, content type). Unreadable uploads are
+        returned unchanged, as before normalization existed.
+    """
+    box = (settings.LOGO_MAX_WIDTH_PX, settings.LOGO_MAX_HEIGHT_PX)
+    try:
+        if filename.lower().endswith(".svg"):
+            return cairosvg.svg2png(
+                bytestring=content, output_width=box[0], output_height=box[1]
+            ), "image/png"
+
+        with Image.open(BytesIO(content)) as img:
+            img.load()
+            if img.mode not in ("RGB", "RGBA"):
+                has_alpha = "A" in img.mode or "transparency" in img.info
+                img = img.convert("RGBA" if has_alpha else "RGB")
+            img.thumbnail(box, Image.Resampling.LANCZOS)
+
+            output = BytesIO()
+            img.save(output, format="PNG", optimize=True)
+            return output.getvalue(), "image/png"
+    except Exception as e:
+        logger.warning(f"Failed to normalize logo {filename}, using it as uploaded: {e}")
+        return content, "application/octet-stream"
+
+
+class LogoAssetStore:
+    """
+    Deduplicated logo storage keyed by the SHA-256 of the upload.
+
+    A logo_assets document per hash names the GridFS file holding the
+    normalized image and counts the jobs referencing it. Uploads already
+    seen skip normalization and upload: recent ones are served from an
+    in-process LRU cache, the rest with one lookup plus one GridFS read.
+    """
+
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        gridfs: GridFSStorage,
+        max_entries: Optional[int] = None
+    ):
+        """
+        Initialize the logo asset store.
+
+        Args:
+            db: MongoDB database instance
+            gridfs: GridFS storage holding the logos bucket
+            max_entries: Maximum logos cached in memory (default from settings)
+        """
+        self.collection = db.logo_assets
+        self.gridfs = gridfs
+        self._max_entries = max_entries or settings.LOGO_CACHE_MAX_ENTRIES
+        self._cache: "OrderedDict[str, LogoAsset]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._normalized = 0
+
+    async def acquire(self, content: bytes, filename: str) -> LogoAsset:
+        """
+        Get the normalized logo for an upload and add a reference to it.
+
+        Args:
+            content: Uploaded bytes
+            filename: Original filename
+
+        Returns:
+            The shared logo asset
+        """
+        digest = hashlib.sha256(content).hexdigest()
+
+        asset = self._cached(digest)
+        if asset is not None:
+            if await self._add_reference(digest) is not None:
+                return asset
+            # The asset was released and deleted since it was cached
+            self._forget(digest)
+
+        record = await self._add_reference(digest)
+        if record is not None:
+            data = await self.gridfs.get_logo(record["file_id"])
+            if data is not None:
+                asset = LogoAsset(digest, data, record["content_type"], record["file_id"])
+                self._remember(asset)
+                return asset
+
+        data, content_type = await asyncio.to_thread(normalize_logo, content, filename)
+        with self._lock:
+            self._normalized += 1
+        if record is not None:
+            # The record's GridFS object is gone: store it again, keep the count
+            asset = await self._replace(digest, data, content_type, filename)
+        else:
+            asset = await self._store(digest, data, content_type, filename)
+        self._remember(asset)
+        return asset
+
+    async def release(self, digest: str) -> None:
+        """
+        Drop a reference; the last one deletes the GridFS object.
+
+        Args:
+            digest: SHA-256 of the logo upload (LogoAsset.sha256)
+        """
+        record = await self.collection.find_one_and_update(
+            {"_id": digest, "refcount": {"$gt": 0}},
+            {"$inc": {"refcount": -1}},
+            return_document=ReturnDocument.AFTER
+        )
+        if record is None or record["refcount"] > 0:
+            return
+
+        deleted = await self.collection.delete_one({"_id": digest, "refcount": 0})
+        if deleted.deleted_count:
+            self._forget(digest)
+            await self.gridfs.delete_file(record["file_id"], bucket="logos")
+            logger.info(f"Deleted unreferenced logo asset {digest[:12]}")
+
+    async def _add_reference(self, digest: str) -> Optional[Dict[str, Any]]:
+        """Increment a stored asset's refcount; None if the hash is unknown."""
+        return await self.collection.find_one_and_update(
+            {"_id": digest},
+            {"$inc": {"refcount": 1}, "$set": {"last_used_at": datetime.utcnow()}},
+            projection={"file_id": 1, "content_type": 1}
+        )
+
+    async def _upload(self, digest: str, data: bytes, content_type: str, filename: str) -> str:
+        """Upload a normalized logo to the logos bucket."""
+        return await self.gridfs.store_logo(
+            file_data=data,
+            filename=filename,
+            content_type=content_type,
+            metadata={"sha256": digest}
+        )
+
+    async def _store(self, digest: str, data: bytes, content_type: str, filename: str) -> LogoAsset:
+        """Upload a new logo and create its asset record with one reference."""
+        file_id = await self._upload(digest, data, content_type, filename)
+        now = datetime.utcnow()
+        try:
+            await self.collection.insert_one({
+                "_id": digest,
+                "file_id": file_id,
+                "content_type": content_type,
+                "length": len(data),
+                "original_filename": filename,
+                "refcount": 1,
+                "created_at": now,
+                "last_used_at": now
+            })
+            return LogoAsset(digest, data, content_type, file_id)
+        except DuplicateKeyError:
+            # A concurrent request stored the same logo first: use its copy
+            await self.gridfs.delete_file(file_id, bucket="logos")
+
+        record = await self._add_reference(digest)
+        return LogoAsset(digest, data, record["content_type"], record["file_id"])
+
+    async def _replace(self, digest: str, data: bytes, content_type: str, filename: str) -> LogoAsset:
+        """Upload a logo again and point the existing asset record at it."""
+        file_id = await self._upload(digest, data, content_type, filename)
+        await self.collection.update_one(
+            {"_id": digest},
+            {"$set": {"file_id": file_id, "content_type": content_type, "length": len(data)}}
+        )
+        logger.warning(f"Logo asset {digest[:12]} was missing from GridFS and has been stored again")
+        return LogoAsset(digest, data, content_type, file_id)
+
+    def _cached(self, digest: str) -> Optional[LogoAsset]:
+        """Look up the in-process cache."""
+        with self._lock:
+            asset = self._cache.get(digest)
+            if asset is None:
+                self._misses += 1
+                return None
+            self._cache.move_to_end(digest)
+            self._hits += 1
+            return asset
+
+    def _remember(self, asset: LogoAsset) -> None:
+        """Cache an asset, evicting the least recently used past the limit."""
+        with self._lock:
+            self._cache[asset.sha256] = asset
+            self._cache.move_to_end(asset.sha256)
+            while len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
+
+    def _forget(self, digest: str) -> None:
+        """Drop an asset from the cache."""
+        with self._lock:
+            self._cache.pop(digest, None)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get cache metrics."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._cache),
+                "max_entries": self._max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+                "normalized": self._normalized
+            }
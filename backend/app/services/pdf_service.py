@@ -5,7 +5,7 @@ import os
 import logging
 from io import BytesIO
 from pathlib import Path
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, Optional, Union, List, BinaryIO
 from datetime import datetime
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib import colors
@@ -16,56 +16,147 @@ from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_LEFT
 from reportlab.lib.utils import ImageReader
 from PIL import Image as PILImage
 
+from app.infrastructure.document_renderers.style_registry import get_style_registry
+
 logger = logging.getLogger(__name__)
 
+
+def _build_invoice_styles() -> Dict[str, ParagraphStyle]:
+    """Sample stylesheet plus custom invoice paragraph styles"""
+    base = getSampleStyleSheet()
+    styles = dict(base.byName)
+
+    # Title style
+    styles['InvoiceTitle'] = ParagraphStyle(
+        name='InvoiceTitle',
+        parent=base['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#2c3e50'),
+        alignment=TA_CENTER,
+        spaceAfter=30
+    )
+
+    # Company name style
+    styles['CompanyName'] = ParagraphStyle(
+        name='CompanyName',
+        parent=base['Normal'],
+        fontSize=14,
+        textColor=colors.HexColor('#34495e'),
+        alignment=TA_LEFT,
+        leading=18,
+        fontName='Helvetica-Bold'
+    )
+
+    # Address style
+    styles['Address'] = ParagraphStyle(
+        name='Address',
+        parent=base['Normal'],
+        fontSize=10,
+        textColor=colors.HexColor('#7f8c8d'),
+        alignment=TA_LEFT,
+        leading=14
+    )
+
+    # Invoice details style
+    styles['InvoiceDetails'] = ParagraphStyle(
+        name='InvoiceDetails',
+        parent=base['Normal'],
+        fontSize=11,
+        alignment=TA_RIGHT
+    )
+
+    return styles
+
+
+def _build_formal_styles() -> Dict[str, ParagraphStyle]:
+    """Paragraph styles for formal documents"""
+    base = getSampleStyleSheet()
+    styles = {}
+
+    # Document title style
+    styles['FormalTitle'] = ParagraphStyle(
+        name='FormalTitle',
+        parent=base['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#1a1a2e'),
+        alignment=TA_CENTER,
+        spaceAfter=20,
+        spaceBefore=10,
+        fontName='Helvetica-Bold'
+    )
+
+    # Section heading style
+    styles['FormalHeading'] = ParagraphStyle(
+        name='FormalHeading',
+        parent=base['Heading2'],
+        fontSize=14,
+        textColor=colors.HexColor('#2c3e50'),
+        spaceBefore=16,
+        spaceAfter=8,
+        fontName='Helvetica-Bold'
+    )
+
+    # Body text style
+    styles['FormalBody'] = ParagraphStyle(
+        name='FormalBody',
+        parent=base['Normal'],
+        fontSize=11,
+        textColor=colors.HexColor('#333333'),
+        alignment=TA_LEFT,
+        spaceBefore=6,
+        spaceAfter=6,
+        leading=16,
+        firstLineIndent=0
+    )
+
+    # Indented paragraph style (for sub-points)
+    styles['FormalIndented'] = ParagraphStyle(
+        name='FormalIndented',
+        parent=base['Normal'],
+        fontSize=11,
+        textColor=colors.HexColor('#333333'),
+        leftIndent=24,
+        spaceBefore=4,
+        spaceAfter=4,
+        leading=15
+    )
+
+    # Double indented style
+    styles['FormalDoubleIndent'] = ParagraphStyle(
+        name='FormalDoubleIndent',
+        parent=base['Normal'],
+        fontSize=11,
+        textColor=colors.HexColor('#333333'),
+        leftIndent=48,
+        spaceBefore=3,
+        spaceAfter=3,
+        leading=14
+    )
+
+    # Footer/date style
+    styles['FormalFooter'] = ParagraphStyle(
+        name='FormalFooter',
+        parent=base['Normal'],
+        fontSize=9,
+        textColor=colors.HexColor('#666666'),
+        alignment=TA_CENTER
+    )
+
+    return styles
+
+
+get_style_registry().register("invoice", _build_invoice_styles)
+get_style_registry().register("formal", _build_formal_styles)
+
 class PDFService:
     """Service for generating PDF documents"""
 
     def __init__(self):
         """Initialize PDF service"""
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles"""
-        # Title style
-        self.styles.add(ParagraphStyle(
-            name='InvoiceTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#2c3e50'),
-            alignment=TA_CENTER,
-            spaceAfter=30
-        ))
-
-        # Company name style
-        self.styles.add(ParagraphStyle(
-            name='CompanyName',
-            parent=self.styles['Normal'],
-            fontSize=14,
-            textColor=colors.HexColor('#34495e'),
-            alignment=TA_LEFT,
-            leading=18,
-            fontName='Helvetica-Bold'
-        ))
-
-        # Address style
-        self.styles.add(ParagraphStyle(
-            name='Address',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            textColor=colors.HexColor('#7f8c8d'),
-            alignment=TA_LEFT,
-            leading=14
-        ))
-
-        # Invoice details style
-        self.styles.add(ParagraphStyle(
-            name='InvoiceDetails',
-            parent=self.styles['Normal'],
-            fontSize=11,
-            alignment=TA_RIGHT
-        ))
+        # Compiled once per process and shared read-only between instances
+        registry = get_style_registry()
+        self.styles = registry.get("invoice")
+        self._formal_styles = registry.get("formal")
 
     async def generate_invoice_pdf(
         self,
@@ -128,6 +219,7 @@ class PDFService:
         """
         Generate a professional invoice PDF and return as bytes.
         This method stores everything in memory, no filesystem access needed.
+        Prefer write_invoice_pdf with a streaming sink for storage uploads.
 
         Args:
             invoice_data: Invoice data dictionary
@@ -136,13 +228,31 @@ class PDFService:
         Returns:
             PDF document as bytes
         """
-        try:
-            # Create a BytesIO buffer for the PDF
-            buffer = BytesIO()
+        buffer = BytesIO()
+        self.write_invoice_pdf(buffer, invoice_data, logo_bytes)
+        return buffer.getvalue()
 
+    def write_invoice_pdf(
+        self,
+        output: BinaryIO,
+        invoice_data: Dict[str, Any],
+        logo_bytes: Optional[bytes] = None
+    ) -> None:
+        """
+        Generate a professional invoice PDF into a file object.
+
+        Synchronous: run it in a worker thread (e.g. through
+        GridFSStorage.store_pdf_stream) to keep the event loop free.
+
+        Args:
+            output: Writable binary file object receiving the PDF
+            invoice_data: Invoice data dictionary
+            logo_bytes: Optional logo image as bytes
+        """
+        try:
             # Create the PDF document
             doc = SimpleDocTemplate(
-                buffer,
+                output,
                 pagesize=letter,
                 rightMargin=72,
                 leftMargin=72,
@@ -174,12 +284,7 @@ class PDFService:
             # Build the PDF
             doc.build(story)
 
-            # Get the PDF bytes
-            pdf_bytes = buffer.getvalue()
-            buffer.close()
-
-            logger.info(f"Invoice PDF generated successfully ({len(pdf_bytes)} bytes)")
-            return pdf_bytes
+            logger.info("Invoice PDF generated successfully")
 
         except Exception as e:
             logger.error(f"Failed to generate PDF: {e}")
@@ -446,83 +551,6 @@ class PDFService:
 
     # ========== FORMAL DOCUMENT GENERATION ==========
 
-    def _setup_formal_styles(self):
-        """Setup custom styles for formal documents"""
-        # Document title style
-        if 'FormalTitle' not in [s.name for s in self.styles.byName.values()]:
-            self.styles.add(ParagraphStyle(
-                name='FormalTitle',
-                parent=self.styles['Heading1'],
-                fontSize=24,
-                textColor=colors.HexColor('#1a1a2e'),
-                alignment=TA_CENTER,
-                spaceAfter=20,
-                spaceBefore=10,
-                fontName='Helvetica-Bold'
-            ))
-
-        # Section heading style
-        if 'FormalHeading' not in [s.name for s in self.styles.byName.values()]:
-            self.styles.add(ParagraphStyle(
-                name='FormalHeading',
-                parent=self.styles['Heading2'],
-                fontSize=14,
-                textColor=colors.HexColor('#2c3e50'),
-                spaceBefore=16,
-                spaceAfter=8,
-                fontName='Helvetica-Bold'
-            ))
-
-        # Body text style
-        if 'FormalBody' not in [s.name for s in self.styles.byName.values()]:
-            self.styles.add(ParagraphStyle(
-                name='FormalBody',
-                parent=self.styles['Normal'],
-                fontSize=11,
-                textColor=colors.HexColor('#333333'),
-                alignment=TA_LEFT,
-                spaceBefore=6,
-                spaceAfter=6,
-                leading=16,
-                firstLineIndent=0
-            ))
-
-        # Indented paragraph style (for sub-points)
-        if 'FormalIndented' not in [s.name for s in self.styles.byName.values()]:
-            self.styles.add(ParagraphStyle(
-                name='FormalIndented',
-                parent=self.styles['Normal'],
-                fontSize=11,
-                textColor=colors.HexColor('#333333'),
-                leftIndent=24,
-                spaceBefore=4,
-                spaceAfter=4,
-                leading=15
-            ))
-
-        # Double indented style
-        if 'FormalDoubleIndent' not in [s.name for s in self.styles.byName.values()]:
-            self.styles.add(ParagraphStyle(
-                name='FormalDoubleIndent',
-                parent=self.styles['Normal'],
-                fontSize=11,
-                textColor=colors.HexColor('#333333'),
-                leftIndent=48,
-                spaceBefore=3,
-                spaceAfter=3,
-                leading=14
-            ))
-
-        # Footer/date style
-        if 'FormalFooter' not in [s.name for s in self.styles.byName.values()]:
-            self.styles.add(ParagraphStyle(
-                name='FormalFooter',
-                parent=self.styles['Normal'],
-                fontSize=9,
-                textColor=colors.HexColor('#666666'),
-                alignment=TA_CENTER
-            ))
-
     async def generate_formal_document_pdf_bytes(
         self,
         document_data: Dict[str, Any],
@@ -534,6 +562,7 @@ class PDFService:
     ) -> bytes:
         """
         Generate a formal document PDF and return as bytes.
+        Prefer write_formal_document_pdf with a streaming sink for storage uploads.
 
         Args:
             document_data: Document metadata (title, author, date, etc.)
@@ -546,16 +575,41 @@ class PDFService:
         Returns:
             PDF document as bytes
         """
-        try:
-            # Setup formal document styles
-            self._setup_formal_styles()
+        buffer = BytesIO()
+        self.write_formal_document_pdf(
+            buffer, document_data, content, logo_bytes, color_scheme, use_watermark, edge_decorations
+        )
+        return buffer.getvalue()
+
+    def write_formal_document_pdf(
+        self,
+        output: BinaryIO,
+        document_data: Dict[str, Any],
+        content: str,
+        logo_bytes: Optional[bytes] = None,
+        color_scheme: Optional[List[str]] = None,
+        use_watermark: bool = False,
+        edge_decorations: bool = True
+    ) -> None:
+        """
+        Generate a formal document PDF into a file object.
 
-            # Create a BytesIO buffer for the PDF
-            buffer = BytesIO()
+        Synchronous: run it in a worker thread (e.g. through
+        GridFSStorage.store_pdf_stream) to keep the event loop free.
 
+        Args:
+            output: Writable binary file object receiving the PDF
+            document_data: Document metadata (title, author, date, etc.)
+            content: The generated text content
+            logo_bytes: Optional logo image as bytes
+            color_scheme: List of hex color codes for decoration
+            use_watermark: Whether to add watermark (requires logo_bytes)
+            edge_decorations: Whether to add decorative lines on edges
+        """
+        try:
             # Create the PDF document
             doc = SimpleDocTemplate(
-                buffer,
+                output,
                 pagesize=letter,
                 rightMargin=72,
                 leftMargin=72,
@@ -589,12 +643,7 @@ class PDFService:
             else:
                 doc.build(story)
 
-            # Get the PDF bytes
-            pdf_bytes = buffer.getvalue()
-            buffer.close()
-
-            logger.info(f"Formal document PDF generated successfully ({len(pdf_bytes)} bytes)")
-            return pdf_bytes
+            logger.info("Formal document PDF generated successfully")
 
         except Exception as e:
             logger.error(f"Failed to generate formal document PDF: {e}")
@@ -624,7 +673,7 @@ class PDFService:
         title = document_data.get('title', 'Formal Document')
         # Escape HTML special characters
         title = title.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-        title_para = Paragraph(title, self.styles['FormalTitle'])
+        title_para = Paragraph(title, self._formal_styles['FormalTitle'])
         elements.append(title_para)
         elements.append(Spacer(1, 0.2 * inch))
 
@@ -638,7 +687,7 @@ class PDFService:
                 meta_text.append(f"Author: {author}")
             if date:
                 meta_text.append(f"Date: {date}")
-            meta_para = Paragraph(" | ".join(meta_text), self.styles['FormalFooter'])
+            meta_para = Paragraph(" | ".join(meta_text), self._formal_styles['FormalFooter'])
             elements.append(meta_para)
 
         elements.append(Spacer(1, 0.4 * inch))
@@ -702,13 +751,13 @@ class PDFService:
 
             # Select appropriate style
             if is_heading:
-                style = self.styles['FormalHeading']
+                style = self._formal_styles['FormalHeading']
             elif indent_level == 2:
-                style = self.styles['FormalDoubleIndent']
+                style = self._formal_styles['FormalDoubleIndent']
             elif indent_level == 1:
-                style = self.styles['FormalIndented']
+                style = self._formal_styles['FormalIndented']
             else:
-                style = self.styles['FormalBody']
+                style = self._formal_styles['FormalBody']
 
             try:
                 p = Paragraph(para, style)
@@ -716,7 +765,7 @@ class PDFService:
             except Exception as e:
                 # If paragraph fails, try with plain text
                 logger.warning(f"Paragraph formatting failed: {e}")
-                p = Paragraph(para.replace('<', '').replace('>', ''), self.styles['FormalBody'])
+                p = Paragraph(para.replace('<', '').replace('>', ''), self._formal_styles['FormalBody'])
                 elements.append(p)
 
         return elements
@@ -739,7 +788,7 @@ class PDFService:
         # End note
         elements.append(Spacer(1, 0.2 * inch))
         footer_text = "— End of Document —"
-        footer_para = Paragraph(footer_text, self.styles['FormalFooter'])
+        footer_para = Paragraph(footer_text, self._formal_styles['FormalFooter'])
         elements.append(footer_para)
 
         return elements
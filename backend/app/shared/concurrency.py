@@ -0,0 +1,59 @@
+"""Concurrency helpers shared by services and use cases"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Sequence
+
+# Provider name -> semaphore shared by every request in the process
+_provider_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+
+async def bounded_gather(
+    factories: Sequence[Callable[[], Awaitable[Any]]],
+    limit: int,
+    return_exceptions: bool = False
+) -> List[Any]:
+    """
+    Run coroutine factories concurrently with at most `limit` in flight.
+
+    Results are returned in the same order as the factories, regardless
+    of completion order.
+
+    Args:
+        factories: Zero-argument callables returning awaitables
+        limit: Maximum number of concurrently running awaitables
+        return_exceptions: Return exceptions in place of results instead of raising
+
+    Returns:
+        List of results ordered like the input factories
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(factory: Callable[[], Awaitable[Any]]) -> Any:
+        async with semaphore:
+            return await factory()
+
+    return await asyncio.gather(
+        *(run(factory) for factory in factories),
+        return_exceptions=return_exceptions
+    )
+
+
+def provider_semaphore(name: str, limit: int) -> asyncio.Semaphore:
+    """
+    Get the process-wide semaphore limiting concurrent calls to a provider.
+
+    The limit is fixed when the semaphore is first created, so every caller
+    for the same provider shares one budget.
+
+    Args:
+        name: Provider name
+        limit: Maximum number of concurrent calls
+
+    Returns:
+        Shared asyncio.Semaphore for the provider
+    """
+    semaphore = _provider_semaphores.get(name)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max(1, limit))
+        _provider_semaphores[name] = semaphore
+    return semaphore
@@ -0,0 +1,86 @@
+"""HTTP byte-range and conditional request helpers for file downloads"""
+
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Optional, Tuple
+
+
+class RangeNotSatisfiable(ValueError):
+    """The requested byte range lies outside the resource"""
+
+
+def _is_digits(value: str) -> bool:
+    """ASCII digits only (str.isdigit also accepts e.g. superscripts, which int() rejects)."""
+    return value.isascii() and value.isdigit()
+
+
+def parse_byte_range(header: Optional[str], length: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range Range header.
+
+    Malformed headers and multi-range requests are ignored (the whole
+    resource is served, as RFC 9110 allows).
+
+    Args:
+        header: Range header value, e.g. "bytes=0-1023", "bytes=500-", "bytes=-500"
+        length: Size of the resource in bytes
+
+    Returns:
+        Inclusive (start, end) byte positions, or None to serve the whole resource
+
+    Raises:
+        RangeNotSatisfiable: If the range starts past the end of the resource
+    """
+    if not header:
+        return None
+
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    first, sep, last = spec.strip().partition("-")
+    first, last = first.strip(), last.strip()
+    if not sep or not (_is_digits(first) or (not first and _is_digits(last))):
+        return None
+    if last and not _is_digits(last):
+        return None
+
+    if not first:
+        # Suffix range: the last N bytes
+        suffix = int(last)
+        if suffix == 0 or length == 0:
+            raise RangeNotSatisfiable(f"bytes=-{suffix} of {length}")
+        return max(0, length - suffix), length - 1
+
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= length:
+        raise RangeNotSatisfiable(f"bytes={start}- of {length}")
+    end = int(last) if last else length - 1
+    return start, min(end, length - 1)
+
+
+def http_date(value: datetime) -> str:
+    """Format a datetime as an HTTP date (naive values are taken as UTC)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def if_range_matches(if_range: Optional[str], etag: str, last_modified: str) -> bool:
+    """
+    Check an If-Range precondition.
+
+    Args:
+        if_range: If-Range header value (None when absent)
+        etag: Current strong ETag, quoted
+        last_modified: Current Last-Modified HTTP date
+
+    Returns:
+        True when a Range request may be honoured
+    """
+    if if_range is None:
+        return True
+    if_range = if_range.strip()
+    return if_range == etag or if_range == last_modified
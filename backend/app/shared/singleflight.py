@@ -0,0 +1,117 @@
+"""Request coalescing: concurrent identical calls share one execution"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from .logger import get_logger
+
+logger = get_logger("singleflight")
+
+
+class _Flight:
+    """One in-flight call and the number of callers waiting on it."""
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one execution.
+
+    The first caller for a key starts the call; callers arriving while it
+    is running wait for the same result (or exception). A caller that is
+    cancelled stops waiting without affecting the others; the shared call
+    itself is cancelled only once every waiter has gone.
+    """
+
+    def __init__(self, name: str = "default"):
+        """
+        Initialize the group.
+
+        Args:
+            name: Group name used in logs and metrics
+        """
+        self._name = name
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._calls = 0
+        self._executions = 0
+        self._coalesced = 0
+        self._abandoned = 0
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run the call for a key, or join the one already in flight.
+
+        Args:
+            key: Identity of the call (equal keys share one execution)
+            factory: Zero-argument callable starting the call
+
+        Returns:
+            Result of the shared call
+        """
+        self._calls += 1
+        flight = self._flights.get(key)
+        if flight is None:
+            self._executions += 1
+            flight = _Flight(asyncio.ensure_future(factory()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+        else:
+            self._coalesced += 1
+            logger.debug(f"Coalesced call in '{self._name}' ({flight.waiters} already waiting)")
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if not flight.task.done() and flight.waiters == 1:
+                self._abandoned += 1
+                flight.task.cancel()
+                # Callers arriving before the task finishes cancelling start afresh
+                self._forget(key, flight)
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        """Drop a finished flight so later calls start a fresh one."""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get coalescing metrics.
+
+        Returns:
+            Dictionary with call, execution and coalesced counts
+        """
+        return {
+            "name": self._name,
+            "calls": self._calls,
+            "executions": self._executions,
+            "coalesced": self._coalesced,
+            "abandoned": self._abandoned,
+            "in_flight": len(self._flights)
+        }
+
+
+# Group name -> process-wide group
+_groups: Dict[str, SingleFlight] = {}
+
+
+def get_singleflight(name: str) -> SingleFlight:
+    """
+    Get the process-wide coalescing group for a name.
+
+    Args:
+        name: Group name (e.g. "text", "image")
+
+    Returns:
+        Shared SingleFlight instance
+    """
+    group = _groups.get(name)
+    if group is None:
+        group = _groups[name] = SingleFlight(name)
+    return group
@@ -0,0 +1,172 @@
+"""Dependency-graph executor for multi-stage generation pipelines"""
+
+import time
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..domain.exceptions import GenerationException
+from .logger import get_logger
+
+logger = get_logger("stage_graph")
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    One step of a pipeline.
+
+    Attributes:
+        name: Unique stage name
+        run: Coroutine function receiving the results of its dependencies by name
+        depends_on: Names of stages that must finish first
+        timeout: Seconds the stage may run (None for no limit)
+        fallback: Factory for a substitute result; when set, failure or
+            timeout of this stage is not fatal
+    """
+    name: str
+    run: Callable[[Dict[str, Any]], Awaitable[Any]]
+    depends_on: Tuple[str, ...] = ()
+    timeout: Optional[float] = None
+    fallback: Optional[Callable[[], Any]] = None
+
+
+class _StageFailed(Exception):
+    """Internal wrapper for a fatal stage error."""
+
+    def __init__(self, stage: str, error: BaseException):
+        super().__init__(str(error))
+        self.stage = stage
+        self.error = error
+
+
+class StageGraph:
+    """
+    Runs stages as soon as their dependencies complete.
+
+    Independent stages run concurrently, so total latency is the longest
+    dependency chain rather than the sum of all stages. A fatal stage
+    error cancels every running sibling and aborts the run.
+    """
+
+    def __init__(self, stages: Sequence[Stage]):
+        """
+        Initialize the graph.
+
+        Args:
+            stages: Pipeline stages (dependencies must reference known stages)
+
+        Raises:
+            ValueError: If names are duplicated, dependencies are unknown,
+                or the graph contains a cycle
+        """
+        self._stages: Dict[str, Stage] = {}
+        for stage in stages:
+            if stage.name in self._stages:
+                raise ValueError(f"Duplicate stage name: {stage.name}")
+            self._stages[stage.name] = stage
+
+        for stage in stages:
+            unknown = [dep for dep in stage.depends_on if dep not in self._stages]
+            if unknown:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stages: {unknown}")
+
+        self._check_acyclic()
+        self.timings: Dict[str, Dict[str, Any]] = {}
+
+    async def run(
+        self,
+        on_stage_done: Optional[Callable[[str, Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute all stages.
+
+        Args:
+            on_stage_done: Called with the stage name and its timing record
+                whenever a stage finishes, fails or is cancelled
+
+        Returns:
+            Dictionary of stage name to result
+
+        Raises:
+            GenerationException: If a stage without fallback fails or times out
+        """
+        self.timings = {}
+        results: Dict[str, Any] = {}
+        pending: Dict[asyncio.Task, str] = {}
+        waiting = dict(self._stages)
+        run_started = time.perf_counter()
+
+        def record(name: str, status: str, started: float, error: Optional[str] = None) -> None:
+            timing = {
+                "status": status,
+                "started_at": round(started - run_started, 3),
+                "duration": round(time.perf_counter() - started, 3)
+            }
+            if error:
+                timing["error"] = error[:200]
+            self.timings[name] = timing
+            if on_stage_done:
+                on_stage_done(name, timing)
+
+        async def execute(stage: Stage) -> Any:
+            started = time.perf_counter()
+            inputs = {dep: results[dep] for dep in stage.depends_on}
+            try:
+                result = await asyncio.wait_for(stage.run(inputs), timeout=stage.timeout)
+            except asyncio.CancelledError:
+                record(stage.name, "cancelled", started)
+                raise
+            except Exception as e:
+                timed_out = isinstance(e, asyncio.TimeoutError)
+                error = f"timed out after {stage.timeout}s" if timed_out else str(e)
+                if stage.fallback is None:
+                    record(stage.name, "timeout" if timed_out else "failed", started, error)
+                    raise _StageFailed(stage.name, e) from e
+                logger.warning(f"Stage '{stage.name}' {error}, using fallback")
+                record(stage.name, "fallback", started, error)
+                return stage.fallback()
+            record(stage.name, "completed", started)
+            return result
+
+        def launch_ready() -> None:
+            for name, stage in list(waiting.items()):
+                if all(dep in results for dep in stage.depends_on):
+                    del waiting[name]
+                    pending[asyncio.create_task(execute(stage))] = name
+
+        launch_ready()
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending.keys(), return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = pending.pop(task)
+                    results[name] = task.result()
+                launch_ready()
+        except _StageFailed as e:
+            raise GenerationException(
+                f"Stage '{e.stage}' failed: {e.error or type(e.error).__name__}",
+                {"stage": e.stage, "timings": self.timings}
+            ) from e.error
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        return results
+
+    def _check_acyclic(self) -> None:
+        """Raise ValueError if the dependencies contain a cycle."""
+        resolved: List[str] = []
+        remaining = dict(self._stages)
+        while remaining:
+            ready = [
+                name for name, stage in remaining.items()
+                if all(dep in resolved for dep in stage.depends_on)
+            ]
+            if not ready:
+                raise ValueError(f"Stage dependency cycle among: {sorted(remaining)}")
+            for name in ready:
+                resolved.append(name)
+                del remaining[name]
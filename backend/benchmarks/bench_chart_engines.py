@@ -0,0 +1,129 @@
+"""
+Benchmark: matplotlib raster charts vs. ReportLab vector charts.
+
+Renders the same set of chart specs with MatplotlibEngine (PNG via the
+render pool) and ReportLabEngine (reportlab.graphics Drawings), then
+builds an infographic PDF from each set with InfographicPDFRenderer.
+Reports chart render time, PDF build time and PDF size per engine.
+
+The matplotlib chart cache is disabled for the run so every chart is
+actually rendered.
+
+Usage (from the backend directory):
+    python benchmarks/bench_chart_engines.py --charts 12 --rounds 3
+"""
+
+import os
+import sys
+import time
+import random
+import asyncio
+import argparse
+import tempfile
+import statistics
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.domain.value_objects.chart_spec import ChartSpec  # noqa: E402
+from app.infrastructure.visualization.chart_cache import ChartRenderCache  # noqa: E402
+from app.infrastructure.visualization.matplotlib_engine import MatplotlibEngine  # noqa: E402
+from app.infrastructure.visualization.reportlab_engine import ReportLabEngine  # noqa: E402
+from app.infrastructure.visualization.render_pool import start_render_pool, shutdown_render_pool  # noqa: E402
+from app.infrastructure.document_renderers.infographic_pdf_renderer import InfographicPDFRenderer  # noqa: E402
+
+COLORS = ("#1e40af", "#3730a3", "#7c3aed")
+
+
+def make_specs(count: int, seed: int = 7):
+    """Build a reproducible mix of all chart types."""
+    rng = random.Random(seed)
+    specs = []
+    for i in range(count):
+        kind = ("bar", "line", "pie", "gauge", "number")[i % 5]
+        title = f"Metric {i + 1}"
+        if kind == "bar":
+            data = {"values": {f"Item {j + 1}": rng.uniform(10, 500) for j in range(6)}}
+        elif kind == "line":
+            data = {"series": {f"Series {j + 1}": [rng.uniform(10, 100) for _ in range(8)] for j in range(2)}}
+        elif kind == "pie":
+            data = {"values": {f"Part {j + 1}": rng.uniform(5, 40) for j in range(4)}}
+        elif kind == "gauge":
+            data = {"value": rng.uniform(0, 100), "max_value": 100}
+        else:
+            data = {"value": rng.uniform(1_000, 2_000_000), "unit": "USD"}
+        specs.append(ChartSpec(kind, data, title, COLORS))
+    return specs
+
+
+def make_sections(count: int):
+    """One section per chart so every chart is placed."""
+    body = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 12
+    return [{"heading": f"Section {i + 1}", "content": body} for i in range(count)]
+
+
+async def run_engine(engine, specs, sections, output_dir: Path, rounds: int):
+    """Render all charts and build the PDF, returning timings and size."""
+    render_times, build_times, size = [], [], 0
+    renderer = InfographicPDFRenderer()
+
+    for n in range(rounds):
+        started = time.perf_counter()
+        charts = [await engine.render_asset(spec) for spec in specs]
+        render_times.append(time.perf_counter() - started)
+
+        output_path = output_dir / f"{type(engine).__name__}_{n}.pdf"
+        started = time.perf_counter()
+        await renderer.render(
+            title="Chart Engine Benchmark",
+            sections=sections,
+            charts=charts,
+            illustrations=[],
+            output_path=output_path,
+            include_cover=False
+        )
+        build_times.append(time.perf_counter() - started)
+        size = output_path.stat().st_size
+
+    return render_times, build_times, size
+
+
+def report(name: str, render_times, build_times, size: int, charts: int) -> None:
+    """Print one engine's results."""
+    render = statistics.median(render_times)
+    build = statistics.median(build_times)
+    print(f"{name:<12} render {render * 1000:8.1f} ms "
+          f"({render / charts * 1000:6.1f} ms/chart)   "
+          f"pdf build {build * 1000:8.1f} ms   "
+          f"pdf size {size / 1024:8.1f} KiB")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--charts", type=int, default=10, help="charts per document")
+    parser.add_argument("--rounds", type=int, default=3, help="documents per engine (median reported)")
+    args = parser.parse_args()
+
+    specs = make_specs(args.charts)
+    sections = make_sections(args.charts)
+
+    # Warm workers first so pool start-up is not counted
+    start_render_pool()
+    matplotlib_engine = MatplotlibEngine(cache=ChartRenderCache(memory_max_bytes=0))
+    reportlab_engine = ReportLabEngine()
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            output_dir = Path(tmp)
+            print(f"{args.charts} charts per document, {args.rounds} rounds\n")
+            for name, engine in (("matplotlib", matplotlib_engine), ("reportlab", reportlab_engine)):
+                render_times, build_times, size = await run_engine(
+                    engine, specs, sections, output_dir, args.rounds
+                )
+                report(name, render_times, build_times, size, args.charts)
+    finally:
+        shutdown_render_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
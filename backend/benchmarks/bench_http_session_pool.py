@@ -0,0 +1,134 @@
+"""
+Benchmark: fresh aiohttp session per call vs. the shared pooled session.
+
+Starts a local stand-in for the HuggingFace inference API and issues the
+same sequence of POST requests twice: once opening a new ClientSession
+per call (the old provider behaviour) and once through get_http_session().
+The stand-in counts distinct client connections so connection reuse is
+visible. Over plain local HTTP only the TCP handshake is saved; against
+api-inference.huggingface.co each avoided connection also skips a TLS
+handshake and a DNS lookup.
+
+Usage (from the backend directory):
+    python benchmarks/bench_http_session_pool.py --requests 200
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+
+import aiohttp
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.infrastructure.ai_providers.http_sessions import (  # noqa: E402
+    get_http_session,
+    close_http_sessions,
+    get_session_stats
+)
+
+PAYLOAD = {"inputs": "benchmark prompt", "parameters": {"max_new_tokens": 16}}
+
+
+class StandInServer:
+    """Tiny inference API stand-in that counts client connections."""
+
+    def __init__(self, delay: float):
+        self._delay = delay
+        self.peers = set()
+        self._runner = None
+        self.url = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.peers.add(request.transport.get_extra_info("peername"))
+        await request.read()
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        return web.json_response([{"generated_text": "ok"}])
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_post("/models/{model:.*}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/models/stand-in"
+
+    async def stop(self) -> None:
+        await self._runner.cleanup()
+
+
+async def call_fresh_session(url: str) -> None:
+    async with aiohttp.ClientSession() as session:
+        async with session.post(url, json=PAYLOAD) as response:
+            await response.json()
+
+
+async def call_pooled_session(url: str) -> None:
+    session = get_http_session("benchmark")
+    async with session.post(url, json=PAYLOAD) as response:
+        await response.json()
+
+
+async def run_case(name: str, call, server: StandInServer, requests: int, concurrency: int) -> dict:
+    server.peers.clear()
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed() -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await call(server.url)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(timed() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "name": name,
+        "connections": len(server.peers),
+        "mean_ms": statistics.mean(latencies) * 1000,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "total_s": elapsed
+    }
+
+
+async def main(requests: int, concurrency: int, delay: float) -> None:
+    server = StandInServer(delay)
+    await server.start()
+    try:
+        # Warm up both paths so imports and first-call costs are excluded
+        await call_fresh_session(server.url)
+        await call_pooled_session(server.url)
+
+        fresh = await run_case("fresh session per call", call_fresh_session, server, requests, concurrency)
+        pooled = await run_case("shared pooled session", call_pooled_session, server, requests, concurrency)
+        pool_stats = get_session_stats("benchmark")
+    finally:
+        await close_http_sessions()
+        await server.stop()
+
+    print(f"{requests} requests, concurrency {concurrency}, server delay {delay * 1000:.0f}ms")
+    print(f"{'case':<26}{'connections':>12}{'mean ms':>10}{'p50 ms':>10}{'total s':>10}")
+    for result in (fresh, pooled):
+        print(f"{result['name']:<26}{result['connections']:>12}"
+              f"{result['mean_ms']:>10.2f}{result['p50_ms']:>10.2f}{result['total_s']:>10.2f}")
+    print(f"latency saved per call: {fresh['mean_ms'] - pooled['mean_ms']:.2f}ms mean, "
+          f"{fresh['p50_ms'] - pooled['p50_ms']:.2f}ms p50")
+    print(f"pool: {pool_stats.get('benchmark')}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--delay", type=float, default=0.0, help="Server-side delay in seconds")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.delay))